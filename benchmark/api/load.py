@@ -0,0 +1,113 @@
+import asyncio
+import math
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+from src.shared.http.asgi_client import AsgiClient, Response
+
+# Builds and sends the i-th request of a scenario
+RequestFactory = Callable[[AsgiClient, int], Awaitable[Response]]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    send: RequestFactory
+
+
+@dataclass(frozen=True)
+class ScenarioResult:
+    name: str
+    requests: int
+    errors: int
+    concurrency: int
+    duration_s: float
+    requests_per_s: float
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+def percentile(sorted_values: list[float], rank: float) -> float:
+    """Nearest-rank percentile of already sorted values"""
+    if not sorted_values:
+        return 0.0
+
+    index = max(math.ceil(rank / 100 * len(sorted_values)) - 1, 0)
+
+    return sorted_values[index]
+
+
+def summarize(
+    name: str,
+    latencies_ms: list[float],
+    errors: int,
+    concurrency: int,
+    duration_s: float,
+) -> ScenarioResult:
+    ordered = sorted(latencies_ms)
+    requests = len(ordered)
+
+    return ScenarioResult(
+        name=name,
+        requests=requests,
+        errors=errors,
+        concurrency=concurrency,
+        duration_s=round(duration_s, 3),
+        requests_per_s=round(requests / duration_s, 2) if duration_s else 0.0,
+        mean_ms=round(sum(ordered) / requests, 3) if requests else 0.0,
+        p50_ms=round(percentile(ordered, 50), 3),
+        p95_ms=round(percentile(ordered, 95), 3),
+        p99_ms=round(percentile(ordered, 99), 3),
+        max_ms=round(ordered[-1], 3) if ordered else 0.0,
+    )
+
+
+async def run_scenario(
+    client: AsgiClient,
+    scenario: Scenario,
+    requests: int,
+    concurrency: int,
+    warmup: int = 0,
+    offset: int = 0,
+) -> ScenarioResult:
+    """Sends `requests` requests through `concurrency` workers and measures each one.
+
+    The first `warmup` requests are sent but not measured. Request numbers start
+    at `offset` so scenarios creating resources never repeat one across runs"""
+    for index in range(offset, offset + warmup):
+        await scenario.send(client, index)
+
+    next_index = offset + warmup
+    last_index = next_index + requests
+    latencies_ms = []
+    errors = 0
+
+    async def worker():
+        nonlocal next_index, errors
+
+        while next_index < last_index:
+            index = next_index
+            next_index += 1
+
+            started = time.perf_counter()
+            response = await scenario.send(client, index)
+            latencies_ms.append((time.perf_counter() - started) * 1000)
+
+            if response.status >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    duration_s = time.perf_counter() - started
+
+    return summarize(
+        name=scenario.name,
+        latencies_ms=latencies_ms,
+        errors=errors,
+        concurrency=concurrency,
+        duration_s=duration_s,
+    )
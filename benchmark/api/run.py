@@ -0,0 +1,173 @@
+"""Seeds the local database and measures the HTTP API latency and throughput.
+
+Usage: python -m benchmark.api.run --reset [--requests 500] [--concurrency 10]
+       [--compare benchmark/results/<previous>.json]
+
+It runs against the docker compose Postgres and Redis configured in the environment
+(.env). Results are stored as benchmark/results/<label>.json, the label defaulting
+to the current commit, so two commits can be compared with --compare.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from dataclasses import asdict
+from datetime import datetime
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from benchmark.api.load import ScenarioResult, run_scenario
+from benchmark.api.scenarios import build_scenarios
+from benchmark.api.seed import SeedVolumes, is_empty, reset, seed
+from benchmark.reports import RESULTS_DIR, current_commit
+from src.main import app
+from src.shared.db.pg_sqlalchemy.connection import DbSession, get_engine
+from src.shared.http.asgi_client import AsgiClient
+from src.shared.redis.connection_factory import get_connection
+
+COMPARED_METRICS = ["requests_per_s", "p50_ms", "p95_ms", "p99_ms"]
+
+
+async def prepare_data(volumes: SeedVolumes, must_reset: bool, skip_seed: bool):
+    await get_connection().ping()
+
+    if skip_seed:
+        return
+
+    get_engine()
+
+    async with DbSession() as session:
+        if must_reset:
+            await reset(session)
+        elif not await is_empty(session):
+            sys.exit(
+                "The database already has data. Run with --reset to truncate it "
+                "or with --skip-seed to benchmark against it as is"
+            )
+
+        await seed(session, volumes)
+
+
+async def benchmark(arguments: argparse.Namespace) -> list[ScenarioResult]:
+    volumes = SeedVolumes(
+        schools=arguments.schools,
+        students_per_school=arguments.students_per_school,
+        invoices_per_student=arguments.invoices_per_student,
+    )
+
+    await prepare_data(volumes, arguments.reset, arguments.skip_seed)
+
+    client = AsgiClient(app, root_path="/mattilda")
+    scenarios = [
+        scenario
+        for scenario in build_scenarios(volumes)
+        if not arguments.scenario or scenario.name in arguments.scenario
+    ]
+    results = []
+
+    async with app.router.lifespan_context(app):
+        for scenario in scenarios:
+            result = await run_scenario(
+                client=client,
+                scenario=scenario,
+                requests=arguments.requests,
+                concurrency=arguments.concurrency,
+                warmup=arguments.warmup,
+                offset=arguments.offset,
+            )
+            results.append(result)
+
+            print(
+                f"{result.name}: {result.requests_per_s} req/s, "
+                f"p50={result.p50_ms}ms p95={result.p95_ms}ms p99={result.p99_ms}ms, "
+                f"errors={result.errors}/{result.requests}",
+                flush=True,
+            )
+
+    return results
+
+
+def store(arguments: argparse.Namespace, results: list[ScenarioResult]) -> str:
+    commit = current_commit()
+    report = {
+        "label": arguments.label or commit,
+        "commit": commit,
+        "created_at": datetime.now().isoformat(),
+        "config": {
+            "schools": arguments.schools,
+            "students_per_school": arguments.students_per_school,
+            "invoices_per_student": arguments.invoices_per_student,
+            "requests": arguments.requests,
+            "concurrency": arguments.concurrency,
+            "warmup": arguments.warmup,
+        },
+        "scenarios": {result.name: asdict(result) for result in results},
+    }
+
+    os.makedirs(arguments.results_dir, exist_ok=True)
+    path = os.path.join(arguments.results_dir, f"{report['label']}.json")
+
+    with open(path, "w") as file:
+        json.dump(report, file, indent=2)
+
+    return path
+
+
+def compare(baseline_path: str, results: list[ScenarioResult]) -> None:
+    with open(baseline_path) as file:
+        baseline = json.load(file)
+
+    print(f"\nCompared with {baseline['label']} ({baseline['commit']}):")
+
+    for result in results:
+        previous = baseline["scenarios"].get(result.name)
+
+        if previous is None:
+            continue
+
+        changes = []
+
+        for metric in COMPARED_METRICS:
+            before, after = previous[metric], getattr(result, metric)
+            change = (after - before) / before * 100 if before else 0.0
+            changes.append(f"{metric} {before} -> {after} ({change:+.1f}%)")
+
+        print(f"{result.name}: {', '.join(changes)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the HTTP API")
+    parser.add_argument("--schools", type=int, default=50)
+    parser.add_argument("--students-per-school", type=int, default=200)
+    parser.add_argument("--invoices-per-student", type=int, default=12)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument(
+        "--offset",
+        type=int,
+        default=0,
+        help="First request number, to create new resources when reusing a seed",
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        help="Only run the named scenario, e.g. 'GET /students'. Repeatable",
+    )
+    parser.add_argument("--reset", action="store_true", help="Truncate the tables")
+    parser.add_argument("--skip-seed", action="store_true")
+    parser.add_argument("--label", help="Results file name, the commit by default")
+    parser.add_argument("--results-dir", default=RESULTS_DIR)
+    parser.add_argument("--compare", help="Results file to compare against")
+    arguments = parser.parse_args()
+
+    results = asyncio.run(benchmark(arguments))
+
+    print(f"\nResults stored at {store(arguments, results)}")
+
+    if arguments.compare:
+        compare(arguments.compare, results)
@@ -0,0 +1,59 @@
+from benchmark.api.load import Scenario
+from benchmark.api.seed import (
+    MONTHLY_FEE,
+    SeedVolumes,
+    month,
+    school_id,
+    school_of_student,
+    student_id,
+)
+from src.shared.http.asgi_client import AsgiClient, Response
+
+# Seeded invoices are due from 2000 on. The created ones use later, non overlapping
+# periods: one month per request round over every student or every school
+CREATED_INVOICES_YEAR = 2100
+GENERATED_INVOICES_YEAR = 2300
+
+
+def build_scenarios(volumes: SeedVolumes) -> list[Scenario]:
+    async def create_invoice(client: AsgiClient, index: int) -> Response:
+        student = index % volumes.students
+
+        return await client.request(
+            "POST",
+            "/invoices",
+            body={
+                "school_id": school_of_student(volumes, student),
+                "student_id": student_id(student),
+                "amount": str(MONTHLY_FEE),
+                "due_date": month(
+                    CREATED_INVOICES_YEAR, index // volumes.students
+                ).isoformat(),
+            },
+        )
+
+    async def generate_invoices(client: AsgiClient, index: int) -> Response:
+        period = month(GENERATED_INVOICES_YEAR, index // volumes.schools)
+
+        return await client.request(
+            "POST",
+            f"/schools/{school_id(index % volumes.schools)}/invoices/",
+            body={"period": period.isoformat()},
+        )
+
+    async def get_invoices(client: AsgiClient, index: int) -> Response:
+        return await client.request(
+            "GET",
+            "/invoices",
+            params={"school_id": school_id(index % volumes.schools)},
+        )
+
+    async def get_students(client: AsgiClient, index: int) -> Response:
+        return await client.request("GET", "/students", params={"limit": 20})
+
+    return [
+        Scenario(name="POST /invoices", send=create_invoice),
+        Scenario(name="POST /schools/{id}/invoices/", send=generate_invoices),
+        Scenario(name="GET /invoices", send=get_invoices),
+        Scenario(name="GET /students", send=get_students),
+    ]
@@ -0,0 +1,194 @@
+"""Deterministic seed of the benchmark database.
+
+Every id is derived from the row position, so the same volumes always produce the
+same data and the scenarios can address it without reading it back.
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Iterator
+
+from sqlalchemy import Table, func, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.invoice.domain.model import Invoice, InvoiceStatus
+from src.invoice.infrastructure.persistence.sqlalchemy.dbo import InvoiceDbo
+from src.school.domain.model import SchoolStatus
+from src.school.infrastructure.persistence.sqlalchemy.dbo import SchoolDbo
+from src.school.infrastructure.persistence.sqlalchemy.enrollment_dbo import (
+    EnrollmentDbo,
+)
+from src.shared.contact.model import ContactDbo
+from src.student.domain.model import IdentityKind, StudentStatus
+from src.student.infrastructure.persistence.sqlalchemy.dbo import StudentDbo
+
+INSERT_BATCH_SIZE = 5000
+
+SEEDED_TABLES = [
+    "payments",
+    "invoices",
+    "enrollments",
+    "students",
+    "schools",
+    "contacts",
+    "job_executions",
+]
+
+MONTHLY_FEE = Decimal("1500.00")
+
+
+@dataclass(frozen=True)
+class SeedVolumes:
+    schools: int
+    students_per_school: int
+    invoices_per_student: int
+
+    @property
+    def students(self) -> int:
+        return self.schools * self.students_per_school
+
+
+def school_id(index: int) -> str:
+    return f"bench-school-{index:06d}"
+
+
+def student_id(index: int) -> str:
+    return f"bench-student-{index:08d}"
+
+
+def school_of_student(volumes: SeedVolumes, index: int) -> str:
+    return school_id(index // volumes.students_per_school)
+
+
+def month(year: int, offset: int) -> date:
+    return date(year + offset // 12, offset % 12 + 1, 1)
+
+
+async def is_empty(session: AsyncSession) -> bool:
+    schools = await session.scalar(select(func.count()).select_from(SchoolDbo))
+    students = await session.scalar(select(func.count()).select_from(StudentDbo))
+
+    return schools == 0 and students == 0
+
+
+async def reset(session: AsyncSession) -> None:
+    await session.execute(text(f"TRUNCATE {', '.join(SEEDED_TABLES)}"))
+    await session.commit()
+
+
+async def seed(session: AsyncSession, volumes: SeedVolumes) -> None:
+    at = datetime(2024, 1, 1)
+
+    await _insert(session, ContactDbo.__table__, _contacts(volumes, at))
+    await _insert(session, SchoolDbo.__table__, _schools(volumes, at))
+    await _insert(session, StudentDbo.__table__, _students(volumes, at))
+    await _insert(session, EnrollmentDbo.__table__, _enrollments(volumes, at))
+    await _insert(session, InvoiceDbo.__table__, _invoices(volumes, at))
+
+    await session.commit()
+    await session.execute(text(f"ANALYZE {', '.join(SEEDED_TABLES)}"))
+    await session.commit()
+
+
+async def _insert(session: AsyncSession, table: Table, rows: Iterator[dict]) -> None:
+    batch = []
+
+    for row in rows:
+        batch.append(row)
+
+        if len(batch) == INSERT_BATCH_SIZE:
+            await session.execute(insert(table), batch)
+            batch = []
+
+    if batch:
+        await session.execute(insert(table), batch)
+
+
+def _contact(id: str, at: datetime) -> dict:
+    return {
+        "id": f"contact-{id}",
+        "email": f"{id}@benchmark.test",
+        "phone": f"phone-{id}",
+        "address": f"address {id}",
+        "created_at": at,
+        "updated_at": at,
+    }
+
+
+def _contacts(volumes: SeedVolumes, at: datetime) -> Iterator[dict]:
+    for index in range(volumes.schools):
+        yield _contact(school_id(index), at)
+
+    for index in range(volumes.students):
+        yield _contact(student_id(index), at)
+
+
+def _schools(volumes: SeedVolumes, at: datetime) -> Iterator[dict]:
+    for index in range(volumes.schools):
+        id = school_id(index)
+
+        yield {
+            "id": id,
+            "name": f"Benchmark school {index}",
+            "status": SchoolStatus.ACTIVE.name,
+            "contact_id": f"contact-{id}",
+            "created_at": at + timedelta(seconds=index),
+            "updated_at": at,
+        }
+
+
+def _students(volumes: SeedVolumes, at: datetime) -> Iterator[dict]:
+    for index in range(volumes.students):
+        id = student_id(index)
+
+        yield {
+            "id": id,
+            "first_name": "Student",
+            "last_name": f"{index}",
+            "identity_kind": IdentityKind.PASSPORT.name,
+            "identity_code": id,
+            "age": 10 + index % 8,
+            "status": StudentStatus.ACTIVE.name,
+            "contact_id": f"contact-{id}",
+            "created_at": at + timedelta(seconds=index),
+            "updated_at": at,
+        }
+
+
+def _enrollments(volumes: SeedVolumes, at: datetime) -> Iterator[dict]:
+    for index in range(volumes.students):
+        school = school_of_student(volumes, index)
+        student = student_id(index)
+
+        yield {
+            "id": f"school:{school}/student:{student}",
+            "school_id": school,
+            "student_id": student,
+            "monthly_fee": MONTHLY_FEE,
+            "created_at": at,
+            "updated_at": at,
+        }
+
+
+def _invoices(volumes: SeedVolumes, at: datetime) -> Iterator[dict]:
+    for index in range(volumes.students):
+        school = school_of_student(volumes, index)
+        student = student_id(index)
+
+        for offset in range(volumes.invoices_per_student):
+            due_date = month(2000, offset)
+
+            yield {
+                "id": Invoice.build_id(
+                    school_id=school, student_id=student, due_date=due_date
+                ),
+                "school_id": school,
+                "student_id": student,
+                "initial_amount": MONTHLY_FEE,
+                "due_amount": MONTHLY_FEE,
+                "due_date": due_date,
+                "status": InvoiceStatus.PENDING.name,
+                "created_at": at + timedelta(days=offset),
+                "updated_at": at,
+            }
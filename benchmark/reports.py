@@ -0,0 +1,16 @@
+import os
+import subprocess
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+
+def current_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
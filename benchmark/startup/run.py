@@ -0,0 +1,190 @@
+"""Measures the API cold start: module import time and time to first request.
+
+Usage: python -m benchmark.startup.run [--runs 5] [--module src.main]
+       [--compare benchmark/results/startup-<previous>.json]
+
+Import time comes from `python -X importtime`, the slowest modules by cumulative time
+are listed. Time to first request starts uvicorn in a new process, without the
+subscribers, and polls /metrics until it answers. Neither needs Postgres nor Redis.
+"""
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from dataclasses import asdict, dataclass
+from datetime import datetime
+
+from benchmark.reports import RESULTS_DIR, current_commit
+
+FIRST_REQUEST_TIMEOUT_S = 60
+
+
+@dataclass
+class ImportTime:
+    module: str
+    self_ms: float
+    cumulative_ms: float
+
+
+@dataclass
+class StartupResult:
+    import_ms: float
+    first_request_ms: float
+    slowest_imports: list[ImportTime]
+
+
+def parse_importtime(output: str) -> list[ImportTime]:
+    """Parses the `-X importtime` lines: `import time: self [us] | cumulative | name`"""
+    imports = []
+
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+
+        self_us, cumulative_us, module = line[len("import time:") :].split("|")
+        imports.append(
+            ImportTime(
+                module=module.strip(),
+                self_ms=int(self_us) / 1000,
+                cumulative_ms=int(cumulative_us) / 1000,
+            )
+        )
+
+    return imports
+
+
+def measure_import(module: str) -> list[ImportTime]:
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        check=True,
+        text=True,
+        env=os.environ | {"SUBSCRIBERS_ENABLED": "false"},
+    )
+
+    return parse_importtime(completed.stderr)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+
+        return sock.getsockname()[1]
+
+
+def measure_first_request(module: str) -> float:
+    port = free_port()
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            f"{module}:app",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+        ],
+        env=os.environ | {"SUBSCRIBERS_ENABLED": "false"},
+    )
+
+    try:
+        while time.perf_counter() - started < FIRST_REQUEST_TIMEOUT_S:
+            if server.poll() is not None:
+                sys.exit(f"The server exited with {server.returncode}")
+
+            try:
+                with urllib.request.urlopen(
+                    f"http://127.0.0.1:{port}/metrics", timeout=1
+                ):
+                    return (time.perf_counter() - started) * 1000
+            except (urllib.error.URLError, ConnectionError):
+                time.sleep(0.01)
+
+        sys.exit(f"No response after {FIRST_REQUEST_TIMEOUT_S}s")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def benchmark(arguments: argparse.Namespace) -> StartupResult:
+    import_runs = [measure_import(arguments.module) for _ in range(arguments.runs)]
+    first_request_runs = [
+        measure_first_request(arguments.module) for _ in range(arguments.runs)
+    ]
+
+    # The run with the median total, its modules are listed
+    import_runs.sort(key=lambda imports: imports[-1].cumulative_ms)
+    median_run = import_runs[len(import_runs) // 2]
+
+    return StartupResult(
+        import_ms=round(median_run[-1].cumulative_ms, 1),
+        first_request_ms=round(statistics.median(first_request_runs), 1),
+        slowest_imports=sorted(
+            median_run, key=lambda imported: imported.cumulative_ms, reverse=True
+        )[: arguments.top],
+    )
+
+
+def store(arguments: argparse.Namespace, result: StartupResult) -> str:
+    commit = current_commit()
+    report = {
+        "label": arguments.label or commit,
+        "commit": commit,
+        "created_at": datetime.now().isoformat(),
+        "config": {"module": arguments.module, "runs": arguments.runs},
+        "startup": asdict(result),
+    }
+
+    os.makedirs(arguments.results_dir, exist_ok=True)
+    path = os.path.join(arguments.results_dir, f"startup-{report['label']}.json")
+
+    with open(path, "w") as file:
+        json.dump(report, file, indent=2)
+
+    return path
+
+
+def compare(baseline_path: str, result: StartupResult) -> None:
+    with open(baseline_path) as file:
+        baseline = json.load(file)
+
+    print(f"\nCompared with {baseline['label']} ({baseline['commit']}):")
+
+    for metric in ["import_ms", "first_request_ms"]:
+        before, after = baseline["startup"][metric], getattr(result, metric)
+        change = (after - before) / before * 100 if before else 0.0
+        print(f"{metric} {before} -> {after} ({change:+.1f}%)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the API cold start")
+    parser.add_argument("--module", default="src.main")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="Slowest imports listed")
+    parser.add_argument("--label", help="Results file name, the commit by default")
+    parser.add_argument("--results-dir", default=RESULTS_DIR)
+    parser.add_argument("--compare", help="Results file to compare against")
+    arguments = parser.parse_args()
+
+    result = benchmark(arguments)
+
+    print(f"import {arguments.module}: {result.import_ms}ms")
+    print(f"time to first request: {result.first_request_ms}ms")
+    print("\nSlowest imports (cumulative ms):")
+
+    for imported in result.slowest_imports:
+        print(f"{imported.cumulative_ms:10.1f}  {imported.module}")
+
+    print(f"\nResults stored at {store(arguments, result)}")
+
+    if arguments.compare:
+        compare(arguments.compare, result)
@@ -1,10 +1,11 @@
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from decimal import Decimal
 
 from src.shared.id.generator import IdGenerator
 from src.shared.logging.log import Logger
 from src.invoice.domain.repository import ById, InvoiceRepository
 from src.invoice.domain.model import Invoice
+from src.shared.tracing.tracer import traced
 
 logger = Logger(__name__)
 
@@ -15,6 +16,7 @@ class Request:
     amount: Decimal
 
 
+@traced
 class AddInvoicePayment:
     def __init__(
         self,
@@ -25,7 +27,7 @@ class AddInvoicePayment:
         self.id_generator = id_generator
 
     async def execute(self, request: Request) -> Invoice:
-        logger.info(f"About to add an invoice payment: request={asdict(request)}")
+        logger.info("About to add an invoice payment: request=%s", request)
 
         invoice = await self.invoices.get(query=ById(id=request.id))
 
@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from src.shared.logging.log import Logger
 from src.invoice.domain.repository import ById, InvoiceRepository
 from src.invoice.domain.model import Invoice
+from src.shared.tracing.tracer import traced
 
 logger = Logger(__name__)
 
@@ -12,6 +13,7 @@ class Request:
     id: str
 
 
+@traced
 class CancelInvoice:
     def __init__(
         self,
@@ -20,7 +22,7 @@ class CancelInvoice:
         self.invoices = invoices
 
     async def execute(self, request: Request) -> Invoice:
-        logger.info(f"About to cancel the invoice: invoice={request.id}")
+        logger.info("About to cancel the invoice: invoice=%s", request.id)
 
         invoice = await self.invoices.get(query=ById(id=request.id))
         event, invoice = invoice.cancel()
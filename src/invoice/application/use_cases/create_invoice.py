@@ -1,14 +1,16 @@
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
 
 from src.invoice.domain.errors import InvalidInvoicePartiesError
-from src.school.domain.repository import ByIdAndActive, SchoolRepository
-from src.shared.errors.application import AlreadyExistsError
+from src.invoice.domain.events import InvoiceEvent
+from src.school.domain.model import SchoolStatus
+from src.shared.errors.application import AlreadyExistsError, NotFoundError
 from src.shared.logging.log import Logger
-from src.invoice.domain.repository import ById, InvoiceRepository
+from src.invoice.domain.repository import InvoiceRepository
 from src.invoice.domain.model import Invoice
-from src.student.domain.repository import ById as StudentById, StudentRepository
+from src.student.domain.model import StudentStatus
+from src.shared.tracing.tracer import traced
 
 logger = Logger(__name__)
 
@@ -21,28 +23,34 @@ class Request:
     due_date: date
 
 
+@traced
 class CreateInvoice:
-    def __init__(
-        self,
-        students: StudentRepository,
-        schools: SchoolRepository,
-        invoices: InvoiceRepository,
-    ):
-        self.schools = schools
-        self.students = students
+    def __init__(self, invoices: InvoiceRepository):
         self.invoices = invoices
 
     async def execute(self, request: Request) -> Invoice:
-        logger.info(f"About to create an invoice: request={asdict(request)}")
+        logger.info("About to create an invoice: request=%s", request)
 
+        event, new_invoice = await self.prepare(request)
+
+        await self.invoices.update(event)
+
+        return new_invoice
+
+    async def prepare(self, request: Request) -> tuple[InvoiceEvent, Invoice]:
+        """Validates the request and builds the invoice without persisting it"""
         invoice_id = Invoice.build_id(
             school_id=request.school_id,
             student_id=request.student_id,
             due_date=request.due_date,
         )
-        exists_invoice = await self.invoices.exists(query=ById(id=invoice_id))
+        check = await self.invoices.check_creation(
+            invoice_id=invoice_id,
+            school_id=request.school_id,
+            student_id=request.student_id,
+        )
 
-        if exists_invoice:
+        if check.invoice_exists:
             error = AlreadyExistsError(
                 resource="Invoice",
                 attributes={
@@ -56,13 +64,16 @@ class CreateInvoice:
 
             raise error
 
-        school_query = ByIdAndActive(id=request.school_id)
-        school = await self.schools.get(query=school_query)
+        # Same errors as getting the active school and the student did
+        if check.school_status != SchoolStatus.ACTIVE:
+            raise NotFoundError(resource="School", attributes={"id": request.school_id})
 
-        student_query = StudentById(id=request.student_id)
-        student = await self.students.get(query=student_query)
+        if check.student_status is None:
+            raise NotFoundError(
+                resource="Student", attributes={"id": request.student_id}
+            )
 
-        if not school.is_active() or not student.is_active():
+        if check.student_status != StudentStatus.ACTIVE:
             error = InvalidInvoicePartiesError(
                 school_id=request.school_id, student_id=request.student_id
             )
@@ -72,12 +83,10 @@ class CreateInvoice:
             raise error
 
         event, new_invoice = Invoice.of(
-            student_id=student.id,
-            school_id=school.id,
+            student_id=request.student_id,
+            school_id=request.school_id,
             amount=request.amount,
             due_date=request.due_date,
         )
 
-        await self.invoices.update(event)
-
-        return new_invoice
+        return event, new_invoice
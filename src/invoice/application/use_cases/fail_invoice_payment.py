@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from src.shared.logging.log import Logger
 from src.invoice.domain.repository import ById, InvoiceRepository
 from src.invoice.domain.model import Invoice
+from src.shared.tracing.tracer import traced
 
 logger = Logger(__name__)
 
@@ -13,6 +14,7 @@ class Request:
     payment_id: str
 
 
+@traced
 class FailInvoicePayment:
     def __init__(
         self,
@@ -21,7 +23,9 @@ class FailInvoicePayment:
         self.invoices = invoices
 
     async def execute(self, request: Request) -> Invoice:
-        logger.info(f"About to mark as failed an invoice payment: invoice={request.id}")
+        logger.info(
+            "About to mark as failed an invoice payment: invoice=%s", request.id
+        )
 
         invoice = await self.invoices.get(query=ById(id=request.id))
         event, invoice = invoice.fail_payment(payment_id=request.payment_id)
@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from src.invoice.domain.repository import (
     AccountStatement,
     InvoiceRepository,
@@ -5,8 +7,10 @@ from src.invoice.domain.repository import (
     InvoicesQuery,
 )
 from src.invoice.domain.model import Invoice
+from src.shared.tracing.tracer import traced
 
 
+@traced
 class InvoiceQueryHandler:
     def __init__(self, invoices: InvoiceRepository):
         self.invoices = invoices
@@ -17,5 +21,8 @@ class InvoiceQueryHandler:
     async def find(self, query: InvoiceQuery) -> Invoice | None:
         return await self.invoices.find(query=query)
 
+    async def version(self, id: str) -> datetime | None:
+        return await self.invoices.version(id=id)
+
     async def account_statement(self, query: InvoicesQuery) -> AccountStatement:
         return await self.invoices.account_statement(query)
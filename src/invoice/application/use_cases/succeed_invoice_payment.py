@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from src.shared.logging.log import Logger
 from src.invoice.domain.repository import ById, InvoiceRepository
 from src.invoice.domain.model import Invoice
+from src.shared.tracing.tracer import traced
 
 logger = Logger(__name__)
 
@@ -13,6 +14,7 @@ class Request:
     payment_id: str
 
 
+@traced
 class SucceedInvoicePayment:
     def __init__(
         self,
@@ -22,13 +24,12 @@ class SucceedInvoicePayment:
 
     async def execute(self, request: Request) -> Invoice:
         logger.info(
-            f"About to mark as succeed an invoice payment: invoice={request.id}"
+            "About to mark as succeed an invoice payment: invoice=%s", request.id
         )
 
         invoice = await self.invoices.get(query=ById(id=request.id))
         events, invoice = invoice.succeed_payment(payment_id=request.payment_id)
 
-        for event in events:
-            await self.invoices.update(event)
+        await self.invoices.update_many(events)
 
         return invoice
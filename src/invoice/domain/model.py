@@ -322,6 +322,12 @@ class Invoice:
     def pending_payments(self) -> list[Payment]:
         return list(filter(lambda p: p.is_pending(), self.payments))
 
+    def last_modified(self) -> datetime:
+        """Adding or failing a payment leaves the invoice `updated_at` untouched"""
+        return max(
+            [self.updated_at, *(payment.updated_at for payment in self.payments)]
+        )
+
     def __replace_payment(self, payment: Payment) -> list[Payment]:
         return [
             current_payment if current_payment.id != payment.id else payment
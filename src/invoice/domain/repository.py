@@ -5,7 +5,9 @@ from decimal import Decimal
 
 from src.invoice.domain.events import InvoiceEvent
 from src.invoice.domain.model import Invoice
-from src.shared.errors.application import NotFoundError
+from src.school.domain.model import SchoolStatus
+from src.shared.errors.application import AlreadyExistsError, NotFoundError
+from src.student.domain.model import StudentStatus
 
 
 class InvoiceQuery(ABC):
@@ -59,6 +61,16 @@ class AccountStatement:
         return AccountStatement(due_amount=due_amount, invoices=invoices)
 
 
+@dataclass
+class InvoiceCreationCheck:
+    """What creating an invoice depends on. The statuses are None for a school or
+    student that does not exist"""
+
+    invoice_exists: bool
+    school_status: SchoolStatus | None
+    student_status: StudentStatus | None
+
+
 class InvoiceRepository(ABC):
     async def get(self, query: InvoiceQuery) -> Invoice:
         found_invoice = await self.find(query)
@@ -77,9 +89,34 @@ class InvoiceRepository(ABC):
         pass
 
     @abstractmethod
-    async def account_statement(self, query: InvoicesQuery) -> AccountStatement:
+    async def version(self, id: str) -> datetime | None:
+        """Last update of the invoice or of any of its payments, see
+        `Invoice.last_modified`"""
+        pass
+
+    @abstractmethod
+    async def check_creation(
+        self, invoice_id: str, school_id: str, student_id: str
+    ) -> InvoiceCreationCheck:
+        """Looks the invoice, its school and its student up in one round trip"""
         pass
 
     @abstractmethod
+    async def account_statement(self, query: InvoicesQuery) -> AccountStatement:
+        pass
+
     async def update(self, event: InvoiceEvent) -> None:
+        """Applies the event. Raises AlreadyExistsError when it creates an invoice
+        that already exists"""
+        existing_ids = await self.update_many([event])
+
+        if existing_ids:
+            raise AlreadyExistsError(
+                resource="Invoice", attributes={"ids": sorted(existing_ids)}
+            )
+
+    @abstractmethod
+    async def update_many(self, events: list[InvoiceEvent]) -> set[str]:
+        """Applies all the events in a single transaction. The created invoices that
+        already exist are skipped, the rest are inserted, and their ids returned"""
         pass
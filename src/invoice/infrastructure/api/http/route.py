@@ -1,5 +1,8 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request as HttpRequest
 
+from src.shared.http_cache.conditional_get import conditional_get
+from src.shared.http_cache.impl.redis_response_cache import create_response_cache
+from src.shared.http_cache.response_cache import ResponseCache
 from src.invoice.infrastructure.api.http.dto import (
     AddInvoicePaymentDto,
     CreateInvoiceDto,
@@ -19,7 +22,9 @@ from src.invoice.application.use_cases.succeed_invoice_payment import (
     Request as SucceedInvoicePaymentRequest,
 )
 from src.invoice.application.use_cases.create_invoice import CreateInvoice
+from src.invoice.domain.model import Invoice
 from src.invoice.domain.repository import (
+    AccountStatement,
     All,
     ById,
     BySchoolId,
@@ -27,33 +32,22 @@ from src.invoice.domain.repository import (
     InvoiceRepository,
 )
 from src.invoice.infrastructure.persistence.sqlalchemy.repository import (
+    get_invoice_replica_repository,
     get_invoice_repository,
 )
-from src.school.domain.repository import SchoolRepository
-from src.school.infrastructure.persistence.sqlalchemy.repository import (
-    get_school_repository,
-)
 from src.shared.id.generator import IdGenerator
 from src.shared.id.ulid_generator import get_id_generator
-from src.student.domain.repository import StudentRepository
-from src.student.infrastructure.persistence.sqlalchemy.repository import (
-    get_student_repository,
-)
 
+from src.shared.http.json_response import JsonRoute
+from src.shared.http.json_stream import JsonStreamResponse
 
-router = APIRouter()
+router = APIRouter(route_class=JsonRoute)
 
 
 def get_create_invoice_use_case(
-    student_repository: StudentRepository = Depends(get_student_repository),
-    school_repository: SchoolRepository = Depends(get_school_repository),
     invoice_repository: InvoiceRepository = Depends(get_invoice_repository),
 ) -> CreateInvoice:
-    return CreateInvoice(
-        students=student_repository,
-        schools=school_repository,
-        invoices=invoice_repository,
-    )
+    return CreateInvoice(invoices=invoice_repository)
 
 
 def get_add_invoice_payment_use_case(
@@ -85,12 +79,12 @@ def get_fail_invoice_payment_use_case(
 
 
 def get_invoice_query_handler(
-    invoice_repository: InvoiceRepository = Depends(get_invoice_repository),
+    invoice_repository: InvoiceRepository = Depends(get_invoice_replica_repository),
 ) -> InvoiceQueryHandler:
     return InvoiceQueryHandler(invoices=invoice_repository)
 
 
-@router.post("/invoices")
+@router.post("/invoices", response_model=Invoice)
 async def create_invoice(
     dto: CreateInvoiceDto,
     use_case: CreateInvoice = Depends(get_create_invoice_use_case),
@@ -101,7 +95,7 @@ async def create_invoice(
     return created_invoice
 
 
-@router.post("/invoices/{id}/payments/")
+@router.post("/invoices/{id}/payments/", response_model=Invoice)
 async def create_payment(
     id: str,
     dto: AddInvoicePaymentDto,
@@ -114,7 +108,9 @@ async def create_payment(
     return invoice
 
 
-@router.patch("/invoices/{invoice_id}/payments/{payment_id}/succeed")
+@router.patch(
+    "/invoices/{invoice_id}/payments/{payment_id}/succeed", response_model=Invoice
+)
 async def update_payment_succeed(
     invoice_id: str,
     payment_id: str,
@@ -129,7 +125,9 @@ async def update_payment_succeed(
     return invoice
 
 
-@router.patch("/invoices/{invoice_id}/payments/{payment_id}/fail")
+@router.patch(
+    "/invoices/{invoice_id}/payments/{payment_id}/fail", response_model=Invoice
+)
 async def update_payment_failed(
     invoice_id: str,
     payment_id: str,
@@ -144,7 +142,7 @@ async def update_payment_failed(
     return invoice
 
 
-@router.delete("/invoices/{id}")
+@router.delete("/invoices/{id}", response_model=Invoice)
 async def delete_invoice(
     id: str,
     use_case: CancelInvoice = Depends(get_cancel_invoice_use_case),
@@ -155,17 +153,25 @@ async def delete_invoice(
     return canceled_invoice
 
 
-@router.get("/invoices/{id}")
+@router.get("/invoices/{id}", response_model=Invoice | None)
 async def get_invoice(
     id: str,
+    http_request: HttpRequest,
     query_handler: InvoiceQueryHandler = Depends(get_invoice_query_handler),
+    cache: ResponseCache = Depends(create_response_cache),
 ):
-    invoice = await query_handler.find(query=ById(id=id))
-
-    return invoice
+    return await conditional_get(
+        http_request,
+        cache,
+        resource="invoices",
+        id=id,
+        version=lambda: query_handler.version(id=id),
+        find=lambda: query_handler.find(query=ById(id=id)),
+        version_of=lambda invoice: invoice.last_modified(),
+    )
 
 
-@router.get("/invoices")
+@router.get("/invoices", response_model=AccountStatement)
 async def get_invoices(
     school_id: str | None = None,
     student_id: str | None = None,
@@ -180,4 +186,8 @@ async def get_invoices(
     if query is None:
         raise ValueError("School id or student id is required")
 
-    return await query_handler.account_statement(query=query)
+    statement = await query_handler.account_statement(query=query)
+
+    return JsonStreamResponse(
+        {"due_amount": statement.due_amount, "invoices": statement.invoices}
+    )
@@ -5,6 +5,8 @@ from sqlalchemy import (
     Date,
     DateTime,
     ForeignKey,
+    Index,
+    Row,
     String,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -80,6 +82,21 @@ class InvoiceDbo(BaseSqlModel):
         "PaymentDbo", backref="invoice", lazy="noload"
     )
 
+    __table_args__ = (
+        Index(
+            "ix_pending_invoices_school_id",
+            "school_id",
+            created_at.desc(),
+            postgresql_where=status == InvoiceStatus.PENDING.name,
+        ),
+        Index(
+            "ix_pending_invoices_student_id",
+            "student_id",
+            created_at.desc(),
+            postgresql_where=status == InvoiceStatus.PENDING.name,
+        ),
+    )
+
     def __repr__(self):
         return f"<InvoiceDbo(id={self.id}, status={self.status}, due_amount={self.due_amount})>"
 
@@ -97,6 +114,21 @@ class InvoiceDbo(BaseSqlModel):
             updated_at=event.at,
         )
 
+    def as_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "student_id": self.student_id,
+            "school_id": self.school_id,
+            "initial_amount": self.initial_amount,
+            "due_amount": self.due_amount,
+            "due_date": self.due_date,
+            "status": self.status,
+            "paid_at": self.paid_at,
+            "cancelled_at": self.cancelled_at,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+
     def as_domain(self) -> Invoice:
         return Invoice(
             id=self.id,
@@ -113,13 +145,26 @@ class InvoiceDbo(BaseSqlModel):
             cancelled_at=self.cancelled_at,
         )
 
-    def as_read_projection(self) -> PendingInvoiceReadProjection:
+    @staticmethod
+    def read_projection_columns() -> tuple:
+        return (
+            InvoiceDbo.id,
+            InvoiceDbo.student_id,
+            InvoiceDbo.school_id,
+            InvoiceDbo.initial_amount,
+            InvoiceDbo.due_amount,
+            InvoiceDbo.created_at,
+            InvoiceDbo.updated_at,
+        )
+
+    @staticmethod
+    def as_read_projection(row: Row) -> PendingInvoiceReadProjection:
         return PendingInvoiceReadProjection(
-            id=self.id,
-            student_id=self.student_id,
-            school_id=self.school_id,
-            base_amount=self.initial_amount,
-            due_amount=self.due_amount,
-            created_at=self.created_at,
-            updated_at=self.updated_at,
+            id=row.id,
+            student_id=row.student_id,
+            school_id=row.school_id,
+            base_amount=row.initial_amount,
+            due_amount=row.due_amount,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
         )
@@ -1,7 +1,9 @@
 from dataclasses import asdict
+from datetime import datetime
 from fastapi import Depends
 from sqlalchemy.orm import subqueryload
-from sqlalchemy import select, exists, update
+from sqlalchemy import Executable, bindparam, column, func, select, exists, table
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.invoice.domain.events import (
     InvoiceEvent,
@@ -9,9 +11,12 @@ from src.invoice.domain.events import (
     InvoiceCreated,
     InvoicePaid,
 )
-from src.shared.db.pg_sqlalchemy.connection import get_db
+from src.shared.db.pg_sqlalchemy.connection import get_db, get_replica_db
+from src.shared.db.pg_sqlalchemy.statements import update_by_id
 from src.shared.logging.log import Logger
 from src.shared.errors.technical import TechnicalError
+from src.shared.http_cache.impl.redis_response_cache import create_response_cache
+from src.shared.http_cache.response_cache import ResponseCache
 from src.invoice.domain.repository import (
     AccountStatement,
     All,
@@ -19,6 +24,7 @@ from src.invoice.domain.repository import (
     BySchoolId,
     ByStudentId,
     Invoice,
+    InvoiceCreationCheck,
     InvoiceRepository,
     InvoicesQuery,
     InvoiceQuery,
@@ -27,6 +33,8 @@ from src.invoice.infrastructure.persistence.sqlalchemy.dbo import (
     InvoiceDbo,
     PaymentDbo,
 )
+from src.school.domain.model import SchoolStatus
+from src.student.domain.model import StudentStatus
 from src.invoice.domain.model import (
     InvoiceStatus,
     PaymentAdded,
@@ -34,18 +42,65 @@ from src.invoice.domain.model import (
     PaymentStatus,
     PaymentSucceed,
 )
+from src.shared.tracing.tracer import traced
 
 logger = Logger(__name__)
 
+# Built once with bound parameters, so each call skips building the statement and
+# its cache key, and SQLAlchemy reuses the compiled SQL
+INVOICE_EXISTS_BY_ID = select(exists().where(InvoiceDbo.id == bindparam("id")))
+FIND_INVOICE_BY_ID = (
+    select(InvoiceDbo)
+    .where(InvoiceDbo.id == bindparam("id"))
+    .options(subqueryload(InvoiceDbo.payments))
+)
+# GREATEST skips the NULL of an invoice without payments
+INVOICE_VERSION = select(
+    func.greatest(
+        InvoiceDbo.updated_at,
+        select(func.max(PaymentDbo.updated_at))
+        .where(PaymentDbo.invoice_id == InvoiceDbo.id)
+        .scalar_subquery(),
+    )
+).where(InvoiceDbo.id == bindparam("id"))
+
+# Only the columns the check reads, without depending on the other contexts models
+schools = table("schools", column("id"), column("status"))
+students = table("students", column("id"), column("status"))
+
+CHECK_INVOICE_CREATION = select(
+    exists().where(InvoiceDbo.id == bindparam("invoice_id")).label("invoice_exists"),
+    select(schools.c.status)
+    .where(schools.c.id == bindparam("school_id"))
+    .scalar_subquery()
+    .label("school_status"),
+    select(students.c.status)
+    .where(students.c.id == bindparam("student_id"))
+    .scalar_subquery()
+    .label("student_status"),
+)
 
+# Concurrent creations of the same invoice conflict here instead of failing the
+# transaction, the ids not returned already existed
+INSERT_INVOICES = (
+    insert(InvoiceDbo.__table__)
+    .on_conflict_do_nothing(index_elements=["id"])
+    .returning(InvoiceDbo.__table__.c.id)
+)
+
+
+@traced
 class SqlAlchemyInvoiceRepository(InvoiceRepository):
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, cache: ResponseCache | None = None):
         self.session = session
+        self.cache = cache
 
     async def exists(self, query: InvoiceQuery) -> bool:
         try:
-            statement = select(exists().where(self.__parse_single_query(query)))
-            result = await self.session.execute(statement)
+            statement, parameters = self.__single_query_statement(
+                query, INVOICE_EXISTS_BY_ID
+            )
+            result = await self.session.execute(statement, parameters)
 
             return result.scalar() or False
         except Exception as e:
@@ -62,10 +117,10 @@ class SqlAlchemyInvoiceRepository(InvoiceRepository):
 
     async def find(self, query: InvoiceQuery) -> Invoice | None:
         try:
-            db_query = select(InvoiceDbo).where(self.__parse_single_query(query))
-            result = await self.session.execute(
-                db_query.options(subqueryload(InvoiceDbo.payments))
+            statement, parameters = self.__single_query_statement(
+                query, FIND_INVOICE_BY_ID
             )
+            result = await self.session.execute(statement, parameters)
             result = result.scalar()
 
             if result is None:
@@ -84,18 +139,72 @@ class SqlAlchemyInvoiceRepository(InvoiceRepository):
 
             raise error from e
 
+    async def version(self, id: str) -> datetime | None:
+        try:
+            result = await self.session.execute(INVOICE_VERSION, {"id": id})
+            return result.scalar()
+        except Exception as e:
+            error = TechnicalError(
+                code="InvoiceRepositoryError",
+                message=f"Fail finding the invoice version id={id}",
+                attributes={"id": id},
+                cause=e,
+            )
+
+            logger.error(error)
+
+            raise error from e
+
+    async def check_creation(
+        self, invoice_id: str, school_id: str, student_id: str
+    ) -> InvoiceCreationCheck:
+        try:
+            result = await self.session.execute(
+                CHECK_INVOICE_CREATION,
+                {
+                    "invoice_id": invoice_id,
+                    "school_id": school_id,
+                    "student_id": student_id,
+                },
+            )
+            row = result.one()
+
+            return InvoiceCreationCheck(
+                invoice_exists=row.invoice_exists,
+                school_status=(
+                    SchoolStatus(row.school_status) if row.school_status else None
+                ),
+                student_status=(
+                    StudentStatus(row.student_status) if row.student_status else None
+                ),
+            )
+        except Exception as e:
+            error = TechnicalError(
+                code="InvoiceRepositoryError",
+                message=f"Fail checking invoice creation invoice_id={invoice_id}",
+                attributes={
+                    "invoice_id": invoice_id,
+                    "school_id": school_id,
+                    "student_id": student_id,
+                },
+                cause=e,
+            )
+
+            logger.error(error)
+
+            raise error from e
+
     async def account_statement(self, query: InvoicesQuery) -> AccountStatement:
         try:
-            db_query = select(InvoiceDbo).filter(
+            db_query = select(*InvoiceDbo.read_projection_columns()).filter(
                 self.__parse_multiple_query(query),
                 InvoiceDbo.status == InvoiceStatus.PENDING.name,
             )
             result = await self.session.execute(
                 db_query.order_by(InvoiceDbo.created_at.desc())
             )
-            result = result.scalars().all()
 
-            invoices = list(map(lambda dbo: dbo.as_read_projection(), result))
+            invoices = [InvoiceDbo.as_read_projection(row) for row in result]
 
             return AccountStatement.of(invoices)
         except Exception as e:
@@ -110,80 +219,92 @@ class SqlAlchemyInvoiceRepository(InvoiceRepository):
 
             raise error from e
 
-    async def update(self, event: InvoiceEvent) -> None:
+    async def update_many(self, events: list[InvoiceEvent]) -> set[str]:
         try:
-            match event:
-                case InvoiceCreated():
-                    dbo = InvoiceDbo.of(event)
-                    self.session.add(dbo)
-
-                case InvoicePaid():
-                    statement = (
-                        update(InvoiceDbo)
-                        .where(InvoiceDbo.id == event.id)
-                        .values(
+            existing_ids: set[str] = set()
+            created_invoices: list[dict] = []
+            invoice_changes: dict[str, dict] = {}
+            payment_changes: dict[str, dict] = {}
+
+            for event in events:
+                match event:
+                    case InvoiceCreated():
+                        created_invoices.append(InvoiceDbo.of(event).as_dict())
+
+                    case InvoicePaid():
+                        invoice_changes.setdefault(event.id, {}).update(
                             status=InvoiceStatus.PAID.name,
                             paid_at=event.at,
                             updated_at=event.at,
                         )
-                    )
-                    await self.session.execute(statement)
-
-                case InvoiceCancelled():
-                    statement = (
-                        update(InvoiceDbo)
-                        .where(InvoiceDbo.id == event.id)
-                        .values(
+
+                    case InvoiceCancelled():
+                        invoice_changes.setdefault(event.id, {}).update(
                             status=InvoiceStatus.CANCELED.name,
                             cancelled_at=event.at,
                             updated_at=event.at,
                         )
-                    )
-                    await self.session.execute(statement)
-
-                case PaymentAdded():
-                    payment_dbo = PaymentDbo.of(event)
-                    self.session.add(payment_dbo)
-
-                case PaymentSucceed():
-                    invoice_statement = (
-                        update(InvoiceDbo)
-                        .where(InvoiceDbo.id == event.id)
-                        .values(due_amount=event.due_amount, updated_at=event.at)
-                    )
-                    payment_statement = (
-                        update(PaymentDbo)
-                        .where(PaymentDbo.id == event.payment.id)
-                        .values(
+
+                    case PaymentAdded():
+                        payment_dbo = PaymentDbo.of(event)
+                        self.session.add(payment_dbo)
+
+                    case PaymentSucceed():
+                        invoice_changes.setdefault(event.id, {}).update(
+                            due_amount=event.due_amount,
+                            updated_at=event.at,
+                        )
+                        payment_changes.setdefault(event.payment.id, {}).update(
                             status=PaymentStatus.SUCCEED.name,
                             succeed_at=event.at,
                             updated_at=event.at,
                         )
-                    )
-                    await self.session.execute(invoice_statement)
-                    await self.session.execute(payment_statement)
-
-                case PaymentFailed():
-                    statement = (
-                        update(PaymentDbo)
-                        .where(PaymentDbo.id == event.payment_id)
-                        .values(
+
+                    case PaymentFailed():
+                        payment_changes.setdefault(event.payment_id, {}).update(
                             status=PaymentStatus.FAILED.name,
                             failed_at=event.at,
                             updated_at=event.at,
                         )
-                    )
-                    await self.session.execute(statement)
 
-                case _:
-                    raise ValueError(f"Unknown InvoiceEvent type: {event}")
+                    case _:
+                        raise ValueError(f"Unknown InvoiceEvent type: {event}")
+
+            if created_invoices:
+                existing_ids = await self.__insert(created_invoices)
+
+            # The updates are Core statements, which do not autoflush the added rows
+            await self.session.flush()
+
+            for statement, parameters in update_by_id(InvoiceDbo, invoice_changes):
+                await self.session.execute(statement, parameters)
+
+            for statement, parameters in update_by_id(PaymentDbo, payment_changes):
+                await self.session.execute(statement, parameters)
 
             await self.session.commit()
+
+            # A created invoice has no cached response yet
+            if self.cache is not None:
+                await self.cache.invalidate(
+                    "invoices",
+                    list(
+                        {
+                            event.id
+                            for event in events
+                            if not isinstance(event, InvoiceCreated)
+                        }
+                    ),
+                )
+
+            return existing_ids
         except Exception as e:
+            await self.session.rollback()
+
             error = TechnicalError(
                 code="InvoiceRepositoryError",
-                message=f"Fail updating invoice ",
-                attributes=asdict(event),
+                message=f"Fail updating invoices ",
+                attributes={"events": [asdict(event) for event in events]},
                 cause=e,
             )
 
@@ -191,10 +312,24 @@ class SqlAlchemyInvoiceRepository(InvoiceRepository):
 
             raise error from e
 
-    def __parse_single_query(self, query: InvoiceQuery):
+    async def __insert(self, invoices: list[dict]) -> set[str]:
+        """Inserts the invoices skipping the existing ones, whose ids it returns"""
+        result = await self.session.execute(INSERT_INVOICES, invoices)
+        existing_ids = {invoice["id"] for invoice in invoices} - set(result.scalars())
+
+        if existing_ids:
+            logger.warning(
+                "Skipped invoices that already exist: ids=%s", sorted(existing_ids)
+            )
+
+        return existing_ids
+
+    def __single_query_statement(
+        self, query: InvoiceQuery, by_id: Executable
+    ) -> tuple[Executable, dict]:
         match query:
             case ById(id):
-                return InvoiceDbo.id == id
+                return by_id, {"id": id}
             case _:
                 raise NotImplementedError("Query not implemented")
 
@@ -212,5 +347,12 @@ class SqlAlchemyInvoiceRepository(InvoiceRepository):
 
 def get_invoice_repository(
     session: AsyncSession = Depends(get_db),
+    cache: ResponseCache = Depends(create_response_cache),
+) -> InvoiceRepository:
+    return SqlAlchemyInvoiceRepository(session=session, cache=cache)
+
+
+def get_invoice_replica_repository(
+    session: AsyncSession = Depends(get_replica_db),
 ) -> InvoiceRepository:
     return SqlAlchemyInvoiceRepository(session=session)
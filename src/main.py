@@ -1,31 +1,86 @@
 import asyncio
+import importlib
+import os
 from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
-from src.school.infrastructure.api.events.drop_student_enrollments_subscriber import (
-    dropStudentEnrollmentsSubscriber,
-)
 from src.shared.errors.business import BusinessError
 from src.shared.errors.application import ApplicationError
 from src.shared.errors.technical import TechnicalError
-from src.student.infrastructure.api.http.route import router as student_router
-from src.school.infrastructure.api.http.route import router as school_router
-from src.invoice.infrastructure.api.http.route import router as invoice_router
+from src.shared.db.pg_sqlalchemy.connection import (
+    dispose_engine,
+    get_engine,
+    get_replica_engine,
+)
+from src.shared.db.read_your_writes import ReadYourWritesMiddleware
+from src.shared.http.compression import CompressionMiddleware
+from src.shared.http.json_response import JsonResponse
+from src.shared.redis.connection_factory import close_pool, get_pool
+from src.shared.lifecycle import is_enabled, stop_tasks
+from src.shared.logging.log import configure_logging
+from src.shared.tracing.exporters import configure_tracing
+from src.shared.tracing.middleware import TracingMiddleware
+from src.shared.db.middleware import QueryStatsMiddleware
+from src.shared.metrics.middleware import MetricsMiddleware
+from src.shared.metrics.model import metrics
+from src.shared.metrics.multiprocess import metrics_dir, sync_snapshots
+from src.shared.metrics.route import router as metrics_router
 
 load_dotenv()
+configure_logging()
+configure_tracing()
+
+# Bounded contexts served by the API, their modules are only imported when enabled
+ROUTERS = {
+    "students": ("src.student.infrastructure.api.http.route", "Students"),
+    "schools": ("src.school.infrastructure.api.http.route", "Schools"),
+    "invoices": ("src.invoice.infrastructure.api.http.route", "Invoices"),
+}
+API_CONTEXTS = [
+    context.strip()
+    for context in os.getenv("API_CONTEXTS", ",".join(ROUTERS)).split(",")
+    if context.strip()
+]
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    subscriber = await dropStudentEnrollmentsSubscriber()
+    get_engine()
+    get_replica_engine()
+    get_pool()
+
+    background_tasks = []
+
+    # Shared with the other workers of src.server, which sets the directory
+    if metrics_dir() is not None:
+        background_tasks.append(asyncio.create_task(sync_snapshots(metrics)))
+
+    # Off in the workers not designated to run them, which never import it
+    if is_enabled("SUBSCRIBERS_ENABLED"):
+        from src.school.infrastructure.api.events.drop_student_enrollments_subscriber import (
+            dropStudentEnrollmentsSubscriber,
+        )
+
+        subscriber = await dropStudentEnrollmentsSubscriber()
+
+        dropStudentEnrollmentsTask = asyncio.create_task(subscriber.run())
+        background_tasks.append(dropStudentEnrollmentsTask)
 
-    dropStudentEnrollmentsTask = asyncio.create_task(subscriber.run())
     yield
-    dropStudentEnrollmentsTask.cancel()
+
+    await stop_tasks(background_tasks)
+
+    await close_pool()
+    await dispose_engine()
 
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=JsonResponse)
+app.add_middleware(CompressionMiddleware)
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(QueryStatsMiddleware)
+app.add_middleware(ReadYourWritesMiddleware)
+app.add_middleware(TracingMiddleware)
 
 
 @app.exception_handler(Exception)
@@ -72,6 +127,11 @@ async def exception_handler(request: Request, error: BusinessError):
     )
 
 
-app.include_router(student_router, tags=["Students"], prefix="/mattilda")
-app.include_router(school_router, tags=["Schools"], prefix="/mattilda")
-app.include_router(invoice_router, tags=["Invoices"], prefix="/mattilda")
+for context in API_CONTEXTS:
+    module, tag = ROUTERS[context]
+
+    app.include_router(
+        importlib.import_module(module).router, tags=[tag], prefix="/mattilda"
+    )
+
+app.include_router(metrics_router)
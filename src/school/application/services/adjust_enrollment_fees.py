@@ -0,0 +1,114 @@
+from typing import AsyncGenerator
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+
+from src.shared.job.model import JobExecutionResult, JobItemResult, StartedJobItem
+from src.shared.job.executor import JobExecutor
+from src.school.domain.errors import InvalidSchoolStatusError
+from src.school.domain.enrollment import (
+    EnrollmentRepository,
+    FeeAdjustment,
+    FeeAdjustmentKind,
+)
+from src.shared.logging.log import Logger
+from src.school.domain.repository import ByIdAndActive, SchoolRepository
+from src.shared.tracing.tracer import traced
+
+logger = Logger(__name__)
+
+ENROLLMENTS_CHUNK_SIZE = 1000
+
+
+@dataclass
+class Request:
+    school_id: str
+    kind: FeeAdjustmentKind
+    value: Decimal
+
+
+@traced
+class AdjustEnrollmentFees:
+    def __init__(
+        self,
+        schools: SchoolRepository,
+        enrollments: EnrollmentRepository,
+        job_executor: JobExecutor,
+    ):
+        self.schools = schools
+        self.enrollments = enrollments
+        self.job_executor = job_executor
+
+    async def execute(self, request: Request) -> JobExecutionResult:
+        logger.info(
+            "About to adjust enrollment fees school: school_id=%s, kind=%s, value=%s",
+            request.school_id,
+            request.kind.name,
+            request.value,
+        )
+
+        adjustment = FeeAdjustment.of(kind=request.kind, value=request.value)
+
+        school_query = ByIdAndActive(id=request.school_id)
+        school = await self.schools.get(query=school_query)
+
+        if not school.is_active():
+            error = InvalidSchoolStatusError(school_id=request.school_id)
+
+            logger.error(error.message, error.attributes)
+
+            raise error
+
+        return await self.job_executor.run(
+            job_id=f"adjust-enrollment-fees|school:{request.school_id}|at:{datetime.now().isoformat()}",
+            job_name="AdjustEnrollmentFees",
+            generator=self.__adjust_fees(request.school_id, adjustment),
+        )
+
+    async def __adjust_fees(
+        self, school_id: str, adjustment: FeeAdjustment
+    ) -> AsyncGenerator[JobItemResult, None]:
+        after_id = None
+        chunk = 0
+        adjusted = 0
+
+        while True:
+            chunk += 1
+            started_job_item = StartedJobItem(
+                id=f"school:{school_id}|chunk:{chunk}|after:{after_id}",
+                started_at=datetime.now(),
+            )
+
+            try:
+                adjusted_ids = await self.enrollments.adjust_fees(
+                    school_id=school_id,
+                    adjustment=adjustment,
+                    after_id=after_id,
+                    limit=ENROLLMENTS_CHUNK_SIZE,
+                )
+            except Exception as error:
+                # Without the chunk's last id there is no safe place to resume from
+                yield started_job_item.failed(
+                    finished_at=datetime.now(), error=str(error)
+                )
+                return
+
+            if not adjusted_ids:
+                return
+
+            adjusted += len(adjusted_ids)
+
+            logger.info(
+                "Adjusted enrollment fees chunk: school_id=%s, chunk=%s, enrollments=%s, total=%s",
+                school_id,
+                chunk,
+                len(adjusted_ids),
+                adjusted,
+            )
+
+            yield started_job_item.succeeded(finished_at=datetime.now())
+
+            if len(adjusted_ids) < ENROLLMENTS_CHUNK_SIZE:
+                return
+
+            after_id = adjusted_ids[-1]
@@ -8,6 +8,7 @@ from src.invoice.application.use_cases.create_invoice import (
     CreateInvoice,
     Request as CreateInvoiceRequest,
 )
+from src.invoice.domain.repository import InvoiceRepository
 from src.school.domain.errors import InvalidSchoolStatusError
 from src.school.domain.enrollment import (
     ActiveEnrollmentProjection,
@@ -15,11 +16,16 @@ from src.school.domain.enrollment import (
     Enrollment,
     EnrollmentRepository,
 )
+from src.shared.errors.application import AlreadyExistsError
 from src.shared.logging.log import Logger
+from src.shared.pagination.model import PageRequest
 from src.school.domain.repository import ByIdAndActive, SchoolRepository
+from src.shared.tracing.tracer import traced
 
 logger = Logger(__name__)
 
+ENROLLMENTS_PAGE_SIZE = 1000
+
 
 @dataclass
 class Request:
@@ -27,22 +33,27 @@ class Request:
     period: date
 
 
+@traced
 class GenerateInvoices:
     def __init__(
         self,
         schools: SchoolRepository,
         enrollments: EnrollmentRepository,
+        invoices: InvoiceRepository,
         create_invoice: CreateInvoice,
         job_executor: JobExecutor,
     ):
         self.schools = schools
         self.enrollments = enrollments
+        self.invoices = invoices
         self.create_invoice = create_invoice
         self.job_executor = job_executor
 
     async def execute(self, request: Request) -> Enrollment:
         logger.info(
-            f"About to generate invoices school: school_id={request.school_id}, period={request.period}"
+            "About to generate invoices school: school_id=%s, period=%s",
+            request.school_id,
+            request.period,
         )
 
         school_query = ByIdAndActive(id=request.school_id)
@@ -68,34 +79,70 @@ class GenerateInvoices:
 
         while True:
             next_cursor, enrollments = await self.enrollments.list_active(
-                query=BySchoolId(request.school_id), cursor=cursor
+                query=BySchoolId(request.school_id),
+                page=PageRequest(limit=ENROLLMENTS_PAGE_SIZE, cursor=cursor),
             )
 
-            for enrollment in enrollments:
-                yield await self.__generate_invoice(enrollment, request.period)
+            async for item in self.__generate_page(enrollments, request.period):
+                yield item
 
             if not next_cursor:
                 break
 
             cursor = next_cursor
 
-    async def __generate_invoice(
-        self, enrollment: ActiveEnrollmentProjection, period: date
-    ) -> JobItemResult:
-        started_job_item = StartedJobItem(
-            id=f"erollment:{enrollment.id}|period:{period}",
-            started_at=datetime.now(),
-        )
+    async def __generate_page(
+        self, enrollments: list[ActiveEnrollmentProjection], period: date
+    ) -> AsyncGenerator[JobItemResult, None]:
+        events = []
+        started_job_items = []
 
-        try:
-            create_invoice_request = CreateInvoiceRequest(
-                school_id=enrollment.school_id,
-                student_id=enrollment.student_id,
-                amount=enrollment.monthly_fee,
-                due_date=period,
+        for enrollment in enrollments:
+            started_job_item = StartedJobItem(
+                id=f"erollment:{enrollment.id}|period:{period}",
+                started_at=datetime.now(),
             )
-            await self.create_invoice.execute(request=create_invoice_request)
 
-            return started_job_item.succeeded(finished_at=datetime.now())
+            try:
+                create_invoice_request = CreateInvoiceRequest(
+                    school_id=enrollment.school_id,
+                    student_id=enrollment.student_id,
+                    amount=enrollment.monthly_fee,
+                    due_date=period,
+                )
+                event, _ = await self.create_invoice.prepare(
+                    request=create_invoice_request
+                )
+
+                events.append(event)
+                started_job_items.append(started_job_item)
+            except Exception as error:
+                yield started_job_item.failed(
+                    finished_at=datetime.now(), error=str(error)
+                )
+
+        if not events:
+            return
+
+        try:
+            existing_ids = await self.invoices.update_many(events)
         except Exception as error:
-            return started_job_item.failed(finished_at=datetime.now(), error=str(error))
+            for started_job_item in started_job_items:
+                yield started_job_item.failed(
+                    finished_at=datetime.now(), error=str(error)
+                )
+
+            return
+
+        # Created meanwhile, by a concurrent run or request, the rest of the page is kept
+        for event, started_job_item in zip(events, started_job_items):
+            if event.id in existing_ids:
+                error = AlreadyExistsError(
+                    resource="Invoice", attributes={"id": event.id}
+                )
+
+                yield started_job_item.failed(
+                    finished_at=datetime.now(), error=str(error)
+                )
+            else:
+                yield started_job_item.succeeded(finished_at=datetime.now())
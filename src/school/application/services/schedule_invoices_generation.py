@@ -0,0 +1,41 @@
+from src.school.application.services.generate_invoices import Request
+from src.school.domain.errors import InvalidSchoolStatusError
+from src.school.domain.repository import ByIdAndActive, SchoolRepository
+from src.shared.logging.log import Logger
+from src.shared.pubsub.publisher import Publisher
+from src.shared.tracing.tracer import traced
+
+logger = Logger(__name__)
+
+GENERATE_INVOICES_TOPIC = "school.invoices.requested"
+
+
+@traced
+class ScheduleInvoicesGeneration:
+    """Hands the invoices generation over to the worker once the school is validated"""
+
+    def __init__(self, schools: SchoolRepository, publisher: Publisher):
+        self.schools = schools
+        self.publisher = publisher
+
+    async def execute(self, request: Request) -> None:
+        logger.info(
+            "About to schedule invoices generation school: school_id=%s, period=%s",
+            request.school_id,
+            request.period,
+        )
+
+        school_query = ByIdAndActive(id=request.school_id)
+        school = await self.schools.get(query=school_query)
+
+        if not school.is_active():
+            error = InvalidSchoolStatusError(school_id=request.school_id)
+
+            logger.error(error.message, error.attributes)
+
+            raise error
+
+        await self.publisher.publish(
+            subscription=GENERATE_INVOICES_TOPIC,
+            data={"school": request.school_id, "period": request.period.isoformat()},
+        )
@@ -2,6 +2,7 @@ from dataclasses import dataclass
 
 from src.school.domain.enrollment import Enrollment, EnrollmentRepository
 from src.shared.logging.log import Logger
+from src.shared.tracing.tracer import traced
 
 logger = Logger(__name__)
 
@@ -12,6 +13,7 @@ class Request:
     student_id: str
 
 
+@traced
 class DropEnrollment:
     def __init__(
         self,
@@ -21,7 +23,9 @@ class DropEnrollment:
 
     async def execute(self, request: Request) -> Enrollment:
         logger.info(
-            f"About to drop enrollment: school_id={request.school_id}, student_id={request.student_id}"
+            "About to drop enrollment: school_id=%s, student_id=%s",
+            request.school_id,
+            request.student_id,
         )
 
         enrollment = await self.enrollments.get(
@@ -2,16 +2,18 @@ from src.shared.errors.business import BusinessError
 from src.shared.logging.log import Logger
 from src.school.domain.repository import SchoolRepository, ById
 from src.school.domain.model import School
+from src.shared.tracing.tracer import traced
 
 logger = Logger(__name__)
 
 
+@traced
 class DropSchool:
     def __init__(self, schools: SchoolRepository):
         self.schools = schools
 
     async def execute(self, school_id: str) -> School:
-        logger.info(f"About to drop a school: id={school_id}")
+        logger.info("About to drop a school: id=%s", school_id)
 
         query = ById(id=school_id)
         school = await self.schools.get(query=query)
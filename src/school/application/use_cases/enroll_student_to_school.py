@@ -1,3 +1,4 @@
+import asyncio
 from dataclasses import dataclass
 from decimal import Decimal
 
@@ -7,6 +8,8 @@ from src.school.domain.enrollment import Enrollment, EnrollmentRepository
 from src.shared.logging.log import Logger
 from src.school.domain.repository import ByIdAndActive, SchoolRepository
 from src.student.domain.repository import ById, StudentRepository
+from src.shared.concurrency import result_of
+from src.shared.tracing.tracer import traced
 
 logger = Logger(__name__)
 
@@ -18,7 +21,11 @@ class Request:
     monthly_fee: Decimal
 
 
+@traced
 class EnrollStudentToSchool:
+    """The three lookups are independent and run concurrently, the repositories must
+    not share a session. Their errors are raised in the order they are checked"""
+
     def __init__(
         self,
         schools: SchoolRepository,
@@ -31,14 +38,21 @@ class EnrollStudentToSchool:
 
     async def execute(self, request: Request) -> Enrollment:
         logger.info(
-            f"About to enroll student to school: school_id={request.school_id}, student_id={request.student_id}"
+            "About to enroll student to school: school_id=%s, student_id=%s",
+            request.school_id,
+            request.student_id,
         )
 
-        exists_enrollment = await self.enrollments.exists(
-            school_id=request.school_id, student_id=request.student_id
+        exists_enrollment, school, student = await asyncio.gather(
+            self.enrollments.exists(
+                school_id=request.school_id, student_id=request.student_id
+            ),
+            self.schools.get(query=ByIdAndActive(id=request.school_id)),
+            self.students.get(query=ById(id=request.student_id)),
+            return_exceptions=True,
         )
 
-        if exists_enrollment:
+        if result_of(exists_enrollment):
             error = AlreadyExistsError(
                 resource="Enrollment",
                 attributes={
@@ -51,11 +65,8 @@ class EnrollStudentToSchool:
 
             raise error
 
-        school_query = ByIdAndActive(id=request.school_id)
-        school = await self.schools.get(query=school_query)
-
-        student_query = ById(id=request.student_id)
-        student = await self.students.get(query=student_query)
+        school = result_of(school)
+        student = result_of(student)
 
         if not school.is_active() or not student.is_active():
             error = InvalidEnrollmentError(
@@ -0,0 +1,126 @@
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+
+from src.shared.errors.application import AlreadyExistsError, NotFoundError
+from src.school.domain.errors import InvalidEnrollmentError, InvalidSchoolStatusError
+from src.school.domain.enrollment import Enrollment, EnrollmentRepository
+from src.shared.logging.log import Logger
+from src.school.domain.repository import ByIdAndActive, SchoolRepository
+from src.student.domain.model import StudentStatus
+from src.student.domain.repository import StudentRepository
+from src.shared.tracing.tracer import traced
+
+logger = Logger(__name__)
+
+
+@dataclass
+class StudentEnrollment:
+    student_id: str
+    monthly_fee: Decimal
+
+
+@dataclass
+class Request:
+    school_id: str
+    enrollments: list[StudentEnrollment]
+
+
+@dataclass
+class EnrollmentResult:
+    student_id: str
+    enrollment: Enrollment | None = None
+    code: str | None = None
+    message: str | None = None
+
+
+@traced
+class EnrollStudentsToSchool:
+    def __init__(
+        self,
+        schools: SchoolRepository,
+        enrollments: EnrollmentRepository,
+        students: StudentRepository,
+    ):
+        self.schools = schools
+        self.students = students
+        self.enrollments = enrollments
+
+    async def execute(self, request: Request) -> list[EnrollmentResult]:
+        logger.info(
+            "About to enroll students to school: school_id=%s, students=%s",
+            request.school_id,
+            len(request.enrollments),
+        )
+
+        school_query = ByIdAndActive(id=request.school_id)
+        school = await self.schools.get(query=school_query)
+
+        if not school.is_active():
+            error = InvalidSchoolStatusError(school_id=request.school_id)
+
+            logger.error(error.message, error.attributes)
+
+            raise error
+
+        statuses = await self.students.find_statuses(
+            ids=list({item.student_id for item in request.enrollments})
+        )
+
+        at = datetime.now()
+        results: list[EnrollmentResult] = []
+        requested_student_ids = set()
+
+        for item in request.enrollments:
+            attributes = {"school_id": request.school_id, "student_id": item.student_id}
+
+            if item.student_id in requested_student_ids:
+                error = AlreadyExistsError(resource="Enrollment", attributes=attributes)
+            elif item.student_id not in statuses:
+                error = NotFoundError(resource="Student", attributes=attributes)
+            elif statuses[item.student_id] != StudentStatus.ACTIVE:
+                error = InvalidEnrollmentError(**attributes)
+            else:
+                error = None
+
+            requested_student_ids.add(item.student_id)
+
+            if error is not None:
+                results.append(
+                    EnrollmentResult(
+                        student_id=item.student_id,
+                        code=error.code,
+                        message=error.message,
+                    )
+                )
+                continue
+
+            enrollment = Enrollment.of(
+                school_id=request.school_id,
+                student_id=item.student_id,
+                monthly_fee=item.monthly_fee,
+                at=at,
+            )
+            results.append(
+                EnrollmentResult(student_id=item.student_id, enrollment=enrollment)
+            )
+
+        inserted_ids = await self.enrollments.insert_many(
+            [result.enrollment for result in results if result.enrollment]
+        )
+
+        for result in results:
+            if result.enrollment and result.enrollment.id not in inserted_ids:
+                error = AlreadyExistsError(
+                    resource="Enrollment",
+                    attributes={
+                        "school_id": request.school_id,
+                        "student_id": result.student_id,
+                    },
+                )
+
+                result.enrollment = None
+                result.code = error.code
+                result.message = error.message
+
+        return results
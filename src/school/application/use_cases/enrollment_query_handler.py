@@ -1,11 +1,14 @@
+from src.shared.pagination.model import PageRequest
 from src.school.domain.enrollment import (
     ActiveEnrollmentProjection,
     Enrollment,
     EnrollmentRepository,
     EnrollmentsQuery,
 )
+from src.shared.tracing.tracer import traced
 
 
+@traced
 class EnrollmentQueryHandler:
     def __init__(self, enrollments: EnrollmentRepository):
         self.enrollments = enrollments
@@ -17,6 +20,6 @@ class EnrollmentQueryHandler:
         return await self.enrollments.find(student_id=student_id, school_id=school_id)
 
     async def list(
-        self, query: EnrollmentsQuery, next_cursor: str | None
+        self, query: EnrollmentsQuery, page: PageRequest
     ) -> tuple[str | None, list[ActiveEnrollmentProjection]]:
-        return await self.enrollments.list_active(query=query, cursor=next_cursor)
+        return await self.enrollments.list_active(query=query, page=page)
@@ -6,6 +6,7 @@ from src.shared.errors.application import AlreadyExistsError
 from src.shared.logging.log import Logger
 from src.school.domain.repository import ByEmail, SchoolRepository
 from src.school.domain.model import School
+from src.shared.tracing.tracer import traced
 
 logger = Logger(__name__)
 
@@ -18,13 +19,14 @@ class Request:
     address: str
 
 
+@traced
 class RegisterSchool:
     def __init__(self, schools: SchoolRepository, id_generator: IdGenerator):
         self.id_generator = id_generator
         self.schools = schools
 
     async def execute(self, request: Request) -> School:
-        logger.info(f"About to register school: email={request.email}")
+        logger.info("About to register school: email=%s", request.email)
 
         query = ByEmail(email=request.email)
         exists_school = await self.schools.exists(query=query)
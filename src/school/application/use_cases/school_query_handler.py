@@ -1,7 +1,12 @@
+from datetime import datetime
+
+from src.shared.pagination.model import PageRequest
 from src.school.domain.repository import SchoolRepository, SchoolQuery, SchoolsQuery
 from src.school.domain.model import School
+from src.shared.tracing.tracer import traced
 
 
+@traced
 class SchoolQueryHandler:
     def __init__(self, schools: SchoolRepository):
         self.schools = schools
@@ -12,5 +17,10 @@ class SchoolQueryHandler:
     async def find(self, query: SchoolQuery) -> School | None:
         return await self.schools.find(query=query)
 
-    async def list(self, query: SchoolsQuery) -> list[School]:
-        return await self.schools.list(query=query)
+    async def version(self, id: str) -> datetime | None:
+        return await self.schools.version(id=id)
+
+    async def list(
+        self, query: SchoolsQuery, page: PageRequest
+    ) -> tuple[str | None, list[School]]:
+        return await self.schools.list(query=query, page=page)
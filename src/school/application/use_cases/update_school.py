@@ -1,10 +1,11 @@
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 
 from src.shared.contact.model import Contact
 from src.shared.id.generator import IdGenerator
 from src.shared.logging.log import Logger
 from src.school.domain.repository import ById, SchoolRepository
 from src.school.domain.model import School
+from src.shared.tracing.tracer import traced
 
 logger = Logger(__name__)
 
@@ -18,13 +19,14 @@ class Request:
     address: str | None
 
 
+@traced
 class UpdateSchool:
     def __init__(self, schools: SchoolRepository, id_generator: IdGenerator):
         self.schools = schools
         self.id_generator = id_generator
 
     async def execute(self, request: Request) -> School:
-        logger.info(f"About to update a school: request={asdict(request)}")
+        logger.info("About to update a school: request=%s", request)
 
         query = ById(id=request.id)
         school = await self.schools.get(query=query)
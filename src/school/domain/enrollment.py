@@ -1,10 +1,12 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
-from decimal import Decimal
+from decimal import ROUND_HALF_UP, Decimal
+from enum import Enum
 
 from src.shared.errors.application import NotFoundError
-from src.school.domain.errors import InvalidEnrollmentError
+from src.shared.pagination.model import PageRequest
+from src.school.domain.errors import InvalidEnrollmentError, InvalidFeeAdjustmentError
 
 
 @dataclass(frozen=True)
@@ -77,6 +79,36 @@ class Enrollment:
         return self.deleted_at is None
 
 
+class FeeAdjustmentKind(Enum):
+    PERCENTAGE = "PERCENTAGE"
+    ABSOLUTE = "ABSOLUTE"
+
+
+@dataclass(frozen=True)
+class FeeAdjustment:
+    kind: FeeAdjustmentKind
+    value: Decimal
+
+    @staticmethod
+    def of(kind: FeeAdjustmentKind, value: Decimal) -> "FeeAdjustment":
+        if kind == FeeAdjustmentKind.PERCENTAGE and value <= -100:
+            raise InvalidFeeAdjustmentError(kind=kind.name, value=value)
+
+        return FeeAdjustment(kind=kind, value=value)
+
+    def apply(self, fee: Decimal) -> Decimal:
+        match self.kind:
+            case FeeAdjustmentKind.PERCENTAGE:
+                new_fee = fee * self.factor()
+            case FeeAdjustmentKind.ABSOLUTE:
+                new_fee = fee + self.value
+
+        return max(new_fee, Decimal(0)).quantize(Decimal("0.01"), ROUND_HALF_UP)
+
+    def factor(self) -> Decimal:
+        return 1 + self.value / 100
+
+
 @dataclass(frozen=True)
 class ActiveEnrollmentProjection:
     id: str
@@ -121,10 +153,29 @@ class EnrollmentRepository(ABC):
 
     @abstractmethod
     async def list_active(
-        self, query: EnrollmentsQuery, cursor: str | None
-    ) -> tuple[str, list[ActiveEnrollmentProjection]]:
+        self, query: EnrollmentsQuery, page: PageRequest
+    ) -> tuple[str | None, list[ActiveEnrollmentProjection]]:
         pass
 
     @abstractmethod
     async def save(self, school: Enrollment) -> Enrollment:
         pass
+
+    @abstractmethod
+    async def adjust_fees(
+        self,
+        school_id: str,
+        adjustment: FeeAdjustment,
+        after_id: str | None,
+        limit: int,
+    ) -> list[str]:
+        """Adjusts the fee of the next `limit` active enrollments of the school, ordered
+        by id, in one transaction. Returns the ids of the adjusted enrollments in that
+        order"""
+        pass
+
+    @abstractmethod
+    async def insert_many(self, enrollments: list[Enrollment]) -> set[str]:
+        """Inserts the enrollments in chunks within one transaction, skipping the ids
+        that already exist. Returns the ids of the inserted enrollments"""
+        pass
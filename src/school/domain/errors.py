@@ -1,3 +1,5 @@
+from decimal import Decimal
+
 from src.shared.errors.business import BusinessError
 
 
@@ -17,6 +19,14 @@ def InvalidEnrollmentError(school_id: str, student_id: str) -> BusinessError:
     )
 
 
+def InvalidFeeAdjustmentError(kind: str, value: Decimal) -> BusinessError:
+    return BusinessError(
+        code="InvalidFeeAdjustmentError",
+        message="The fee adjustment would result in a negative fee",
+        attributes={"kind": kind, "value": str(value)},
+    )
+
+
 def InvalidSchoolStatusError(school_id: str) -> BusinessError:
     return BusinessError(
         code="SchoolInvalidStatusError",
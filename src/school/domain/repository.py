@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
 from dataclasses import asdict, dataclass
+from datetime import datetime
 
 from src.shared.errors.application import NotFoundError
+from src.shared.pagination.model import PageRequest
 from src.school.domain.model import School, SchoolStatus
 
 
@@ -33,6 +35,14 @@ class ByStatus(SchoolsQuery):
     status: SchoolStatus
 
 
+@dataclass
+class ByCriteria(SchoolsQuery):
+    status: SchoolStatus
+    name_prefix: str | None = None
+    created_from: datetime | None = None
+    created_to: datetime | None = None
+
+
 class SchoolRepository(ABC):
     async def get(self, query: SchoolQuery) -> School:
         found_school = await self.find(query)
@@ -51,7 +61,14 @@ class SchoolRepository(ABC):
         pass
 
     @abstractmethod
-    async def list(self, query: SchoolsQuery) -> list[School]:
+    async def version(self, id: str) -> datetime | None:
+        """Last update of the school, for conditional reads"""
+        pass
+
+    @abstractmethod
+    async def list(
+        self, query: SchoolsQuery, page: PageRequest
+    ) -> tuple[str | None, list[School]]:
         pass
 
     @abstractmethod
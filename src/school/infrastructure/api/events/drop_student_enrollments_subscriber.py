@@ -1,10 +1,10 @@
+from contextlib import asynccontextmanager
 from datetime import datetime
-import json
-from typing import AsyncGenerator
+from typing import AsyncContextManager, AsyncGenerator, AsyncIterator, Callable
 from src.school.infrastructure.persistence.sqlalchemy.enrolment_repository import (
     SqlAlchemyEnrollmentRepository,
 )
-from src.shared.db.pg_sqlalchemy.connection import get_db
+from src.shared.db.pg_sqlalchemy.connection import DbSession
 from src.shared.job.persistence.sqlalchemy.job_repository import SqlAlchemyJobRepository
 from src.shared.job.executor import JobExecutor
 from src.school.application.use_cases.drop_enrollment import (
@@ -19,39 +19,31 @@ from src.school.application.use_cases.enrollment_query_handler import (
 from src.shared.pubsub.subscriber import Subscriber
 from src.shared.pubsub.impl.redis_subscriber import RedisSubscriber
 from src.shared.logging.log import Logger
+from src.shared.pagination.model import PageRequest
+from src.shared.serialization.json_codec import loads
 from src.student.application.use_cases.drop_student import DROP_STUDENT_TOPIC
 
-
 logger = Logger(__name__)
 
+ENROLLMENTS_PAGE_SIZE = 1000
 
-class DropStudentEnrollmentsSubscriber:
+
+class DropStudentEnrollments:
     def __init__(
         self,
-        subscriber: Subscriber,
         enrollments: EnrollmentQueryHandler,
         drop_enrollment: DropEnrollment,
         job_executor: JobExecutor,
     ):
-        self.subscriber = subscriber
         self.enrollments = enrollments
         self.drop_enrollment = drop_enrollment
         self.job_executor = job_executor
 
-    async def run(self) -> None:
-        await self.subscriber.subscribe(DROP_STUDENT_TOPIC, self.__message_handler)
-
-    async def __message_handler(self, message: str) -> None:
-        logger.info(f"Message received {message}")
-
-        message_dict = json.loads(message)
-
-        dropped_student_id = message_dict.get("student")
-
+    async def execute(self, student_id: str) -> None:
         await self.job_executor.run(
-            job_id=f"drop_enrollment|student_id:{dropped_student_id}",
+            job_id=f"drop_enrollment|student_id:{student_id}",
             job_name="DropStudentEnrollments",
-            generator=self.__delete_enrollments(student_id=dropped_student_id),
+            generator=self.__delete_enrollments(student_id=student_id),
         )
 
     async def __delete_enrollments(
@@ -61,7 +53,8 @@ class DropStudentEnrollmentsSubscriber:
 
         while True:
             next_cursor, enrollments = await self.enrollments.list(
-                query=ByStudentId(student_id=student_id), next_cursor=cursor
+                query=ByStudentId(student_id=student_id),
+                page=PageRequest(limit=ENROLLMENTS_PAGE_SIZE, cursor=cursor),
             )
 
             for enrollment in enrollments:
@@ -92,18 +85,50 @@ class DropStudentEnrollmentsSubscriber:
             return started_job_item.failed(finished_at=datetime.now(), error=str(error))
 
 
-async def dropStudentEnrollmentsSubscriber():
-    async for db_session in get_db():
-        subscriber = RedisSubscriber()
+class DropStudentEnrollmentsSubscriber:
+    def __init__(
+        self,
+        subscriber: Subscriber,
+        handlers: Callable[[], AsyncContextManager[DropStudentEnrollments]],
+    ):
+        self.subscriber = subscriber
+        self.handlers = handlers
+
+    async def run(self) -> None:
+        await self.subscriber.subscribe(DROP_STUDENT_TOPIC, self.__message_handler)
+
+    async def __message_handler(self, message: str) -> None:
+        logger.info("Message received %s", message)
+
+        message_dict = loads(message)
+
+        dropped_student_id = message_dict.get("student")
+
+        # Own session per message, several can be processed at a time
+        async with self.handlers() as handler:
+            await handler.execute(student_id=dropped_student_id)
+
+
+@asynccontextmanager
+async def dropStudentEnrollments() -> AsyncIterator[DropStudentEnrollments]:
+    async with DbSession() as db_session:
         job_executor = JobExecutor(jobs=SqlAlchemyJobRepository(db_session))
 
         enrollments_repository = SqlAlchemyEnrollmentRepository(db_session)
         enrollments = EnrollmentQueryHandler(enrollments=enrollments_repository)
         drop_enrollment = DropEnrollment(enrollments=enrollments_repository)
 
-        return DropStudentEnrollmentsSubscriber(
-            subscriber=subscriber,
+        yield DropStudentEnrollments(
             enrollments=enrollments,
             drop_enrollment=drop_enrollment,
             job_executor=job_executor,
         )
+
+
+async def dropStudentEnrollmentsSubscriber(
+    concurrency: int = 1,
+) -> DropStudentEnrollmentsSubscriber:
+    return DropStudentEnrollmentsSubscriber(
+        subscriber=RedisSubscriber(concurrency=concurrency),
+        handlers=dropStudentEnrollments,
+    )
@@ -0,0 +1,80 @@
+from contextlib import asynccontextmanager
+from datetime import date
+from typing import AsyncContextManager, AsyncIterator, Callable
+
+from src.invoice.application.use_cases.create_invoice import CreateInvoice
+from src.invoice.infrastructure.persistence.sqlalchemy.repository import (
+    SqlAlchemyInvoiceRepository,
+)
+from src.school.application.services.generate_invoices import (
+    GenerateInvoices,
+    Request as GenerateInvoicesRequest,
+)
+from src.school.application.services.schedule_invoices_generation import (
+    GENERATE_INVOICES_TOPIC,
+)
+from src.school.infrastructure.persistence.sqlalchemy.enrolment_repository import (
+    SqlAlchemyEnrollmentRepository,
+)
+from src.school.infrastructure.persistence.sqlalchemy.repository import (
+    SqlAlchemySchoolRepository,
+)
+from src.shared.db.pg_sqlalchemy.connection import DbSession
+from src.shared.job.executor import JobExecutor
+from src.shared.job.persistence.sqlalchemy.job_repository import SqlAlchemyJobRepository
+from src.shared.logging.log import Logger
+from src.shared.pubsub.impl.redis_stream_subscriber import RedisStreamSubscriber
+from src.shared.pubsub.subscriber import Subscriber
+from src.shared.serialization.json_codec import loads
+
+logger = Logger(__name__)
+
+
+class GenerateInvoicesSubscriber:
+    def __init__(
+        self,
+        subscriber: Subscriber,
+        handlers: Callable[[], AsyncContextManager[GenerateInvoices]],
+    ):
+        self.subscriber = subscriber
+        self.handlers = handlers
+
+    async def run(self) -> None:
+        await self.subscriber.subscribe(GENERATE_INVOICES_TOPIC, self.__message_handler)
+
+    async def __message_handler(self, message: str) -> None:
+        logger.info("Message received %s", message)
+
+        message_dict = loads(message)
+
+        request = GenerateInvoicesRequest(
+            school_id=message_dict.get("school"),
+            period=date.fromisoformat(message_dict.get("period")),
+        )
+
+        # Own session per message, several can be processed at a time
+        async with self.handlers() as handler:
+            await handler.execute(request=request)
+
+
+@asynccontextmanager
+async def generateInvoices() -> AsyncIterator[GenerateInvoices]:
+    async with DbSession() as db_session:
+        invoices = SqlAlchemyInvoiceRepository(db_session)
+
+        yield GenerateInvoices(
+            schools=SqlAlchemySchoolRepository(db_session),
+            enrollments=SqlAlchemyEnrollmentRepository(db_session),
+            invoices=invoices,
+            create_invoice=CreateInvoice(invoices=invoices),
+            job_executor=JobExecutor(jobs=SqlAlchemyJobRepository(db_session)),
+        )
+
+
+async def generateInvoicesSubscriber(
+    concurrency: int = 1,
+) -> GenerateInvoicesSubscriber:
+    return GenerateInvoicesSubscriber(
+        subscriber=RedisStreamSubscriber(concurrency=concurrency),
+        handlers=generateInvoices,
+    )
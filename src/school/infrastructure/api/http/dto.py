@@ -1,7 +1,17 @@
 from datetime import date
 from decimal import Decimal
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
+from src.school.domain.enrollment import (
+    ActiveEnrollmentProjection,
+    FeeAdjustmentKind,
+)
+from src.school.domain.model import School
+from src.school.application.use_cases.enroll_students_to_school import (
+    EnrollmentResult,
+    Request as EnrollStudentsToSchoolRequest,
+    StudentEnrollment,
+)
 from src.shared.contact.model import ContactDto, PartialContactDto
 
 
@@ -20,5 +30,44 @@ class EnrollStudentToSchoolDto(BaseModel):
     monthly_fee: Decimal
 
 
+class EnrollStudentsToSchoolDto(BaseModel):
+    enrollments: list[EnrollStudentToSchoolDto] = Field(
+        ..., min_length=1, max_length=5000
+    )
+
+    def as_enroll_students_to_school_request(
+        self, school_id: str
+    ) -> EnrollStudentsToSchoolRequest:
+        return EnrollStudentsToSchoolRequest(
+            school_id=school_id,
+            enrollments=[
+                StudentEnrollment(
+                    student_id=enrollment.student_id,
+                    monthly_fee=enrollment.monthly_fee,
+                )
+                for enrollment in self.enrollments
+            ],
+        )
+
+
+class AdjustEnrollmentFeesDto(BaseModel):
+    kind: FeeAdjustmentKind
+    value: Decimal
+
+
 class BillPeriodDto(BaseModel):
     period: date
+
+
+class EnrollmentResultsDto(BaseModel):
+    results: list[EnrollmentResult]
+
+
+class EnrollmentsPageDto(BaseModel):
+    enrollments: list[ActiveEnrollmentProjection]
+    next_cursor: str | None
+
+
+class SchoolsPageDto(BaseModel):
+    schools: list[School]
+    next_cursor: str | None
@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends
+from datetime import datetime
+from fastapi import APIRouter, Depends, Request as HttpRequest
 
 from src.shared.job.executor import JobExecutor
 from src.shared.job.persistence.sqlalchemy.job_repository import get_job_repository
@@ -8,23 +9,43 @@ from src.invoice.domain.repository import InvoiceRepository
 from src.invoice.infrastructure.persistence.sqlalchemy.repository import (
     get_invoice_repository,
 )
+from src.school.application.services.adjust_enrollment_fees import (
+    AdjustEnrollmentFees,
+    Request as AdjustEnrollmentFeesRequest,
+)
 from src.school.application.services.generate_invoices import (
     GenerateInvoices,
     Request as GenerateInvoicesRequest,
 )
+from src.school.application.services.schedule_invoices_generation import (
+    ScheduleInvoicesGeneration,
+)
 from src.school.application.use_cases.enroll_student_to_school import (
     EnrollStudentToSchool,
     Request as EnrollStudentToSchoolRequest,
 )
-from src.school.domain.enrollment import EnrollmentRepository
+from src.school.application.use_cases.enroll_students_to_school import (
+    EnrollStudentsToSchool,
+)
+from src.school.application.use_cases.enrollment_query_handler import (
+    EnrollmentQueryHandler,
+)
+from src.school.domain.enrollment import BySchoolId, Enrollment, EnrollmentRepository
 from src.school.infrastructure.persistence.sqlalchemy.enrolment_repository import (
+    get_enrollment_replica_repository,
     get_enrollment_repository,
 )
-from src.school.domain.model import SchoolStatus
+from src.school.domain.model import School, SchoolStatus
 from src.shared.id.generator import IdGenerator
+from src.shared.http_cache.conditional_get import conditional_get
+from src.shared.http_cache.impl.redis_response_cache import create_response_cache
+from src.shared.http_cache.response_cache import ResponseCache
+from src.shared.pagination.model import PageLimits
 from src.shared.id.ulid_generator import get_id_generator
-from src.school.domain.repository import ById, ByStatus, SchoolRepository
+from src.school.domain.repository import ByCriteria, ById, SchoolRepository
 from src.school.infrastructure.persistence.sqlalchemy.repository import (
+    get_school_reader,
+    get_school_replica_repository,
     get_school_repository,
 )
 from src.school.application.use_cases.register_school import (
@@ -38,18 +59,35 @@ from src.school.application.use_cases.update_school import (
     Request as UpdateSchoolRequest,
 )
 from src.school.infrastructure.api.http.dto import (
+    AdjustEnrollmentFeesDto,
     BillPeriodDto,
     CreateSchoolDto,
     EnrollStudentToSchoolDto,
+    EnrollStudentsToSchoolDto,
+    EnrollmentResultsDto,
+    EnrollmentsPageDto,
+    SchoolsPageDto,
     UpdateSchoolDto,
 )
+from src.shared.lifecycle import is_enabled
+from src.shared.pubsub.impl.redis_publisher import create_durable_publisher
+from src.shared.pubsub.publisher import Publisher
 from src.student.domain.repository import StudentRepository
 from src.student.infrastructure.persistence.sqlalchemy.repository import (
+    get_student_reader,
     get_student_repository,
 )
 
+from src.shared.http.json_response import JsonRoute
+from src.shared.http.json_stream import JsonStreamResponse
 
-router = APIRouter()
+router = APIRouter(route_class=JsonRoute)
+
+SCHOOLS_PAGE_LIMITS = PageLimits(default=20, maximum=100)
+ENROLLMENTS_PAGE_LIMITS = PageLimits(default=50, maximum=1000)
+
+# Invoices generation runs in `python -m src.worker` instead of the request
+GENERATE_INVOICES_IN_WORKER = is_enabled("GENERATE_INVOICES_IN_WORKER", default=False)
 
 
 def get_register_school_use_case(
@@ -73,14 +111,22 @@ def get_update_school_use_case(
 
 
 def get_school_query_handler(
-    schools_repository: SchoolRepository = Depends(get_school_repository),
+    schools_repository: SchoolRepository = Depends(get_school_replica_repository),
 ) -> SchoolQueryHandler:
     return SchoolQueryHandler(schools=schools_repository)
 
 
+def get_enrollment_query_handler(
+    enrollment_repository: EnrollmentRepository = Depends(
+        get_enrollment_replica_repository
+    ),
+) -> EnrollmentQueryHandler:
+    return EnrollmentQueryHandler(enrollments=enrollment_repository)
+
+
 def get_enroll_student_to_school_use_case(
-    schools_repository: SchoolRepository = Depends(get_school_repository),
-    students_repository: StudentRepository = Depends(get_student_repository),
+    schools_repository: SchoolRepository = Depends(get_school_reader),
+    students_repository: StudentRepository = Depends(get_student_reader),
     enrollment_repository: EnrollmentRepository = Depends(get_enrollment_repository),
 ) -> SchoolQueryHandler:
     return EnrollStudentToSchool(
@@ -90,16 +136,22 @@ def get_enroll_student_to_school_use_case(
     )
 
 
+def get_enroll_students_to_school_use_case(
+    schools_repository: SchoolRepository = Depends(get_school_repository),
+    students_repository: StudentRepository = Depends(get_student_repository),
+    enrollment_repository: EnrollmentRepository = Depends(get_enrollment_repository),
+) -> EnrollStudentsToSchool:
+    return EnrollStudentsToSchool(
+        schools=schools_repository,
+        enrollments=enrollment_repository,
+        students=students_repository,
+    )
+
+
 def get_create_invoice_use_case(
-    student_repository: StudentRepository = Depends(get_student_repository),
-    school_repository: SchoolRepository = Depends(get_school_repository),
     invoice_repository: InvoiceRepository = Depends(get_invoice_repository),
 ) -> CreateInvoice:
-    return CreateInvoice(
-        students=student_repository,
-        schools=school_repository,
-        invoices=invoice_repository,
-    )
+    return CreateInvoice(invoices=invoice_repository)
 
 
 def get_job_executor(
@@ -111,18 +163,39 @@ def get_job_executor(
 def get_generate_invoices_service(
     schools_repository: SchoolRepository = Depends(get_school_repository),
     enrollment_repository: EnrollmentRepository = Depends(get_enrollment_repository),
+    invoice_repository: InvoiceRepository = Depends(get_invoice_repository),
     create_invoice: CreateInvoice = Depends(get_create_invoice_use_case),
     job_executor: JobExecutor = Depends(get_job_executor),
 ) -> GenerateInvoices:
     return GenerateInvoices(
         schools=schools_repository,
         enrollments=enrollment_repository,
+        invoices=invoice_repository,
         create_invoice=create_invoice,
         job_executor=job_executor,
     )
 
 
-@router.post("/schools")
+def get_schedule_invoices_generation_service(
+    schools_repository: SchoolRepository = Depends(get_school_repository),
+    publisher: Publisher = Depends(create_durable_publisher),
+) -> ScheduleInvoicesGeneration:
+    return ScheduleInvoicesGeneration(schools=schools_repository, publisher=publisher)
+
+
+def get_adjust_enrollment_fees_service(
+    schools_repository: SchoolRepository = Depends(get_school_repository),
+    enrollment_repository: EnrollmentRepository = Depends(get_enrollment_repository),
+    job_executor: JobExecutor = Depends(get_job_executor),
+) -> AdjustEnrollmentFees:
+    return AdjustEnrollmentFees(
+        schools=schools_repository,
+        enrollments=enrollment_repository,
+        job_executor=job_executor,
+    )
+
+
+@router.post("/schools", response_model=School)
 async def create_school(
     dto: CreateSchoolDto,
     use_case: RegisterSchool = Depends(get_register_school_use_case),
@@ -139,7 +212,7 @@ async def create_school(
     return registered_school
 
 
-@router.post("/schools/{id}/enrollments/")
+@router.post("/schools/{id}/enrollments/", response_model=Enrollment)
 async def create_enrollment(
     id: str,
     dto: EnrollStudentToSchoolDto,
@@ -156,23 +229,79 @@ async def create_enrollment(
     return enrollment
 
 
-@router.post("/schools/{id}/invoices/")
+@router.post(
+    "/schools/{id}/enrollments:batch", response_model=EnrollmentResultsDto
+)
+async def create_enrollments(
+    id: str,
+    dto: EnrollStudentsToSchoolDto,
+    use_case: EnrollStudentsToSchool = Depends(get_enroll_students_to_school_use_case),
+):
+    request = dto.as_enroll_students_to_school_request(school_id=id)
+
+    results = await use_case.execute(request)
+
+    return {"results": results}
+
+
+@router.get("/schools/{id}/enrollments", response_model=EnrollmentsPageDto)
+async def get_school_enrollments(
+    id: str,
+    next_cursor: str | None = None,
+    limit: int | None = None,
+    query_handler: EnrollmentQueryHandler = Depends(get_enrollment_query_handler),
+):
+    page = ENROLLMENTS_PAGE_LIMITS.request(cursor=next_cursor, limit=limit)
+    updated_cursor, enrollments = await query_handler.list(
+        query=BySchoolId(school_id=id), page=page
+    )
+
+    return JsonStreamResponse(
+        {"enrollments": enrollments, "next_cursor": updated_cursor}
+    )
+
+
+# The job results hold their items by abstract type, which has no schema
+@router.patch("/schools/{id}/enrollments/fees", response_model=None)
+async def adjust_enrollment_fees(
+    id: str,
+    dto: AdjustEnrollmentFeesDto,
+    use_case: AdjustEnrollmentFees = Depends(get_adjust_enrollment_fees_service),
+):
+    request = AdjustEnrollmentFeesRequest(
+        school_id=id,
+        kind=dto.kind,
+        value=dto.value,
+    )
+
+    job_execution = await use_case.execute(request)
+
+    return job_execution
+
+
+@router.post("/schools/{id}/invoices/", response_model=None)
 async def create_invoices(
     id: str,
     dto: BillPeriodDto,
     use_case: GenerateInvoices = Depends(get_generate_invoices_service),
+    schedule_use_case: ScheduleInvoicesGeneration = Depends(
+        get_schedule_invoices_generation_service
+    ),
 ):
     request = GenerateInvoicesRequest(
         school_id=id,
         period=dto.period,
     )
 
-    await use_case.execute(request)
+    if GENERATE_INVOICES_IN_WORKER:
+        await schedule_use_case.execute(request)
+    else:
+        await use_case.execute(request)
 
     return None
 
 
-@router.delete("/schools/{id}")
+@router.delete("/schools/{id}", response_model=School)
 async def delete_school(
     id: str,
     use_case: DropSchool = Depends(get_drop_school_use_case),
@@ -182,7 +311,7 @@ async def delete_school(
     return dropped_school
 
 
-@router.patch("/schools/{id}")
+@router.patch("/schools/{id}", response_model=School)
 async def update_school(
     id: str,
     dto: UpdateSchoolDto,
@@ -200,20 +329,40 @@ async def update_school(
     return updated_school
 
 
-@router.get("/schools/{id}")
+@router.get("/schools/{id}", response_model=School)
 async def get_school(
     id: str,
+    http_request: HttpRequest,
     query_handler: SchoolQueryHandler = Depends(get_school_query_handler),
+    cache: ResponseCache = Depends(create_response_cache),
 ):
-    school = await query_handler.get(query=ById(id=id))
-
-    return school
+    return await conditional_get(
+        http_request,
+        cache,
+        resource="schools",
+        id=id,
+        version=lambda: query_handler.version(id=id),
+        find=lambda: query_handler.get(query=ById(id=id)),
+        version_of=lambda school: school.updated_at,
+    )
 
 
-@router.get("/schools")
+@router.get("/schools", response_model=SchoolsPageDto)
 async def get_schools(
+    next_cursor: str | None = None,
+    limit: int | None = None,
+    name_prefix: str | None = None,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
     query_handler: SchoolQueryHandler = Depends(get_school_query_handler),
 ):
-    students = await query_handler.list(query=ByStatus(status=SchoolStatus.ACTIVE))
+    query = ByCriteria(
+        status=SchoolStatus.ACTIVE,
+        name_prefix=name_prefix,
+        created_from=created_from,
+        created_to=created_to,
+    )
+    page = SCHOOLS_PAGE_LIMITS.request(cursor=next_cursor, limit=limit)
+    updated_cursor, schools = await query_handler.list(query=query, page=page)
 
-    return students
+    return JsonStreamResponse({"schools": schools, "next_cursor": updated_cursor})
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from src.shared.contact.model import ContactDbo
 from src.shared.db.pg_sqlalchemy.connection import BaseSqlModel
@@ -21,6 +21,17 @@ class SchoolDbo(BaseSqlModel):
     # Relationship to ContactDbo
     contact: Mapped[ContactDbo] = relationship("ContactDbo", lazy="joined")
 
+    __table_args__ = (
+        # Supports the (created_at, id) keyset pagination and created_at range filters
+        Index("ix_schools_created_at_id", "created_at", "id"),
+        # Supports name prefix (LIKE 'prefix%') filtering regardless of the collation
+        Index(
+            "ix_schools_name_prefix",
+            "name",
+            postgresql_ops={"name": "text_pattern_ops"},
+        ),
+    )
+
     @staticmethod
     def from_domain(school: School, at: datetime = datetime.now()) -> "SchoolDbo":
         return SchoolDbo(
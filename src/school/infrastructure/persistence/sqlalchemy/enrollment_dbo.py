@@ -1,6 +1,6 @@
 from datetime import datetime
 from decimal import Decimal
-from sqlalchemy import DECIMAL, DateTime, ForeignKey, String
+from sqlalchemy import DECIMAL, DateTime, ForeignKey, Index, Row, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from src.school.domain.enrollment import ActiveEnrollmentProjection, Enrollment
 from src.school.infrastructure.persistence.sqlalchemy.dbo import SchoolDbo
@@ -19,9 +19,24 @@ class EnrollmentDbo(BaseSqlModel):
     created_at: Mapped[datetime] = mapped_column()
     updated_at: Mapped[datetime] = mapped_column()
 
-    # Relationships
-    student: Mapped[StudentDbo] = relationship("StudentDbo", lazy="joined")
-    school: Mapped[SchoolDbo] = relationship("SchoolDbo", lazy="joined")
+    # Relationships. Not loaded unless explicitly requested through query options
+    student: Mapped[StudentDbo] = relationship("StudentDbo", lazy="noload")
+    school: Mapped[SchoolDbo] = relationship("SchoolDbo", lazy="noload")
+
+    __table_args__ = (
+        Index(
+            "ix_active_enrollments_school_id",
+            "school_id",
+            "id",
+            postgresql_where=deleted_at.is_(None),
+        ),
+        Index(
+            "ix_active_enrollments_student_id",
+            "student_id",
+            "id",
+            postgresql_where=deleted_at.is_(None),
+        ),
+    )
 
     @staticmethod
     def from_domain(enrollment: Enrollment) -> "EnrollmentDbo":
@@ -46,12 +61,22 @@ class EnrollmentDbo(BaseSqlModel):
             updated_at=self.updated_at,
         )
 
-    def as_read_projection(self) -> ActiveEnrollmentProjection:
+    @staticmethod
+    def read_projection_columns() -> tuple:
+        return (
+            EnrollmentDbo.id,
+            EnrollmentDbo.student_id,
+            EnrollmentDbo.school_id,
+            EnrollmentDbo.monthly_fee,
+        )
+
+    @staticmethod
+    def as_read_projection(row: Row) -> ActiveEnrollmentProjection:
         return ActiveEnrollmentProjection(
-            id=self.id,
-            student_id=self.student_id,
-            school_id=self.school_id,
-            monthly_fee=self.monthly_fee,
+            id=row.id,
+            student_id=row.student_id,
+            school_id=row.school_id,
+            monthly_fee=row.monthly_fee,
         )
 
     def as_dict(self) -> dict:
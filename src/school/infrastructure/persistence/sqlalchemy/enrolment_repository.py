@@ -1,6 +1,7 @@
 from dataclasses import asdict
 from fastapi import Depends
-from sqlalchemy import exists, select
+from datetime import datetime
+from sqlalchemy import Select, bindparam, exists, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.dialects.postgresql import insert
 
@@ -13,26 +14,65 @@ from src.school.domain.enrollment import (
     ByStudentId,
     EnrollmentsQuery,
     Enrollment,
+    FeeAdjustment,
+    FeeAdjustmentKind,
     EnrollmentRepository,
 )
-from src.shared.db.pg_sqlalchemy.connection import get_db
+from src.shared.db.pg_sqlalchemy.connection import get_db, get_replica_db
+from src.shared.db.pg_sqlalchemy.pagination import cursor_keys, page_of
+from src.shared.pagination.model import PageRequest
 from src.shared.logging.log import Logger
 from src.shared.errors.technical import TechnicalError
+from src.shared.tracing.tracer import traced
 
 logger = Logger(__name__)
 
+# Built once with bound parameters, so each call skips building the statement and
+# its cache key, and SQLAlchemy reuses the compiled SQL
+BY_SCHOOL_AND_STUDENT = (EnrollmentDbo.school_id == bindparam("school_id")) & (
+    EnrollmentDbo.student_id == bindparam("student_id")
+)
+ENROLLMENT_EXISTS = select(exists(EnrollmentDbo)).filter(BY_SCHOOL_AND_STUDENT)
+FIND_ENROLLMENT = select(EnrollmentDbo).filter(BY_SCHOOL_AND_STUDENT)
+
+# Rows per multi-row INSERT of insert_many. Each binds 7 parameters and asyncpg
+# takes at most 32767 per statement
+INSERT_ENROLLMENTS_CHUNK_SIZE = 4000
+
+
+def list_active_statement(owner_column, after_cursor: bool) -> Select:
+    statement = select(*EnrollmentDbo.read_projection_columns()).filter(
+        owner_column == bindparam("owner_id"),
+        EnrollmentDbo.deleted_at.is_(None),
+    )
+
+    if after_cursor:
+        statement = statement.where(EnrollmentDbo.id > bindparam("after_id"))
 
+    # One extra row tells whether there is a next page
+    return statement.order_by(EnrollmentDbo.id).limit(bindparam("limit"))
+
+
+LIST_ACTIVE = {
+    (query, after_cursor): list_active_statement(owner_column, after_cursor)
+    for query, owner_column in [
+        (BySchoolId, EnrollmentDbo.school_id),
+        (ByStudentId, EnrollmentDbo.student_id),
+    ]
+    for after_cursor in [False, True]
+}
+
+
+@traced
 class SqlAlchemyEnrollmentRepository(EnrollmentRepository):
     def __init__(self, session: AsyncSession):
         self.session = session
 
     async def exists(self, school_id: str, student_id: str) -> bool:
         try:
-            stmt = select(exists(EnrollmentDbo)).filter(
-                EnrollmentDbo.school_id == school_id,
-                EnrollmentDbo.student_id == student_id,
+            result = await self.session.execute(
+                ENROLLMENT_EXISTS, {"school_id": school_id, "student_id": student_id}
             )
-            result = await self.session.execute(stmt)
             return result.scalar() or False
         except Exception as e:
             error = TechnicalError(
@@ -48,11 +88,9 @@ class SqlAlchemyEnrollmentRepository(EnrollmentRepository):
 
     async def find(self, school_id: str, student_id: str) -> Enrollment:
         try:
-            db_query = select(EnrollmentDbo).filter(
-                EnrollmentDbo.school_id == school_id,
-                EnrollmentDbo.student_id == student_id,
+            result = await self.session.execute(
+                FIND_ENROLLMENT, {"school_id": school_id, "student_id": student_id}
             )
-            result = await self.session.execute(db_query)
             found_dbo = result.scalars().one_or_none()
 
             if found_dbo is None:
@@ -72,41 +110,33 @@ class SqlAlchemyEnrollmentRepository(EnrollmentRepository):
             raise error from e
 
     async def list_active(
-        self, query: EnrollmentsQuery, cursor: str | None
-    ) -> tuple[str, list[ActiveEnrollmentProjection]]:
-        page_size = 50
+        self, query: EnrollmentsQuery, page: PageRequest
+    ) -> tuple[str | None, list[ActiveEnrollmentProjection]]:
+        owner_id = self.__owner_id(query)
+        keys = cursor_keys(page, sort_columns=1)
+        statement = LIST_ACTIVE[(type(query), keys is not None)]
+        parameters = {
+            "owner_id": owner_id,
+            "limit": page.limit + 1,
+            **({"after_id": keys[0]} if keys else {}),
+        }
 
-        def with_cursor():
-            return (
-                select(EnrollmentDbo)
-                .filter(
-                    self.__parse_query(query),
-                    EnrollmentDbo.deleted_at.is_(None),
-                    EnrollmentDbo.id > cursor,
-                )
-                .order_by(EnrollmentDbo.id)
-                .limit(page_size)
-            )
+        try:
+            result = await self.session.execute(statement, parameters)
+            enrollments = [EnrollmentDbo.as_read_projection(row) for row in result]
 
-        def without_cursor():
-            return (
-                select(EnrollmentDbo)
-                .filter(
-                    self.__parse_query(query),
-                    EnrollmentDbo.deleted_at.is_(None),
-                )
-                .order_by(EnrollmentDbo.id)
-                .limit(page_size)
+            return page_of(enrollments, page, lambda enrollment: (enrollment.id,))
+        except Exception as e:
+            error = TechnicalError(
+                code="EnrollmentRepositoryError",
+                message=f"Fail listing active enrollments query={(str(query))}",
+                attributes=asdict(query),
+                cause=e,
             )
 
-        db_query = without_cursor() if not cursor else with_cursor()
-
-        result = await self.session.execute(db_query)
-        result = result.scalars().all()
-
-        next_cursor = result[-1].id if result and len(result) == page_size else None
+            logger.error(error)
 
-        return next_cursor, [dbo.as_read_projection() for dbo in result]
+            raise error from e
 
     async def save(self, school: Enrollment) -> Enrollment:
         try:
@@ -137,12 +167,120 @@ class SqlAlchemyEnrollmentRepository(EnrollmentRepository):
 
             raise error from e
 
-    def __parse_query(self, query: EnrollmentsQuery):
+    async def adjust_fees(
+        self,
+        school_id: str,
+        adjustment: FeeAdjustment,
+        after_id: str | None,
+        limit: int,
+    ) -> list[str]:
+        try:
+            chunk = (
+                select(EnrollmentDbo.id)
+                .filter(
+                    EnrollmentDbo.school_id == school_id,
+                    EnrollmentDbo.deleted_at.is_(None),
+                )
+                .order_by(EnrollmentDbo.id)
+                .limit(limit)
+            )
+
+            if after_id:
+                chunk = chunk.filter(EnrollmentDbo.id > after_id)
+
+            adjusted = (
+                update(EnrollmentDbo)
+                .where(EnrollmentDbo.id.in_(chunk.scalar_subquery()))
+                .values(
+                    monthly_fee=self.__adjusted_fee(adjustment),
+                    updated_at=datetime.now(),
+                )
+                .returning(EnrollmentDbo.id)
+                .cte("adjusted")
+            )
+
+            # Ordered by Postgres as the chunk was, the last id is where the next
+            # chunk starts after
+            adjust_fees_statement = select(adjusted.c.id).order_by(adjusted.c.id)
+
+            result = await self.session.execute(adjust_fees_statement)
+            adjusted_ids = list(result.scalars())
+
+            await self.session.commit()
+
+            return adjusted_ids
+        except Exception as e:
+            await self.session.rollback()
+
+            error = TechnicalError(
+                code="EnrollmentRepositoryError",
+                message=f"Fail adjusting enrollment fees school_id={school_id}",
+                attributes={"school_id": school_id, "after_id": after_id},
+                cause=e,
+            )
+
+            logger.error(error)
+
+            raise error from e
+
+    async def insert_many(self, enrollments: list[Enrollment]) -> set[str]:
+        if not enrollments:
+            return set()
+
+        try:
+            inserted_ids = set()
+
+            for start in range(0, len(enrollments), INSERT_ENROLLMENTS_CHUNK_SIZE):
+                insert_enrollments_statement = (
+                    insert(EnrollmentDbo)
+                    .values(
+                        [
+                            EnrollmentDbo.from_domain(enrollment).as_dict()
+                            for enrollment in enrollments[
+                                start : start + INSERT_ENROLLMENTS_CHUNK_SIZE
+                            ]
+                        ]
+                    )
+                    .on_conflict_do_nothing(index_elements=["id"])
+                    .returning(EnrollmentDbo.id)
+                )
+
+                result = await self.session.execute(insert_enrollments_statement)
+                inserted_ids.update(result.scalars())
+
+            await self.session.commit()
+
+            return inserted_ids
+        except Exception as e:
+            await self.session.rollback()
+
+            error = TechnicalError(
+                code="EnrollmentRepositoryError",
+                message=f"Fail saving a batch of school/student enrollments",
+                attributes={"ids": [enrollment.id for enrollment in enrollments]},
+                cause=e,
+            )
+
+            logger.error(error)
+
+            raise error from e
+
+    def __adjusted_fee(self, adjustment: FeeAdjustment):
+        """Mirrors FeeAdjustment.apply in SQL"""
+        match adjustment.kind:
+            case FeeAdjustmentKind.PERCENTAGE:
+                new_fee = EnrollmentDbo.monthly_fee * adjustment.factor()
+            case FeeAdjustmentKind.ABSOLUTE:
+                new_fee = EnrollmentDbo.monthly_fee + adjustment.value
+
+        return func.round(func.greatest(new_fee, 0), 2)
+
+    def __owner_id(self, query: EnrollmentsQuery) -> str:
         match query:
             case ByStudentId(student_id):
-                return EnrollmentDbo.student_id == student_id
+                return student_id
             case BySchoolId(school_id):
-                return EnrollmentDbo.school_id == school_id
+                return school_id
             case _:
                 raise ValueError(f"Invalid query {query}")
 
@@ -151,3 +289,9 @@ def get_enrollment_repository(
     session: AsyncSession = Depends(get_db),
 ) -> EnrollmentRepository:
     return SqlAlchemyEnrollmentRepository(session=session)
+
+
+def get_enrollment_replica_repository(
+    session: AsyncSession = Depends(get_replica_db),
+) -> EnrollmentRepository:
+    return SqlAlchemyEnrollmentRepository(session=session)
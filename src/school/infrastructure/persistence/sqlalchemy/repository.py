@@ -1,13 +1,23 @@
 from dataclasses import asdict
+from datetime import datetime
+from typing import Any, Callable
 from fastapi import Depends
-from sqlalchemy.orm import aliased
-from sqlalchemy import select, exists
+from sqlalchemy.orm import aliased, joinedload
+from sqlalchemy import Executable, bindparam, select, exists
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.shared.contact.model import Contact, ContactDbo
-from src.shared.db.pg_sqlalchemy.connection import get_db
+from src.shared.contact.model import ContactDbo
+from src.shared.contact.persistence.sqlalchemy.contact_store import (
+    SqlAlchemyContactStore,
+)
+from src.shared.db.pg_sqlalchemy.connection import get_db, get_read_db, get_replica_db
+from src.shared.db.pg_sqlalchemy.pagination import page_of, paginate
+from src.shared.pagination.model import PageRequest
 from src.shared.logging.log import Logger
 from src.shared.errors.technical import TechnicalError
+from src.shared.http_cache.impl.redis_response_cache import create_response_cache
+from src.shared.http_cache.response_cache import ResponseCache
 from src.school.domain.repository import (
+    ByCriteria,
     ByIdAndActive,
     SchoolRepository,
     ById,
@@ -18,19 +28,39 @@ from src.school.domain.repository import (
 )
 from src.school.infrastructure.persistence.sqlalchemy.dbo import SchoolDbo
 from src.school.domain.model import School, SchoolStatus
-from sqlalchemy.dialects.postgresql import insert
+from src.shared.tracing.tracer import traced
 
 logger = Logger(__name__)
 
-
+# Built once with bound parameters, so each call skips building the statement and
+# its cache key, and SQLAlchemy reuses the compiled SQL
+BY_ID = SchoolDbo.id == bindparam("id")
+BY_ID_AND_ACTIVE = BY_ID & (SchoolDbo.status == SchoolStatus.ACTIVE.name)
+SCHOOL_EXISTS = {
+    ById: select(exists(SchoolDbo).where(BY_ID)),
+    ByIdAndActive: select(exists(SchoolDbo).where(BY_ID_AND_ACTIVE)),
+}
+FIND_SCHOOL = {
+    ById: select(SchoolDbo).where(BY_ID),
+    ByIdAndActive: select(SchoolDbo).where(BY_ID_AND_ACTIVE),
+}
+SCHOOL_VERSION = select(SchoolDbo.updated_at).where(BY_ID)
+
+
+@traced
 class SqlAlchemySchoolRepository(SchoolRepository):
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, cache: ResponseCache | None = None):
         self.session = session
+        self.cache = cache
 
     async def exists(self, query: SchoolQuery) -> bool:
         try:
-            stmt = select(exists(SchoolDbo).where(self.__parse_single_query(query)))
-            result = await self.session.execute(stmt)
+            statement, parameters = self.__single_query_statement(
+                query,
+                SCHOOL_EXISTS,
+                lambda condition: select(exists(SchoolDbo).where(condition)),
+            )
+            result = await self.session.execute(statement, parameters)
             return result.scalar() or False
         except Exception as e:
             error = TechnicalError(
@@ -46,8 +76,12 @@ class SqlAlchemySchoolRepository(SchoolRepository):
 
     async def find(self, query: SchoolQuery) -> School | None:
         try:
-            db_query = select(SchoolDbo).where(self.__parse_single_query(query))
-            result = await self.session.execute(db_query)
+            statement, parameters = self.__single_query_statement(
+                query,
+                FIND_SCHOOL,
+                lambda condition: select(SchoolDbo).where(condition),
+            )
+            result = await self.session.execute(statement, parameters)
             result = result.scalar()
 
             if result is None:
@@ -66,13 +100,38 @@ class SqlAlchemySchoolRepository(SchoolRepository):
 
             raise error from e
 
-    async def list(self, query: SchoolsQuery) -> list[School]:
+    async def version(self, id: str) -> datetime | None:
+        try:
+            result = await self.session.execute(SCHOOL_VERSION, {"id": id})
+            return result.scalar()
+        except Exception as e:
+            error = TechnicalError(
+                code="SchoolRepositoryError",
+                message=f"Fail finding the school version id={id}",
+                attributes={"id": id},
+                cause=e,
+            )
+
+            logger.error(error)
+
+            raise error from e
+
+    async def list(
+        self, query: SchoolsQuery, page: PageRequest
+    ) -> tuple[str | None, list[School]]:
+        db_query = paginate(
+            select(SchoolDbo)
+            .options(joinedload(SchoolDbo.contact))
+            .where(*self.__parse_multiple_query(query)),
+            [SchoolDbo.created_at, SchoolDbo.id],
+            page,
+        )
+
         try:
-            db_query = select(SchoolDbo).where(self.__parse_multiple_query(query))
-            result = await self.session.execute(db_query)
-            result = result.scalars().all()
+            result = await self.session.stream_scalars(db_query)
+            schools = [school_dbo.as_domain() async for school_dbo in result]
 
-            return list(map(lambda school_dbo: school_dbo.as_domain(), result))
+            return page_of(schools, page, lambda school: (school.created_at, school.id))
         except Exception as e:
             error = TechnicalError(
                 code="SchoolRepositoryError",
@@ -87,23 +146,23 @@ class SqlAlchemySchoolRepository(SchoolRepository):
 
     async def save(self, school: School) -> School:
         try:
-            existing_contact_id = await self.__get_or_create_contact(school.contact)
-
             school_dbo = SchoolDbo.from_domain(school)
-            school_dbo.contact_id = existing_contact_id
-
-            upsert_student_statement = (
-                insert(SchoolDbo)
-                .values(**school_dbo.as_dict())
-                .on_conflict_do_update(
-                    index_elements=["id"],
-                    set_={**school_dbo.as_for_update_dict()},
-                )
+
+            upsert_school_statement = SqlAlchemyContactStore.upsert_with_owner(
+                owner=SchoolDbo,
+                values=school_dbo.as_dict(),
+                update_values=school_dbo.as_for_update_dict(),
+                contact=school.contact,
             )
 
-            await self.session.execute(upsert_student_statement)
+            result = await self.session.execute(upsert_school_statement)
+            school.contact.id = result.scalar_one()
+
             await self.session.commit()
 
+            if self.cache is not None:
+                await self.cache.invalidate("schools", [school.id])
+
             return school
         except Exception as e:
             error = TechnicalError(
@@ -117,14 +176,20 @@ class SqlAlchemySchoolRepository(SchoolRepository):
 
             raise error from e
 
+    def __single_query_statement(
+        self,
+        query: SchoolQuery,
+        statements: dict[type, Executable],
+        build: Callable[[Any], Executable],
+    ) -> tuple[Executable, dict]:
+        match query:
+            case ById(id) | ByIdAndActive(id):
+                return statements[type(query)], {"id": id}
+            case _:
+                return build(self.__parse_single_query(query)), {}
+
     def __parse_single_query(self, query: SchoolQuery):
         match query:
-            case ById(id):
-                return SchoolDbo.id == id
-            case ByIdAndActive(id):
-                return (SchoolDbo.id == id) & (
-                    SchoolDbo.status == SchoolStatus.ACTIVE.name
-                )
             case ByEmail(email):
                 contact_alias = aliased(ContactDbo)
                 return (
@@ -134,31 +199,44 @@ class SqlAlchemySchoolRepository(SchoolRepository):
             case _:
                 raise NotImplementedError("Query not implemented")
 
-    def __parse_multiple_query(self, query: SchoolsQuery):
+    def __parse_multiple_query(self, query: SchoolsQuery) -> list:
         match query:
             case ByStatus(status):
-                return SchoolDbo.status == status.name
-            case _:
-                raise NotImplementedError("Query not implemented")
+                return [SchoolDbo.status == status.name]
+            case ByCriteria(status, name_prefix, created_from, created_to):
+                conditions = [SchoolDbo.status == status.name]
 
-    async def __get_or_create_contact(self, contact: Contact) -> str:
-        contact_dbo = ContactDbo.from_domain(contact)
-        contact_statement = (
-            insert(ContactDbo).values(**contact_dbo.as_dict()).on_conflict_do_nothing()
-        )
+                if name_prefix:
+                    conditions.append(
+                        SchoolDbo.name.startswith(name_prefix, autoescape=True)
+                    )
 
-        await self.session.execute(contact_statement)
-        await self.session.commit()
+                if created_from:
+                    conditions.append(SchoolDbo.created_at >= created_from)
 
-        existing_contact_id = await self.session.execute(
-            select(ContactDbo.id).filter_by(email=contact.email)
-        )
-        existing_contact_id = existing_contact_id.scalar_one_or_none()
+                if created_to:
+                    conditions.append(SchoolDbo.created_at < created_to)
 
-        return existing_contact_id
+                return conditions
+            case _:
+                raise NotImplementedError("Query not implemented")
 
 
 def get_school_repository(
     session: AsyncSession = Depends(get_db),
+    cache: ResponseCache = Depends(create_response_cache),
+) -> SchoolRepository:
+    return SqlAlchemySchoolRepository(session=session, cache=cache)
+
+
+def get_school_replica_repository(
+    session: AsyncSession = Depends(get_replica_db),
+) -> SchoolRepository:
+    return SqlAlchemySchoolRepository(session=session)
+
+
+def get_school_reader(
+    session: AsyncSession = Depends(get_read_db, use_cache=False),
 ) -> SchoolRepository:
+    """Repository on a session of its own, for lookups run alongside other reads"""
     return SqlAlchemySchoolRepository(session=session)
@@ -0,0 +1,159 @@
+"""Production server: several uvicorn workers sharing one listening socket.
+
+    python -m src.server
+
+HOST                 interface to listen on, 0.0.0.0 by default
+PORT                 8000 by default
+WEB_CONCURRENCY      worker processes, the CPU count by default
+SUBSCRIBER_WORKERS   how many workers, by index, also run the pub/sub subscribers. 1 by default,
+                     none with SUBSCRIBERS_ENABLED=false, for when `python -m src.worker` runs them
+SHUTDOWN_TIMEOUT     seconds a worker has on shutdown to drain its in-flight requests and then
+                     the jobs in hand, 8 by default to fit in the 10 docker stop gives
+METRICS_DIR          where the workers share their metrics, so /metrics sums all of them. A
+                     temporary directory, removed on exit, by default
+METRICS_SYNC_SECONDS how often each worker writes its metrics there, 5 by default
+
+The event loop and HTTP parser are uvloop and httptools when installed.
+"""
+
+import multiprocessing
+import os
+import shutil
+import signal
+import socket
+import tempfile
+import threading
+from pathlib import Path
+from types import FrameType
+
+import uvicorn
+from dotenv import load_dotenv
+
+from src.shared.lifecycle import SHUTDOWN_TIMEOUT, begin_shutdown, is_enabled
+from src.shared.logging.log import Logger, configure_logging
+
+load_dotenv()
+
+logger = Logger(__name__)
+
+HOST = os.getenv("HOST", "0.0.0.0")
+PORT = int(os.getenv("PORT", "8000"))
+WORKERS = int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1)))
+SUBSCRIBER_WORKERS = int(os.getenv("SUBSCRIBER_WORKERS", "1"))
+
+WORKER_CHECK_INTERVAL = 0.5
+
+
+def build_config() -> uvicorn.Config:
+    return uvicorn.Config(
+        "src.main:app",
+        host=HOST,
+        port=PORT,
+        loop="auto",
+        http="auto",
+        proxy_headers=True,
+        timeout_graceful_shutdown=SHUTDOWN_TIMEOUT,
+    )
+
+
+class Server(uvicorn.Server):
+    """Starts the shutdown budget on the signal, so draining the requests and then
+    stopping the lifespan tasks take SHUTDOWN_TIMEOUT between them"""
+
+    def handle_exit(self, sig: int, frame: FrameType | None) -> None:
+        begin_shutdown()
+        super().handle_exit(sig, frame)
+
+
+def serve_worker(index: int, sock: socket.socket) -> None:
+    # Read by the app lifespan, before src.main is imported
+    os.environ["WORKER_INDEX"] = str(index)
+    os.environ["SUBSCRIBERS_ENABLED"] = str(
+        index < SUBSCRIBER_WORKERS and is_enabled("SUBSCRIBERS_ENABLED")
+    ).lower()
+
+    Server(build_config()).run(sockets=[sock])
+
+
+class Supervisor:
+    """Keeps `workers` processes serving the socket, restarting a dead one with the same
+    index so the subscribers keep running in the designated worker. On SIGINT or SIGTERM
+    the workers are terminated and each one drains its in-flight work before exiting"""
+
+    def __init__(self, config: uvicorn.Config, workers: int):
+        self.config = config
+        self.workers = workers
+        self.processes: dict[int, multiprocessing.Process] = {}
+        self.should_exit = threading.Event()
+        self.context = multiprocessing.get_context("spawn")
+
+    def run(self) -> None:
+        sock = self.config.bind_socket()
+        metrics_dir = self.__prepare_metrics_dir()
+
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, lambda *_: self.should_exit.set())
+
+        logger.info(
+            "Starting server: workers=%s, subscriber_workers=%s, pid=%s",
+            self.workers,
+            min(SUBSCRIBER_WORKERS, self.workers),
+            os.getpid(),
+        )
+
+        for index in range(self.workers):
+            self.processes[index] = self.__start(index, sock)
+
+        while not self.should_exit.wait(WORKER_CHECK_INTERVAL):
+            for index, process in self.processes.items():
+                if not process.is_alive():
+                    logger.warning(
+                        "Worker died, restarting: index=%s, exitcode=%s",
+                        index,
+                        process.exitcode,
+                    )
+                    self.processes[index] = self.__start(index, sock)
+
+        logger.info("Stopping server: workers=%s", len(self.processes))
+
+        for process in self.processes.values():
+            process.terminate()
+
+        for process in self.processes.values():
+            process.join()
+
+        sock.close()
+
+        if metrics_dir is not None:
+            shutil.rmtree(metrics_dir, ignore_errors=True)
+
+    def __prepare_metrics_dir(self) -> Path | None:
+        """Exported before spawning the workers, which inherit it. Returns the directory
+        when it is a temporary one to remove on exit"""
+        if directory := os.getenv("METRICS_DIR"):
+            Path(directory).mkdir(parents=True, exist_ok=True)
+
+            # Left by a previous run, they would be summed as live workers
+            for stale in Path(directory).glob("worker-*.json"):
+                stale.unlink(missing_ok=True)
+
+            return None
+
+        directory = tempfile.mkdtemp(prefix="mattilda-metrics-")
+        os.environ["METRICS_DIR"] = directory
+
+        return Path(directory)
+
+    def __start(self, index: int, sock: socket.socket) -> multiprocessing.Process:
+        process = self.context.Process(
+            target=serve_worker, kwargs={"index": index, "sock": sock}
+        )
+        process.start()
+
+        return process
+
+
+if __name__ == "__main__":
+    configure_logging()
+
+    Supervisor(config=build_config(), workers=WORKERS).run()
@@ -0,0 +1,12 @@
+from typing import TypeVar
+
+Result = TypeVar("Result")
+
+
+def result_of(result: Result | BaseException) -> Result:
+    """Unwraps a result of `asyncio.gather(..., return_exceptions=True)`, raising it
+    when the awaitable failed"""
+    if isinstance(result, BaseException):
+        raise result
+
+    return result
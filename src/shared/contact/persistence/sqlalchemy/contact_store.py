@@ -0,0 +1,63 @@
+from datetime import datetime
+
+from sqlalchemy import CTE, Insert, literal, select
+from sqlalchemy.dialects.postgresql import insert
+
+from src.shared.contact.model import Contact, ContactDbo
+from src.shared.db.pg_sqlalchemy.connection import BaseSqlModel
+from src.shared.tracing.tracer import traced
+
+
+@traced
+class SqlAlchemyContactStore:
+    """Upserts contacts keyed by email together with the owner row that references
+    them, so the contact id never needs a separate lookup"""
+
+    @staticmethod
+    def upsert_with_owner(
+        owner: type[BaseSqlModel],
+        values: dict,
+        update_values: dict,
+        contact: Contact,
+    ) -> Insert:
+        """Builds a single `WITH contact AS (INSERT ... RETURNING id) INSERT owner ...`
+        statement. The owner is upserted by id and returns its contact_id"""
+        contact_cte = SqlAlchemyContactStore.__upsert_contact_cte(contact)
+        columns = [column for column in values if column != "contact_id"]
+
+        owner_row = select(
+            *[
+                literal(values[column], type_=owner.__table__.c[column].type).label(
+                    column
+                )
+                for column in columns
+            ],
+            contact_cte.c.id.label("contact_id"),
+        )
+
+        statement = insert(owner).from_select(columns + ["contact_id"], owner_row)
+
+        return statement.on_conflict_do_update(
+            index_elements=["id"],
+            set_={column: statement.excluded[column] for column in update_values},
+        ).returning(owner.__table__.c.contact_id)
+
+    @staticmethod
+    def __upsert_contact_cte(contact: Contact) -> CTE:
+        statement = insert(ContactDbo).values(
+            **ContactDbo.from_domain(contact, at=datetime.now()).as_dict()
+        )
+
+        return (
+            statement.on_conflict_do_update(
+                index_elements=["email"],
+                # The phone is unique too, taking the new one would clash with the
+                # contact that may hold it, so it keeps the stored one
+                set_={
+                    "address": statement.excluded.address,
+                    "updated_at": statement.excluded.updated_at,
+                },
+            )
+            .returning(ContactDbo.id)
+            .cte("upserted_contact")
+        )
@@ -0,0 +1,66 @@
+import logging
+import os
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.shared.db.query_stats import track_queries
+from src.shared.logging.log import Logger
+
+logger = Logger(__name__)
+
+DEBUG = os.getenv("DEBUG", "false").lower() == "true"
+# Requests running more statements are logged as warnings, likely N+1 patterns
+MANY_QUERIES = int(os.getenv("DB_MANY_QUERIES", "10"))
+
+QUERY_STATS_HEADER = "X-DB-Queries"
+
+
+class QueryStatsMiddleware:
+    """Tracks the SQL statements of each HTTP request and logs a summary. In debug
+    mode the summary is also sent in the X-DB-Queries response header"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as query_stats:
+
+            async def send_with_stats(message: Message) -> None:
+                if DEBUG and message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers.append(QUERY_STATS_HEADER, query_stats.as_header())
+
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_stats)
+            finally:
+                route = scope.get("route")
+                path = route.path if route else scope["path"]
+                level = (
+                    logging.WARNING
+                    if query_stats.count >= MANY_QUERIES or query_stats.slow_queries
+                    else logging.DEBUG
+                )
+
+                logger.log(
+                    level,
+                    "Request queries: method=%s, route=%s, count=%d, time_ms=%.2f, slow=%d",
+                    scope["method"],
+                    path,
+                    query_stats.count,
+                    query_stats.duration * 1000,
+                    len(query_stats.slow_queries),
+                    extra={
+                        "method": scope["method"],
+                        "route": path,
+                        "queries": query_stats.count,
+                        "db_time_ms": round(query_stats.duration * 1000, 2),
+                        "slow_queries": len(query_stats.slow_queries),
+                    },
+                )
@@ -1,24 +1,114 @@
 import os
+from fastapi import Request
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
-DB_USER = os.getenv("DB_USER")
-DB_PASS = os.getenv("DB_PASS")
-DB_HOST = os.getenv("DB_HOST")
-DB_PORT = os.getenv("DB_PORT")
-DB_NAME = os.getenv("DB_NAME")
+from src.shared.db.pg_sqlalchemy.instrumentation import instrument_engine
+from src.shared.db.read_your_writes import wrote_recently
 
-engine = create_async_engine(
-    f"postgresql+asyncpg://{DB_USER}:{DB_PASS}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
-)
+DbSession = async_sessionmaker(class_=AsyncSession, autoflush=True)
+"""Bound to the engine once `get_engine` creates it, in the app lifespan"""
+
+DbReplicaSession = async_sessionmaker(class_=AsyncSession, autoflush=True)
+"""Bound to the read replica engine, or to the primary one without DB_REPLICA_HOST"""
 
-DbSession = async_sessionmaker(engine, class_=AsyncSession, autoflush=True)
+_engine: AsyncEngine | None = None
+_replica_engine: AsyncEngine | None = None
 
 
 class BaseSqlModel(DeclarativeBase):
     pass
 
 
+def create_engine(host: str | None, port: str | None) -> AsyncEngine:
+    DB_USER = os.getenv("DB_USER")
+    DB_PASS = os.getenv("DB_PASS")
+    DB_NAME = os.getenv("DB_NAME")
+
+    engine = create_async_engine(
+        f"postgresql+asyncpg://{DB_USER}:{DB_PASS}@{host}:{port}/{DB_NAME}"
+    )
+
+    instrument_engine(engine)
+
+    return engine
+
+
+def get_engine() -> AsyncEngine:
+    """Creates the process engine on first use, from the environment at that time"""
+    global _engine
+
+    if _engine is None:
+        _engine = create_engine(host=os.getenv("DB_HOST"), port=os.getenv("DB_PORT"))
+
+        DbSession.configure(bind=_engine)
+
+    return _engine
+
+
+def get_replica_engine() -> AsyncEngine:
+    """Engine of the read replica at DB_REPLICA_HOST and DB_REPLICA_PORT (DB_PORT by
+    default), with the primary credentials. The primary engine when not configured"""
+    global _replica_engine
+
+    if _replica_engine is None:
+        host = os.getenv("DB_REPLICA_HOST")
+
+        _replica_engine = (
+            create_engine(
+                host=host, port=os.getenv("DB_REPLICA_PORT", os.getenv("DB_PORT"))
+            )
+            if host
+            else get_engine()
+        )
+
+        DbReplicaSession.configure(bind=_replica_engine)
+
+    return _replica_engine
+
+
+async def dispose_engine() -> None:
+    global _engine, _replica_engine
+
+    replica_engine, _replica_engine = _replica_engine, None
+
+    if replica_engine is not None and replica_engine is not _engine:
+        await replica_engine.dispose()
+
+    if _engine is not None:
+        engine, _engine = _engine, None
+
+        await engine.dispose()
+
+
 async def get_db():
+    get_engine()
+
+    async with DbSession() as session:
+        yield session
+
+
+async def get_read_db():
+    """A session apart from the request one, for reads awaited concurrently with
+    others. Depend on it with `use_cache=False` to get one session per read"""
+    get_engine()
+
     async with DbSession() as session:
         yield session
+
+
+async def get_replica_db(request: Request):
+    """Session for the GET routes. It reads from the replica, unless the client wrote
+    within the read your writes window, which the replica may not have applied yet"""
+    get_engine()
+    get_replica_engine()
+
+    sessions = DbSession if wrote_recently(request) else DbReplicaSession
+
+    async with sessions() as session:
+        yield session
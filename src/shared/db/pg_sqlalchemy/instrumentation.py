@@ -0,0 +1,92 @@
+import os
+import time
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.shared.db.query_stats import SlowQuery, current_query_stats
+from src.shared.logging.log import Logger
+from src.shared.metrics.model import metrics
+
+logger = Logger(__name__)
+
+SLOW_QUERY_SECONDS = float(os.getenv("DB_SLOW_QUERY_MS", "200")) / 1000
+
+queries_total = metrics.counter("db_queries_total", "Executed SQL statements")
+slow_queries_total = metrics.counter(
+    "db_slow_queries_total", "SQL statements slower than the slow query threshold"
+)
+compiled_cache_total = metrics.counter(
+    "db_compiled_cache_total",
+    "Executed statements by SQLAlchemy compiled cache result",
+    ("result",),
+)
+query_duration = metrics.histogram(
+    "db_query_duration_seconds", "Duration of the executed SQL statements"
+)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Records every statement in the metrics, with whether SQLAlchemy reused its
+    compiled form, and in the current request stats, and logs the ones slower than
+    DB_SLOW_QUERY_MS with their parameters"""
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(
+        connection, cursor, statement, parameters, context, executemany
+    ):
+        connection.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(
+        connection, cursor, statement, parameters, context, executemany
+    ):
+        duration = time.perf_counter() - connection.info["query_started_at"].pop()
+
+        queries_total.inc()
+        query_duration.observe(duration)
+
+        # cache_hit, cache_miss, or no_cache_key for text and uncacheable statements
+        if context is not None:
+            compiled_cache_total.inc(result=context.cache_hit.name.lower())
+
+        stats = current_query_stats()
+
+        if stats is not None:
+            stats.record(duration)
+
+        if duration < SLOW_QUERY_SECONDS:
+            return
+
+        slow_query = SlowQuery(
+            statement=statement, parameters=parameters, duration=duration
+        )
+
+        slow_queries_total.inc()
+
+        if stats is not None:
+            stats.record_slow(slow_query)
+
+        logger.warning(
+            "Slow query: duration_ms=%.2f, statement=%s, parameters=%s",
+            duration * 1000,
+            statement,
+            parameters,
+            extra={
+                "duration_ms": round(duration * 1000, 2),
+                "statement": statement,
+                "parameters": repr(parameters),
+            },
+        )
+
+    @event.listens_for(sync_engine, "handle_error")
+    def handle_error(context):
+        started_at = (
+            context.connection.info.get("query_started_at")
+            if context.connection
+            else None
+        )
+
+        if started_at:
+            started_at.pop()
@@ -0,0 +1,52 @@
+from typing import Callable, Sequence, TypeVar
+
+from sqlalchemy import ColumnElement, Select, tuple_
+
+from src.shared.pagination.cursor import SortKey, decode_cursor, encode_cursor
+from src.shared.pagination.errors import InvalidCursorError
+from src.shared.pagination.model import PageRequest
+
+T = TypeVar("T")
+
+
+def paginate(
+    statement: Select, sort_columns: Sequence[ColumnElement], page: PageRequest
+) -> Select:
+    """Applies keyset pagination over the sort columns. One extra row is fetched
+    so `page_of` can tell whether there is a next page"""
+    if page.cursor:
+        keys = decode_cursor(page.cursor)
+
+        if len(keys) != len(sort_columns):
+            raise InvalidCursorError(cursor=page.cursor)
+
+        if len(sort_columns) == 1:
+            statement = statement.where(sort_columns[0] > keys[0])
+        else:
+            statement = statement.where(tuple_(*sort_columns) > tuple_(*keys))
+
+    return statement.order_by(*sort_columns).limit(page.limit + 1)
+
+
+def cursor_keys(page: PageRequest, sort_columns: int) -> tuple[SortKey, ...] | None:
+    """The sort keys the page starts after, for statements built once that bind them"""
+    if not page.cursor:
+        return None
+
+    keys = decode_cursor(page.cursor)
+
+    if len(keys) != sort_columns:
+        raise InvalidCursorError(cursor=page.cursor)
+
+    return tuple(keys)
+
+
+def page_of(
+    items: list[T], page: PageRequest, sort_key: Callable[[T], tuple[SortKey, ...]]
+) -> tuple[str | None, list[T]]:
+    if len(items) <= page.limit:
+        return None, items
+
+    items = items[: page.limit]
+
+    return encode_cursor(sort_key(items[-1])), items
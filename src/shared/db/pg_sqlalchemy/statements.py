@@ -0,0 +1,32 @@
+import functools
+from typing import Iterator
+
+from sqlalchemy import Table, Update, bindparam, update
+
+
+@functools.cache
+def update_statement(table: Table, columns: tuple[str, ...]) -> Update:
+    """UPDATE of `columns` by id, built once per table and set of columns. The bound
+    parameters are prefixed, their names can not be the column ones"""
+    return (
+        update(table)
+        .where(table.c.id == bindparam("b_id"))
+        .values({column: bindparam(f"b_{column}") for column in columns})
+    )
+
+
+def update_by_id(
+    model: type, changes: dict[str, dict]
+) -> Iterator[tuple[Update, list[dict]]]:
+    """Groups the changes, values by row id, by the columns they set. Each group runs
+    as one executemany of its cached statement"""
+    groups: dict[tuple[str, ...], list[dict]] = {}
+
+    for id, values in changes.items():
+        columns = tuple(sorted(values))
+        groups.setdefault(columns, []).append(
+            {"b_id": id, **{f"b_{column}": value for column, value in values.items()}}
+        )
+
+    for columns, parameters in groups.items():
+        yield update_statement(model.__table__, columns), parameters
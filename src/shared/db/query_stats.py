@@ -0,0 +1,50 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+
+
+@dataclass(frozen=True)
+class SlowQuery:
+    statement: str
+    parameters: Any
+    duration: float
+
+
+@dataclass
+class QueryStats:
+    """Statements run while handling a single request"""
+
+    count: int = 0
+    duration: float = 0
+    slow_queries: list[SlowQuery] = field(default_factory=list)
+
+    def record(self, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+
+    def record_slow(self, slow_query: SlowQuery) -> None:
+        self.slow_queries.append(slow_query)
+
+    def as_header(self) -> str:
+        return f"count={self.count}; time_ms={self.duration * 1000:.2f}; slow={len(self.slow_queries)}"
+
+
+_current_query_stats: ContextVar[QueryStats | None] = ContextVar(
+    "query_stats", default=None
+)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    stats = QueryStats()
+    token = _current_query_stats.set(stats)
+
+    try:
+        yield stats
+    finally:
+        _current_query_stats.reset(token)
+
+
+def current_query_stats() -> QueryStats | None:
+    return _current_query_stats.get()
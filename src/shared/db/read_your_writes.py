@@ -0,0 +1,55 @@
+import math
+import os
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Seconds after a write during which the client reads from the primary, 0 disables it
+READ_YOUR_WRITES_SECONDS = float(os.getenv("READ_YOUR_WRITES_SECONDS", "5"))
+
+LAST_WRITE_COOKIE = "last_write"
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+def wrote_recently(connection: HTTPConnection) -> bool:
+    """Whether the client made a write within the read your writes window"""
+    last_write = connection.cookies.get(LAST_WRITE_COOKIE)
+
+    try:
+        return time.time() - float(last_write) < READ_YOUR_WRITES_SECONDS
+    except (TypeError, ValueError):
+        return False
+
+
+class ReadYourWritesMiddleware:
+    """Marks the clients of successful writes with the time of the write in a cookie,
+    which expires with the read your writes window, so their next reads see them"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] in SAFE_METHODS
+            or READ_YOUR_WRITES_SECONDS <= 0
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_last_write(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "set-cookie",
+                    f"{LAST_WRITE_COOKIE}={time.time():.3f}; "
+                    f"Max-Age={math.ceil(READ_YOUR_WRITES_SECONDS)}; "
+                    "Path=/; HttpOnly; SameSite=Lax",
+                )
+
+            await send(message)
+
+        await self.app(scope, receive, send_with_last_write)
@@ -0,0 +1,105 @@
+"""A minimal in-process ASGI client, for the tests and the API benchmark.
+
+Requests go straight into the application callable, without any socket, server or
+client library in between, so the measured latency is the application's own, and the
+whole response is collected.
+"""
+
+import asyncio
+import json
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urlencode
+
+from starlette.types import ASGIApp, Message
+
+
+@dataclass(frozen=True)
+class Response:
+    status: int
+    headers: dict[str, str]
+    body: bytes
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+
+class AsgiClient:
+    def __init__(self, app: ASGIApp, root_path: str = ""):
+        self.app = app
+        self.root_path = root_path
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: dict | None = None,
+        body: dict | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> Response:
+        payload = json.dumps(body).encode() if body is not None else b""
+        query_string = urlencode(
+            {key: value for key, value in (params or {}).items() if value is not None}
+        )
+        full_path = f"{self.root_path}{path}"
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": full_path,
+            "raw_path": full_path.encode(),
+            "root_path": "",
+            "query_string": query_string.encode(),
+            "headers": [
+                (b"host", b"testserver"),
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(payload)).encode()),
+                *(
+                    (name.lower().encode(), value.encode())
+                    for name, value in (headers or {}).items()
+                ),
+            ],
+            "client": ("127.0.0.1", 0),
+            "server": ("testserver", 80),
+        }
+
+        request_sent = False
+        response_complete = asyncio.Event()
+        status = 0
+        response_headers = {}
+        chunks = []
+
+        async def receive() -> Message:
+            nonlocal request_sent
+
+            if request_sent:
+                # Streaming responses listen for the disconnect while they send
+                await response_complete.wait()
+
+                return {"type": "http.disconnect"}
+
+            request_sent = True
+
+            return {"type": "http.request", "body": payload, "more_body": False}
+
+        async def send(message: Message) -> None:
+            nonlocal status
+
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                response_headers.update(
+                    (name.decode().lower(), value.decode())
+                    for name, value in message.get("headers", [])
+                )
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+                if not message.get("more_body", False):
+                    response_complete.set()
+
+        await self.app(scope, receive, send)
+
+        return Response(status=status, headers=response_headers, body=b"".join(chunks))
@@ -0,0 +1,200 @@
+import os
+import zlib
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # Optional, without it responses are only gzipped
+    brotli = None
+
+# Smallest response body worth compressing, in bytes
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+
+# Encodings offered to the clients by order of preference, empty disables compression
+COMPRESSION_ENCODINGS = [
+    encoding.strip()
+    for encoding in os.getenv("COMPRESSION_ENCODINGS", "br,gzip").split(",")
+    if encoding.strip()
+]
+
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "6"))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", "4"))
+
+COMPRESSIBLE_TYPES = ("application/json", "text/")
+
+
+class GzipEncoder:
+    def __init__(self):
+        self.__compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+
+    def encode(self, data: bytes) -> bytes:
+        """Compresses a chunk, flushed so the client can decode it right away"""
+        return self.__compressor.compress(data) + self.__compressor.flush(
+            zlib.Z_SYNC_FLUSH
+        )
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self.__compressor.compress(data) + self.__compressor.flush()
+
+
+class BrotliEncoder:
+    def __init__(self):
+        self.__compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+
+    def encode(self, data: bytes) -> bytes:
+        """Compresses a chunk, flushed so the client can decode it right away"""
+        return self.__compressor.process(data) + self.__compressor.flush()
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self.__compressor.process(data) + self.__compressor.finish()
+
+
+ENCODERS = {"gzip": GzipEncoder, "br": BrotliEncoder}
+
+
+def available_encodings() -> list[str]:
+    return [
+        encoding
+        for encoding in COMPRESSION_ENCODINGS
+        if encoding in ENCODERS and (encoding != "br" or brotli is not None)
+    ]
+
+
+def negotiate_encoding(accept_encoding: str) -> str | None:
+    """The available encoding the client prefers according to its Accept-Encoding
+    quality values, ties are broken by the order of COMPRESSION_ENCODINGS"""
+    qualities = {}
+
+    for item in accept_encoding.split(","):
+        name, _, params = item.partition(";")
+        name = name.strip().lower()
+
+        if not name:
+            continue
+
+        quality = 1.0
+        key, _, value = params.partition("=")
+
+        if key.strip().lower() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+
+        qualities[name] = quality
+
+    candidates = [
+        (qualities.get(encoding, qualities.get("*", 0.0)), encoding)
+        for encoding in available_encodings()
+    ]
+    candidates = [candidate for candidate in candidates if candidate[0] > 0]
+
+    if not candidates:
+        return None
+
+    return max(candidates, key=lambda candidate: candidate[0])[1]
+
+
+class CompressionMiddleware:
+    """Compresses the JSON and text responses of at least COMPRESSION_MIN_SIZE bytes
+    with the encoding the client prefers. Streamed responses are compressed chunk by
+    chunk as they are sent, once their first chunks reach the threshold"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        encoding = (
+            negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+            if scope["type"] == "http"
+            else None
+        )
+
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        await self.app(scope, receive, _CompressingSender(send, encoding))
+
+
+class _CompressingSender:
+    def __init__(self, send: Send, encoding: str):
+        self.send = send
+        self.encoding = encoding
+        self.start: Message | None = None
+        self.pending = b""
+        self.encoder = None
+        self.passthrough = False
+
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start = message
+            self.passthrough = not self.__compressible(message)
+
+            if self.passthrough:
+                await self.send(message)
+
+            return
+
+        if self.passthrough or message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.encoder is not None:
+            await self.__send_body(
+                self.encoder.encode(body) if more_body else self.encoder.finish(body),
+                more_body,
+            )
+            return
+
+        self.pending += body
+
+        if not more_body and len(self.pending) < COMPRESSION_MIN_SIZE:
+            await self.send(self.start)
+            await self.__send_body(self.pending, more_body=False)
+            return
+
+        if more_body and len(self.pending) < COMPRESSION_MIN_SIZE:
+            return
+
+        self.encoder = ENCODERS[self.encoding]()
+        pending, self.pending = self.pending, b""
+
+        if more_body:
+            await self.__send_start(content_length=None)
+            await self.__send_body(self.encoder.encode(pending), more_body=True)
+        else:
+            compressed = self.encoder.finish(pending)
+            await self.__send_start(content_length=len(compressed))
+            await self.__send_body(compressed, more_body=False)
+
+    def __compressible(self, start: Message) -> bool:
+        headers = Headers(raw=start["headers"])
+
+        return (
+            "content-encoding" not in headers
+            and headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
+            and start["status"] not in (204, 304)
+        )
+
+    async def __send_start(self, content_length: int | None) -> None:
+        headers = MutableHeaders(scope=self.start)
+        headers["content-encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+
+        if content_length is None:
+            del headers["content-length"]
+        else:
+            headers["content-length"] = str(content_length)
+
+        await self.send(self.start)
+
+    async def __send_body(self, body: bytes, more_body: bool) -> None:
+        await self.send(
+            {"type": "http.response.body", "body": body, "more_body": more_body}
+        )
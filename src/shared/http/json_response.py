@@ -0,0 +1,41 @@
+import functools
+import inspect
+from typing import Any, Callable
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+
+from src.shared.serialization.json_codec import dumps
+
+
+class JsonResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+class JsonRoute(APIRoute):
+    """Renders what the endpoint returns straight with the JSON codec, skipping
+    FastAPI's jsonable_encoder and response model validation. The response model
+    still documents the route"""
+
+    def __init__(self, path: str, endpoint: Callable, **kwargs):
+        super().__init__(
+            path, endpoint=_rendered(endpoint, kwargs.get("status_code")), **kwargs
+        )
+
+
+def _rendered(endpoint: Callable, status_code: int | None) -> Callable:
+    if not inspect.iscoroutinefunction(endpoint):
+        return endpoint
+
+    @functools.wraps(endpoint)
+    async def render(*args, **kwargs):
+        content = await endpoint(*args, **kwargs)
+
+        if isinstance(content, Response):
+            return content
+
+        return JsonResponse(content=content, status_code=status_code or 200)
+
+    return render
@@ -0,0 +1,52 @@
+import os
+from typing import Any, AsyncIterator
+
+from fastapi.responses import StreamingResponse
+
+from src.shared.serialization.json_codec import dumps
+
+# Items of a list encoded into each chunk of a streamed response
+STREAM_CHUNK_ITEMS = int(os.getenv("STREAM_CHUNK_ITEMS", "200"))
+
+
+class JsonStreamResponse(StreamingResponse):
+    """Sends a JSON object with chunked transfer encoding, its list fields encoded
+    STREAM_CHUNK_ITEMS items at a time, so the client starts receiving the first
+    items while the rest are encoded and the whole body is never held in memory.
+    The body is the same the JSON codec renders for the object"""
+
+    media_type = "application/json"
+
+    def __init__(self, content: dict[str, Any], status_code: int = 200):
+        super().__init__(_chunks(content), status_code=status_code)
+
+
+async def _chunks(content: dict[str, Any]) -> AsyncIterator[bytes]:
+    chunk = bytearray(b"{")
+
+    for index, (key, value) in enumerate(content.items()):
+        if index:
+            chunk += b","
+
+        chunk += dumps(key) + b":"
+
+        if not isinstance(value, list):
+            chunk += dumps(value)
+            continue
+
+        chunk += b"["
+
+        for start in range(0, len(value), STREAM_CHUNK_ITEMS):
+            if start:
+                yield bytes(chunk)
+                chunk = bytearray(b",")
+
+            chunk += b",".join(
+                dumps(item) for item in value[start : start + STREAM_CHUNK_ITEMS]
+            )
+
+        chunk += b"]"
+
+    chunk += b"}"
+
+    yield bytes(chunk)
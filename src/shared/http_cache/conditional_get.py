@@ -0,0 +1,99 @@
+import os
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Awaitable, Callable, TypeVar
+
+from fastapi import Request, Response
+from src.shared.http.json_response import JsonResponse
+from src.shared.http_cache.response_cache import CachedResponse, ResponseCache
+from src.shared.serialization.json_codec import dumps
+
+# Sent with every cached resource, `no-cache` has the clients revalidate each time
+CACHE_CONTROL = os.getenv("HTTP_CACHE_CONTROL", "no-cache")
+
+Resource = TypeVar("Resource")
+
+
+def etag_of(version: datetime) -> str:
+    return f'W/"{version:%Y%m%d%H%M%S%f}"'
+
+
+def http_date(version: datetime) -> str:
+    """The stored timestamps are naive UTC"""
+    return format_datetime(version.replace(tzinfo=timezone.utc), usegmt=True)
+
+
+def is_conditional(request: Request) -> bool:
+    return "if-none-match" in request.headers or "if-modified-since" in request.headers
+
+
+def not_modified(request: Request, etag: str, last_modified: str) -> bool:
+    """If-None-Match takes precedence over If-Modified-Since, as in RFC 9110"""
+    if_none_match = request.headers.get("if-none-match")
+
+    if if_none_match is not None:
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+
+        return "*" in tags or etag in tags
+
+    try:
+        if_modified_since = parsedate_to_datetime(request.headers["if-modified-since"])
+    except (KeyError, TypeError, ValueError):
+        return False
+
+    return parsedate_to_datetime(last_modified) <= if_modified_since
+
+
+def cache_headers(etag: str, last_modified: str) -> dict[str, str]:
+    return {
+        "ETag": etag,
+        "Last-Modified": last_modified,
+        "Cache-Control": CACHE_CONTROL,
+    }
+
+
+async def conditional_get(
+    request: Request,
+    cache: ResponseCache,
+    resource: str,
+    id: str,
+    version: Callable[[], Awaitable[datetime | None]],
+    find: Callable[[], Awaitable[Resource | None]],
+    version_of: Callable[[Resource], datetime],
+) -> Response:
+    """Answers a GET of a single resource from the response cache, or else from
+    `find`, caching the result. A revalidation missing the cache is answered with
+    304 Not Modified after the `version` lookup alone, when it is still current"""
+    cached = await cache.get(resource, id)
+
+    if cached is None and is_conditional(request):
+        current = await version()
+
+        if current is not None:
+            etag, last_modified = etag_of(current), http_date(current)
+
+            if not_modified(request, etag, last_modified):
+                return Response(
+                    status_code=304, headers=cache_headers(etag, last_modified)
+                )
+
+    if cached is None:
+        found = await find()
+
+        if found is None:
+            return JsonResponse(content=None)
+
+        cached = CachedResponse(
+            body=dumps(found).decode(),
+            etag=etag_of(version_of(found)),
+            last_modified=http_date(version_of(found)),
+        )
+
+        await cache.set(resource, id, cached)
+
+    headers = cache_headers(cached.etag, cached.last_modified)
+
+    if not_modified(request, cached.etag, cached.last_modified):
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=cached.body, media_type="application/json", headers=headers)
@@ -0,0 +1,97 @@
+import os
+
+from src.shared.db.read_your_writes import READ_YOUR_WRITES_SECONDS
+from src.shared.errors.technical import TechnicalError
+from src.shared.http_cache.response_cache import CachedResponse, ResponseCache
+from src.shared.logging.log import Logger
+from src.shared.metrics.model import metrics
+from src.shared.redis.connection_factory import get_connection
+from src.shared.serialization.json_codec import dumps, loads
+
+logger = Logger(__name__)
+
+# Seconds a response is kept, 0 disables the cache. Invalidations are still sent
+RESPONSE_CACHE_SECONDS = int(os.getenv("RESPONSE_CACHE_SECONDS", "30"))
+
+response_cache_total = metrics.counter(
+    "http_response_cache_total",
+    "Response cache lookups by result",
+    ("result",),
+)
+
+
+class RedisResponseCache(ResponseCache):
+    """Responses as JSON strings under `http:<resource>:<id>`. A failing Redis is
+    logged and treated as a miss, the request is answered from the database.
+
+    An invalidated key holds an empty tombstone for the read your writes window, and
+    responses are only set on absent keys, so a read from a replica that has not
+    applied the write yet does not cache the previous version"""
+
+    def __init__(self):
+        self.connection = get_connection()
+
+    async def get(self, resource: str, id: str) -> CachedResponse | None:
+        if RESPONSE_CACHE_SECONDS <= 0:
+            return None
+
+        try:
+            value = await self.connection.get(self.__key(resource, id))
+        except Exception as e:
+            self.__warn("RedisResponseCacheGetError", resource, [id], e)
+            response_cache_total.inc(result="error")
+
+            return None
+
+        response_cache_total.inc(result="hit" if value else "miss")
+
+        return CachedResponse(**loads(value)) if value else None
+
+    async def set(self, resource: str, id: str, response: CachedResponse) -> None:
+        if RESPONSE_CACHE_SECONDS <= 0:
+            return
+
+        try:
+            await self.connection.set(
+                self.__key(resource, id),
+                dumps(response),
+                ex=RESPONSE_CACHE_SECONDS,
+                nx=True,
+            )
+        except Exception as e:
+            self.__warn("RedisResponseCacheSetError", resource, [id], e)
+
+    async def invalidate(self, resource: str, ids: list[str]) -> None:
+        if not ids:
+            return
+
+        keys = [self.__key(resource, id) for id in ids]
+
+        try:
+            if READ_YOUR_WRITES_SECONDS > 0:
+                async with self.connection.pipeline(transaction=False) as pipeline:
+                    for key in keys:
+                        pipeline.set(key, "", px=int(READ_YOUR_WRITES_SECONDS * 1000))
+
+                    await pipeline.execute()
+            else:
+                await self.connection.delete(*keys)
+        except Exception as e:
+            self.__warn("RedisResponseCacheInvalidateError", resource, ids, e)
+
+    def __key(self, resource: str, id: str) -> str:
+        return f"http:{resource}:{id}"
+
+    def __warn(self, code: str, resource: str, ids: list[str], cause: Exception):
+        error = TechnicalError(
+            code=code,
+            message=f"Response cache unavailable for {resource}",
+            attributes={"resource": resource, "ids": ids},
+            cause=cause,
+        )
+
+        logger.warning(error)
+
+
+def create_response_cache() -> ResponseCache:
+    return RedisResponseCache()
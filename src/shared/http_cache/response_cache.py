@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    body: str
+    etag: str
+    last_modified: str
+
+
+class ResponseCache(ABC):
+    """Serialized GET responses of single resources, by resource name and id"""
+
+    @abstractmethod
+    async def get(self, resource: str, id: str) -> CachedResponse | None:
+        pass
+
+    @abstractmethod
+    async def set(self, resource: str, id: str, response: CachedResponse) -> None:
+        pass
+
+    @abstractmethod
+    async def invalidate(self, resource: str, ids: list[str]) -> None:
+        """Drops the responses of resources that changed, called once they are
+        committed"""
+        pass
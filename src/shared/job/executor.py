@@ -1,12 +1,33 @@
+import time
 from datetime import datetime
 from typing import AsyncGenerator
 
 from src.shared.logging.log import Logger
-from src.shared.job.model import JobExecutionResult, JobItemResult, StartedJob
+from src.shared.job.model import (
+    JobExecutionResult,
+    JobItemResult,
+    StartedJob,
+    SuccessJobItem,
+)
 from src.shared.job.repository import JobRepository
+from src.shared.metrics.model import metrics
+from src.shared.tracing.tracer import tracer
 
 logger = Logger(__name__)
 
+job_items_total = metrics.counter(
+    "job_items_total", "Processed job items", ("job", "result")
+)
+job_duration = metrics.histogram(
+    "job_duration_seconds",
+    "Time to run a job",
+    ("job",),
+    buckets=(0.1, 0.5, 1, 5, 10, 30, 60, 120, 300, 600, 1800),
+)
+job_items_per_second = metrics.gauge(
+    "job_items_per_second", "Items per second of the last run of the job", ("job",)
+)
+
 
 class JobExecutor:
     def __init__(self, jobs: JobRepository):
@@ -22,23 +43,69 @@ class JobExecutor:
         )
 
         collected_items = []
+        started = time.perf_counter()
+
+        with tracer.start_span(
+            f"{job_name}.run", attributes={"job.id": job_id, "job.name": job_name}
+        ):
+            job_execution_result = await self.__run(
+                started_job, self.__traced(job_name, generator), collected_items
+            )
+
+        duration = time.perf_counter() - started
+        job_duration.observe(duration, job=job_name)
+        job_items_per_second.set(
+            len(collected_items) / duration if duration else 0, job=job_name
+        )
+
+        await self.jobs.save(result=job_execution_result)
+
+        return job_execution_result
+
+    async def __run(
+        self,
+        started_job: StartedJob,
+        generator: AsyncGenerator[JobItemResult, None],
+        collected_items: list[JobItemResult],
+    ) -> JobExecutionResult:
+        job_name = started_job.job_name
 
         try:
             async for item in generator:
                 collected_items.append(item)
+                job_items_total.inc(
+                    job=job_name,
+                    result="success" if isinstance(item, SuccessJobItem) else "failure",
+                )
 
-            job_execution_result = started_job.succeeded(
+            return started_job.succeeded(
                 finished_at=datetime.now(), items=collected_items
             )
 
         except Exception as error:
             logger.error(f"Error running job: {job_name}", {"error": str(error)})
 
-            job_execution_result = started_job.failed(
-                finished_at=datetime.now(), error=str(error)
-            )
+            return started_job.failed(finished_at=datetime.now(), error=str(error))
 
-        finally:
-            await self.jobs.save(result=job_execution_result)
+    async def __traced(
+        self, job_name: str, generator: AsyncGenerator[JobItemResult, None]
+    ) -> AsyncGenerator[JobItemResult, None]:
+        """Runs each step of the generator, up to the item it yields, in a span"""
+        items = aiter(generator)
 
-        return job_execution_result
+        while True:
+            with tracer.start_span(f"{job_name}.item") as span:
+                try:
+                    item = await anext(items)
+                except StopAsyncIteration:
+                    # The last step only finishes the generator
+                    if span is not None:
+                        span.name = f"{job_name}.finish"
+
+                    return
+
+                if span is not None:
+                    span.set_attribute("job.item.id", item.id)
+                    span.set_attribute("job.item.result", type(item).__name__)
+
+            yield item
@@ -9,10 +9,12 @@ from src.shared.job.repository import JobRepository
 from src.shared.db.pg_sqlalchemy.connection import get_db
 from src.shared.logging.log import Logger
 from src.shared.errors.technical import TechnicalError
+from src.shared.tracing.tracer import traced
 
 logger = Logger(__name__)
 
 
+@traced
 class SqlAlchemyJobRepository(JobRepository):
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -0,0 +1,56 @@
+import asyncio
+import os
+import time
+
+from src.shared.logging.log import Logger
+
+logger = Logger(__name__)
+
+# Seconds the whole shutdown may take. It has to stay below the grace period the
+# orchestrator gives before killing the process, 10 for docker stop by default
+SHUTDOWN_TIMEOUT = float(os.getenv("SHUTDOWN_TIMEOUT", "8"))
+
+_shutdown_deadline: float | None = None
+
+
+def is_enabled(variable: str, default: bool = True) -> bool:
+    return os.getenv(variable, str(default)).lower() in ("1", "true", "yes")
+
+
+def begin_shutdown() -> None:
+    """Starts the shutdown budget, the phases that follow share what is left of it"""
+    global _shutdown_deadline
+
+    if _shutdown_deadline is None:
+        _shutdown_deadline = time.monotonic() + SHUTDOWN_TIMEOUT
+
+
+def shutdown_time_left() -> float:
+    if _shutdown_deadline is None:
+        return SHUTDOWN_TIMEOUT
+
+    return max(0.0, _shutdown_deadline - time.monotonic())
+
+
+async def stop_tasks(tasks: list[asyncio.Task], timeout: float | None = None):
+    """Cancels the background tasks and waits for them to finish the work in hand,
+    by default for what is left of the shutdown budget. The ones still running after
+    the timeout are cancelled again, cutting them off"""
+    if timeout is None:
+        timeout = shutdown_time_left()
+
+    for task in tasks:
+        task.cancel()
+
+    if not tasks:
+        return
+
+    _, pending = await asyncio.wait(tasks, timeout=timeout)
+
+    if pending:
+        logger.warning("Tasks cut off after %ss: %s", timeout, len(pending))
+
+        for task in pending:
+            task.cancel()
+
+        await asyncio.wait(pending)
@@ -1,9 +1,196 @@
+import atexit
+import copy
+import json
 import logging
+import os
+import queue
+import sys
+from collections.abc import Mapping
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
 
-format = "%(asctime)s - %(levelname)s - %(name)s - %(message)s"
+TEXT_FORMAT = "%(asctime)s - %(levelname)s - %(name)s - %(message)s"
 
-logging.basicConfig(format=format, level=logging.INFO)
+# Attributes of every LogRecord, anything else was given through `extra`
+RECORD_ATTRIBUTES = set(vars(logging.makeLogRecord({}))) | {
+    "message",
+    "asctime",
+    "attributes",
+    "error",
+}
+
+_listener: QueueListener | None = None
 
 
 def Logger(module) -> logging.Logger:
     return logging.getLogger(module)
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line with the `extra` fields at the top level"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(
+                record.created, tz=timezone.utc
+            ).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+
+        for key, value in vars(record).items():
+            if key not in RECORD_ATTRIBUTES:
+                entry[key] = value
+
+        if getattr(record, "attributes", None) is not None:
+            entry["attributes"] = record.attributes
+
+        if getattr(record, "error", None) is not None:
+            entry["error"] = record.error
+
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+
+        return json.dumps(entry, default=str)
+
+
+class LogQueueHandler(QueueHandler):
+    """Hands the records over to the listener thread, which formats and writes them.
+    Only the message interpolation happens in the logging thread, and only for the
+    records that passed the level and sampling filters"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+
+        # logger.error(error.message, error.attributes)
+        if isinstance(record.args, Mapping):
+            record.attributes = dict(record.args)
+
+        # logger.error(error) with the repo's application or technical errors
+        if isinstance(record.msg, BaseException):
+            record.error = {
+                "type": type(record.msg).__name__,
+                "code": getattr(record.msg, "code", None),
+                "message": getattr(record.msg, "message", str(record.msg)),
+                "attributes": getattr(record.msg, "attributes", None),
+                "cause": repr(
+                    getattr(record.msg, "cause", None) or record.msg.__cause__
+                ),
+            }
+
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+
+        record.msg = record.getMessage()
+        record.message = record.msg
+        record.args = None
+        record.exc_info = None
+
+        return record
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps one of every N INFO or lower records of a logger and message template.
+    N is configured per logger name prefix, the longest configured prefix wins"""
+
+    def __init__(self, rates: dict[str, int]):
+        super().__init__()
+        self.rates = rates
+        self.logger_rates: dict[str, int] = {}
+        self.seen: dict[tuple[str, str], int] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.INFO:
+            return True
+
+        rate = self.__rate(record.name)
+
+        if rate <= 1:
+            return True
+
+        key = (record.name, record.msg if isinstance(record.msg, str) else "")
+        seen = self.seen.get(key, 0)
+        self.seen[key] = seen + 1
+
+        return seen % rate == 0
+
+    def __rate(self, name: str) -> int:
+        rate = self.logger_rates.get(name)
+
+        if rate is None:
+            prefixes = [
+                prefix
+                for prefix in self.rates
+                if name == prefix or name.startswith(f"{prefix}.")
+            ]
+            rate = self.rates[max(prefixes, key=len)] if prefixes else 1
+            self.logger_rates[name] = rate
+
+        return rate
+
+
+def parse_settings(value: str | None) -> dict[str, str]:
+    """Parses `name=value` pairs separated by commas"""
+    settings = {}
+
+    for pair in (value or "").split(","):
+        name, separator, setting = pair.partition("=")
+
+        if separator and name.strip():
+            settings[name.strip()] = setting.strip()
+
+    return settings
+
+
+def configure_logging() -> None:
+    """Sets up the process logging from the environment:
+
+    LOG_FORMAT   json (default) or text
+    LOG_LEVEL    root level, INFO by default
+    LOG_LEVELS   per logger levels, e.g. src.shared.pubsub=WARNING,sqlalchemy.engine=INFO
+    LOG_SAMPLING keep 1 of N INFO lines per logger, e.g. src.invoice.application=10
+    """
+    global _listener
+
+    if _listener is not None:
+        return
+
+    output = logging.StreamHandler(sys.stderr)
+    output.setFormatter(
+        logging.Formatter(TEXT_FORMAT)
+        if os.getenv("LOG_FORMAT", "json").lower() == "text"
+        else JsonFormatter()
+    )
+
+    log_queue = queue.SimpleQueue()
+    handler = LogQueueHandler(log_queue)
+    handler.addFilter(
+        SamplingFilter(
+            {
+                name: int(rate)
+                for name, rate in parse_settings(os.getenv("LOG_SAMPLING")).items()
+            }
+        )
+    )
+
+    root = logging.getLogger()
+    root.handlers = [handler]
+    root.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+
+    for name, level in parse_settings(os.getenv("LOG_LEVELS")).items():
+        logging.getLogger(name).setLevel(level.upper())
+
+    _listener = QueueListener(log_queue, output)
+    _listener.start()
+
+    atexit.register(stop_logging)
+
+
+def stop_logging() -> None:
+    """Writes the pending records and stops the listener thread"""
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
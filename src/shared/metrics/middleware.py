@@ -0,0 +1,80 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.shared.db.query_stats import current_query_stats
+from src.shared.metrics.model import metrics
+
+QUERIES_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89)
+
+requests_total = metrics.counter(
+    "http_requests_total", "Handled HTTP requests", ("method", "route", "status")
+)
+request_duration = metrics.histogram(
+    "http_request_duration_seconds",
+    "Time to handle an HTTP request",
+    ("method", "route"),
+)
+requests_in_flight = metrics.gauge(
+    "http_requests_in_flight", "HTTP requests being handled"
+)
+request_queries = metrics.histogram(
+    "http_request_db_queries",
+    "SQL statements run per HTTP request",
+    ("method", "route"),
+    buckets=QUERIES_BUCKETS,
+)
+request_db_duration = metrics.histogram(
+    "http_request_db_duration_seconds",
+    "Time spent in SQL statements per HTTP request",
+    ("method", "route"),
+)
+
+
+class MetricsMiddleware:
+    """Measures every HTTP request, labelled with the matched route template rather
+    than the raw path so ids do not explode the series"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+
+            if message["type"] == "http.response.start":
+                status = message["status"]
+
+            await send(message)
+
+        requests_in_flight.inc()
+        started = time.perf_counter()
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            duration = time.perf_counter() - started
+            requests_in_flight.dec()
+
+            # The router stores the matched route in the scope
+            route = scope.get("route")
+            labels = {
+                "method": scope["method"],
+                "route": route.path if route else "unmatched",
+            }
+
+            requests_total.inc(status=str(status), **labels)
+            request_duration.observe(duration, **labels)
+
+            # Tracked by the outer QueryStatsMiddleware
+            query_stats = current_query_stats()
+
+            if query_stats is not None:
+                request_queries.observe(query_stats.count, **labels)
+                request_db_duration.observe(query_stats.duration, **labels)
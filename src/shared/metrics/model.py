@@ -0,0 +1,153 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import TypeVar
+
+LabelValues = tuple[str, ...]
+
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.075,
+    0.1,
+    0.25,
+    0.5,
+    0.75,
+    1.0,
+    2.5,
+    5.0,
+    7.5,
+    10.0,
+)
+
+
+class Metric(ABC):
+    name: str
+    description: str
+    label_names: tuple[str, ...]
+
+    @property
+    @abstractmethod
+    def kind(self) -> str:
+        pass
+
+    def _label_values(self, labels: dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.label_names)
+
+
+@dataclass
+class Counter(Metric):
+    name: str
+    description: str
+    label_names: tuple[str, ...] = ()
+    values: dict[LabelValues, float] = field(default_factory=dict)
+
+    @property
+    def kind(self) -> str:
+        return "counter"
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._label_values(labels)
+        self.values[key] = self.values.get(key, 0) + amount
+
+
+@dataclass
+class Gauge(Metric):
+    name: str
+    description: str
+    label_names: tuple[str, ...] = ()
+    values: dict[LabelValues, float] = field(default_factory=dict)
+
+    @property
+    def kind(self) -> str:
+        return "gauge"
+
+    def set(self, value: float, **labels: str) -> None:
+        self.values[self._label_values(labels)] = value
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._label_values(labels)
+        self.values[key] = self.values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+
+@dataclass
+class HistogramSeries:
+    bucket_counts: list[int]
+    sum: float = 0
+    count: int = 0
+
+
+@dataclass
+class Histogram(Metric):
+    name: str
+    description: str
+    label_names: tuple[str, ...] = ()
+    buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    series: dict[LabelValues, HistogramSeries] = field(default_factory=dict)
+
+    @property
+    def kind(self) -> str:
+        return "histogram"
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._label_values(labels)
+        series = self.series.get(key)
+
+        if series is None:
+            series = HistogramSeries(bucket_counts=[0] * len(self.buckets))
+            self.series[key] = series
+
+        # Counts are kept per bucket and made cumulative when rendered
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                series.bucket_counts[index] += 1
+                break
+
+        series.sum += value
+        series.count += 1
+
+
+MetricType = TypeVar("MetricType", bound=Metric)
+
+
+class MetricsRegistry:
+    """Process local metrics. Each module declares the metrics it records at import
+    time, asking twice for the same name returns the same metric"""
+
+    def __init__(self):
+        self.metrics: dict[str, Metric] = {}
+
+    def counter(
+        self, name: str, description: str, labels: tuple[str, ...] = ()
+    ) -> Counter:
+        return self.__register(Counter(name, description, labels))
+
+    def gauge(self, name: str, description: str, labels: tuple[str, ...] = ()) -> Gauge:
+        return self.__register(Gauge(name, description, labels))
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self.__register(Histogram(name, description, labels, buckets))
+
+    def collect(self) -> list[Metric]:
+        return list(self.metrics.values())
+
+    def __register(self, metric: MetricType) -> MetricType:
+        registered = self.metrics.setdefault(metric.name, metric)
+
+        if type(registered) is not type(metric):
+            raise ValueError(f"Metric {metric.name} is already a {registered.kind}")
+
+        return registered
+
+
+metrics = MetricsRegistry()
@@ -0,0 +1,173 @@
+"""Metrics of every worker process of the server.
+
+Each worker keeps its own registry and writes a snapshot of it to METRICS_DIR every
+METRICS_SYNC_SECONDS. The worker answering /metrics adds its live registry to the
+snapshots of the others: counters and histograms are summed, and so are the gauges.
+A restarted worker starts its series from zero again, which Prometheus reads as a
+counter reset. Without METRICS_DIR, as when the app runs in a single process, only
+the process registry is exposed.
+"""
+
+import asyncio
+import os
+from pathlib import Path
+
+from src.shared.logging.log import Logger
+from src.shared.metrics.model import (
+    Counter,
+    Gauge,
+    Histogram,
+    HistogramSeries,
+    LabelValues,
+    MetricsRegistry,
+)
+from src.shared.serialization.json_codec import dumps, loads
+
+logger = Logger(__name__)
+
+METRICS_SYNC_SECONDS = float(os.getenv("METRICS_SYNC_SECONDS", "5"))
+
+
+def metrics_dir() -> Path | None:
+    directory = os.getenv("METRICS_DIR")
+
+    return Path(directory) if directory else None
+
+
+def worker_index() -> str:
+    return os.getenv("WORKER_INDEX", str(os.getpid()))
+
+
+def snapshot(registry: MetricsRegistry) -> list[dict]:
+    snapshots = []
+
+    for metric in registry.collect():
+        entry = {
+            "kind": metric.kind,
+            "name": metric.name,
+            "description": metric.description,
+            "labels": list(metric.label_names),
+        }
+
+        if isinstance(metric, Histogram):
+            entry["buckets"] = list(metric.buckets)
+            entry["series"] = [
+                [list(labels), series.bucket_counts, series.sum, series.count]
+                for labels, series in metric.series.items()
+            ]
+        else:
+            entry["values"] = [
+                [list(labels), value] for labels, value in metric.values.items()
+            ]
+
+        snapshots.append(entry)
+
+    return snapshots
+
+
+def merge(snapshots: list[list[dict]]) -> MetricsRegistry:
+    registry = MetricsRegistry()
+
+    for entries in snapshots:
+        for entry in entries:
+            labels = tuple(entry["labels"])
+
+            match entry["kind"]:
+                case "histogram":
+                    histogram = registry.histogram(
+                        entry["name"],
+                        entry["description"],
+                        labels,
+                        buckets=tuple(entry["buckets"]),
+                    )
+
+                    for values, bucket_counts, total, count in entry["series"]:
+                        _merge_series(
+                            histogram, tuple(values), bucket_counts, total, count
+                        )
+                case kind:
+                    factory = registry.counter if kind == "counter" else registry.gauge
+                    metric: Counter | Gauge = factory(
+                        entry["name"], entry["description"], labels
+                    )
+
+                    for values, value in entry["values"]:
+                        key = tuple(values)
+                        metric.values[key] = metric.values.get(key, 0) + value
+
+    return registry
+
+
+def _merge_series(
+    histogram: Histogram,
+    key: LabelValues,
+    bucket_counts: list[int],
+    total: float,
+    count: int,
+) -> None:
+    series = histogram.series.setdefault(
+        key, HistogramSeries(bucket_counts=[0] * len(histogram.buckets))
+    )
+
+    series.bucket_counts = [
+        current + added for current, added in zip(series.bucket_counts, bucket_counts)
+    ]
+    series.sum += total
+    series.count += count
+
+
+def write_snapshot(registry: MetricsRegistry, directory: Path) -> None:
+    _write(directory, dumps(snapshot(registry)))
+
+
+def _write(directory: Path, data: bytes) -> None:
+    """Replaces the worker snapshot atomically, a reader never sees half of it"""
+    path = directory / f"worker-{worker_index()}.json"
+    partial = path.with_suffix(".tmp")
+
+    partial.write_bytes(data)
+    os.replace(partial, path)
+
+
+def read_snapshots(directory: Path) -> list[list[dict]]:
+    own = f"worker-{worker_index()}.json"
+    snapshots = []
+
+    for path in directory.glob("worker-*.json"):
+        if path.name == own:
+            continue
+
+        try:
+            snapshots.append(loads(path.read_bytes()))
+        except (OSError, ValueError) as e:
+            logger.warning("Skipped a metrics snapshot: path=%s, error=%s", path, e)
+
+    return snapshots
+
+
+async def aggregated(registry: MetricsRegistry) -> MetricsRegistry:
+    """The registry of this process together with the snapshots of the others"""
+    directory = metrics_dir()
+
+    if directory is None:
+        return registry
+
+    others = await asyncio.to_thread(read_snapshots, directory)
+
+    return merge([snapshot(registry), *others])
+
+
+async def sync_snapshots(registry: MetricsRegistry) -> None:
+    """Writes the process snapshot until cancelled, and a last one then"""
+    directory = metrics_dir()
+
+    if directory is None:
+        return
+
+    try:
+        while True:
+            await asyncio.to_thread(_write, directory, dumps(snapshot(registry)))
+
+            await asyncio.sleep(METRICS_SYNC_SECONDS)
+    finally:
+        write_snapshot(registry, directory)
@@ -0,0 +1,81 @@
+from src.shared.metrics.model import (
+    Counter,
+    Gauge,
+    Histogram,
+    LabelValues,
+    Metric,
+    MetricsRegistry,
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def render(registry: MetricsRegistry) -> str:
+    """Renders the metrics in the Prometheus text exposition format"""
+    lines = []
+
+    for metric in registry.collect():
+        lines.append(f"# HELP {metric.name} {_escape_help(metric.description)}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        lines.extend(_samples(metric))
+
+    return "\n".join(lines) + "\n"
+
+
+def _samples(metric: Metric) -> list[str]:
+    match metric:
+        case Counter() | Gauge():
+            return [
+                f"{metric.name}{_labels(metric.label_names, values)} {_number(value)}"
+                for values, value in metric.values.items()
+            ]
+        case Histogram():
+            return _histogram_samples(metric)
+
+    return []
+
+
+def _histogram_samples(histogram: Histogram) -> list[str]:
+    samples = []
+
+    for values, series in histogram.series.items():
+        cumulative = 0
+
+        for bound, count in zip(histogram.buckets, series.bucket_counts):
+            cumulative += count
+            labels = _labels(
+                histogram.label_names + ("le",), values + (_number(bound),)
+            )
+            samples.append(f"{histogram.name}_bucket{labels} {cumulative}")
+
+        labels = _labels(histogram.label_names + ("le",), values + ("+Inf",))
+        samples.append(f"{histogram.name}_bucket{labels} {series.count}")
+
+        labels = _labels(histogram.label_names, values)
+        samples.append(f"{histogram.name}_sum{labels} {_number(series.sum)}")
+        samples.append(f"{histogram.name}_count{labels} {series.count}")
+
+    return samples
+
+
+def _labels(names: tuple[str, ...], values: LabelValues) -> str:
+    if not names:
+        return ""
+
+    pairs = ",".join(
+        f'{name}="{_escape_label(value)}"' for name, value in zip(names, values)
+    )
+
+    return f"{{{pairs}}}"
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
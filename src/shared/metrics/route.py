@@ -0,0 +1,13 @@
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from src.shared.metrics.model import metrics
+from src.shared.metrics.multiprocess import aggregated
+from src.shared.metrics.prometheus import CONTENT_TYPE, render
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    return Response(content=render(await aggregated(metrics)), media_type=CONTENT_TYPE)
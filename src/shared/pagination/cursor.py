@@ -0,0 +1,53 @@
+import base64
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+from src.shared.pagination.errors import InvalidCursorError
+
+SortKey = str | int | Decimal | date | datetime
+
+
+def encode_cursor(keys: tuple[SortKey, ...]) -> str:
+    """Encodes the sort key values of the last row of a page as an opaque url-safe token"""
+    payload = json.dumps([_encode_key(key) for key in keys], separators=(",", ":"))
+
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[SortKey, ...]:
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(cursor + padding))
+
+        return tuple(_decode_key(key) for key in payload)
+    except Exception as e:
+        raise InvalidCursorError(cursor=cursor) from e
+
+
+def _encode_key(key: SortKey) -> str | int | dict:
+    match key:
+        case datetime():
+            return {"datetime": key.isoformat()}
+        case date():
+            return {"date": key.isoformat()}
+        case Decimal():
+            return {"decimal": str(key)}
+        case str() | int():
+            return key
+        case _:
+            raise ValueError(f"Unsupported cursor key type: {type(key)}")
+
+
+def _decode_key(key: str | int | dict) -> SortKey:
+    match key:
+        case {"datetime": value}:
+            return datetime.fromisoformat(value)
+        case {"date": value}:
+            return date.fromisoformat(value)
+        case {"decimal": value}:
+            return Decimal(value)
+        case str() | int():
+            return key
+        case _:
+            raise ValueError(f"Unsupported cursor key: {key}")
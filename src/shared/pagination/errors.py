@@ -0,0 +1,9 @@
+from src.shared.errors.application import ApplicationError
+
+
+def InvalidCursorError(cursor: str) -> ApplicationError:
+    return ApplicationError(
+        code="InvalidCursorError",
+        message=f"The pagination cursor is not valid",
+        attributes={"cursor": cursor},
+    )
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class PageRequest:
+    limit: int
+    cursor: str | None = None
+
+
+@dataclass(frozen=True)
+class PageLimits:
+    default: int
+    maximum: int
+
+    def request(self, cursor: str | None, limit: int | None) -> PageRequest:
+        """Builds a page request clamping the requested limit to [1, maximum]"""
+        if limit is None:
+            return PageRequest(limit=self.default, cursor=cursor)
+
+        return PageRequest(limit=max(1, min(limit, self.maximum)), cursor=cursor)
@@ -1,24 +1,62 @@
-import json
+import os
+import time
 
 from src.shared.logging.log import Logger
 from src.shared.redis.connection_factory import get_connection
 from src.shared.pubsub.publisher import Publisher
 from src.shared.errors.technical import TechnicalError
+from src.shared.serialization.json_codec import dumps
+from src.shared.metrics.model import metrics
+from src.shared.tracing.tracer import SpanKind, tracer
 
 logger = Logger(__name__)
 
+# Entries a stream keeps, the oldest are trimmed past it
+STREAM_MAX_LENGTH = int(os.getenv("STREAM_MAX_LENGTH", "10000"))
+
+publish_duration = metrics.histogram(
+    "redis_publish_duration_seconds",
+    "Time to publish a message to Redis",
+    ("subscription",),
+)
+
 
 class RedisPublisher(Publisher):
-    def __init__(self):
+    """Publishes to the subscribers listening at the time, or, when durable, appends
+    the message to a stream where it waits for a RedisStreamSubscriber to read and
+    acknowledge it"""
+
+    def __init__(self, durable: bool = False):
         self.connection = get_connection()
+        self.durable = durable
 
     async def publish(self, subscription: str, data: dict) -> None:
         try:
-            logger.info(
-                f"About to dispatch a message: subs={subscription}, data={data}"
+            logger.debug(
+                "About to dispatch a message: subs=%s, data=%s", subscription, data
             )
 
-            await self.connection.publish(subscription, json.dumps(data))
+            with tracer.start_span(
+                f"{subscription} publish",
+                kind=SpanKind.PRODUCER,
+                attributes={"messaging.destination.name": subscription},
+            ):
+                # The trace context travels in the payload to the subscribers
+                message = dumps(tracer.inject(dict(data)))
+
+                started = time.perf_counter()
+                if self.durable:
+                    await self.connection.xadd(
+                        subscription,
+                        {"data": message},
+                        maxlen=STREAM_MAX_LENGTH,
+                        approximate=True,
+                    )
+                else:
+                    await self.connection.publish(subscription, message)
+                publish_duration.observe(
+                    time.perf_counter() - started, subscription=subscription
+                )
         except Exception as e:
             error = TechnicalError(
                 code="RedisPublisherError",
@@ -32,4 +70,8 @@ class RedisPublisher(Publisher):
             raise error from e
 
 def create_publisher() -> Publisher:
-    return RedisPublisher()
\ No newline at end of file
+    return RedisPublisher()
+
+
+def create_durable_publisher() -> Publisher:
+    return RedisPublisher(durable=True)
\ No newline at end of file
@@ -0,0 +1,136 @@
+import asyncio
+import os
+import socket
+
+from redis.exceptions import ResponseError
+
+from src.shared.errors.technical import TechnicalError
+from src.shared.logging.log import Logger
+from src.shared.pubsub.impl.redis_subscriber import process_message
+from src.shared.pubsub.subscriber import AsyncCallbackType, Subscriber
+from src.shared.redis.connection_factory import get_connection
+
+logger = Logger(__name__)
+
+# Consumer group the workers share, each message goes to one of them
+STREAM_GROUP = os.getenv("STREAM_GROUP", "workers")
+
+# Seconds a message read by a consumer stays unacknowledged before another consumer
+# takes it over, it has to outlast the slowest processing
+STREAM_CLAIM_IDLE_SECONDS = float(os.getenv("STREAM_CLAIM_IDLE_SECONDS", "600"))
+
+STREAM_BLOCK_MS = 5000
+
+
+class RedisStreamSubscriber(Subscriber):
+    """Reads the messages of a stream as a member of a consumer group, so they wait in
+    the stream while no worker runs, and acknowledges each one once processed. A
+    failed message is logged and acknowledged, as with pub/sub, while the ones a
+    stopped worker left unacknowledged are taken over after STREAM_CLAIM_IDLE_SECONDS.
+    Processes up to `concurrency` messages at a time"""
+
+    def __init__(self, concurrency: int = 1, group: str = STREAM_GROUP):
+        self.connection = get_connection()
+        self.concurrency = concurrency
+        self.group = group
+        self.consumer = f"{socket.gethostname()}-{os.getpid()}"
+
+    async def subscribe(self, subscription: str, process: AsyncCallbackType) -> None:
+        in_flight: set[asyncio.Task] = set()
+        slots = asyncio.Semaphore(self.concurrency)
+
+        try:
+            await self.__create_group(subscription)
+
+            while True:
+                await slots.acquire()
+
+                entry = await self.__next_entry(subscription)
+
+                if entry is None:
+                    slots.release()
+                    continue
+
+                processing = asyncio.create_task(
+                    self.__process(subscription, *entry, process)
+                )
+                in_flight.add(processing)
+                processing.add_done_callback(in_flight.discard)
+                processing.add_done_callback(lambda _: slots.release())
+        except asyncio.CancelledError:
+            # Stopping, the messages in hand are processed first
+            if in_flight:
+                await asyncio.gather(*in_flight)
+
+            raise
+        except Exception as e:
+            error = TechnicalError(
+                code="RedisSubscriberError",
+                message=f"Error occured while consuming the stream {subscription}",
+                attributes={"subscription": subscription, "group": self.group},
+                cause=e,
+            )
+
+            logger.error(error)
+
+            raise error from e
+
+    async def __create_group(self, subscription: str) -> None:
+        """From the start of the stream, so the messages published before the first
+        worker ran are processed too"""
+        try:
+            await self.connection.xgroup_create(
+                subscription, self.group, id="0", mkstream=True
+            )
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def __next_entry(self, subscription: str) -> tuple[str, str] | None:
+        """A message left unacknowledged by a stopped consumer, otherwise a new one"""
+        _, claimed, *_ = await self.connection.xautoclaim(
+            subscription,
+            self.group,
+            self.consumer,
+            min_idle_time=int(STREAM_CLAIM_IDLE_SECONDS * 1000),
+            count=1,
+        )
+
+        if not claimed:
+            streams = await self.connection.xreadgroup(
+                self.group,
+                self.consumer,
+                {subscription: ">"},
+                count=1,
+                block=STREAM_BLOCK_MS,
+            )
+            claimed = [entry for _, entries in streams or [] for entry in entries]
+
+        for entry_id, fields in claimed:
+            if entry_id is None:
+                continue
+
+            if fields:
+                return entry_id, fields["data"]
+
+            # Trimmed from the stream before it was processed
+            await self.connection.xack(subscription, self.group, entry_id)
+
+        return None
+
+    async def __process(
+        self, subscription: str, entry_id: str, data: str, process: AsyncCallbackType
+    ) -> None:
+        await process_message(subscription, data, process)
+
+        try:
+            await self.connection.xack(subscription, self.group, entry_id)
+        except Exception as e:
+            error = TechnicalError(
+                code="RedisSubscriberAckError",
+                message=f"Fail acknowledging a message of {subscription}",
+                attributes={"subscription": subscription, "entry_id": entry_id},
+                cause=e,
+            )
+
+            logger.error(error)
@@ -1,16 +1,27 @@
+import asyncio
+
 from src.shared.logging.log import Logger
 from src.shared.redis.connection_factory import get_connection
 from src.shared.pubsub.subscriber import Subscriber, AsyncCallbackType
 from src.shared.errors.technical import TechnicalError
+from src.shared.serialization.json_codec import loads
+from src.shared.tracing.tracer import SpanContext, SpanKind, tracer
 
 logger = Logger(__name__)
 
 
 class RedisSubscriber(Subscriber):
-    def __init__(self):
+    """Processes up to `concurrency` messages at a time. Once they are all in hand no
+    more messages are read, the rest wait in the connection buffer"""
+
+    def __init__(self, concurrency: int = 1):
         self.connection = get_connection()
+        self.concurrency = concurrency
 
     async def subscribe(self, subscription: str, process: AsyncCallbackType) -> None:
+        in_flight: set[asyncio.Task] = set()
+        slots = asyncio.Semaphore(self.concurrency)
+
         try:
             pubsub = self.connection.pubsub()
 
@@ -18,13 +29,20 @@ class RedisSubscriber(Subscriber):
 
             async for message in pubsub.listen():
                 if message["type"] == "message" and message["channel"] == subscription:
-                    data = message["data"]
+                    await slots.acquire()
 
-                    logger.info(
-                        f"About to process a message: subs={subscription}, data={data}"
+                    processing = asyncio.create_task(
+                        process_message(subscription, message["data"], process)
                     )
+                    in_flight.add(processing)
+                    processing.add_done_callback(in_flight.discard)
+                    processing.add_done_callback(lambda _: slots.release())
+        except asyncio.CancelledError:
+            # Stopping, the messages in hand are processed first
+            if in_flight:
+                await asyncio.gather(*in_flight)
 
-                    await process(data)
+            raise
         except Exception as e:
             error = TechnicalError(
                 code="RedisSubscriberError",
@@ -38,5 +56,45 @@ class RedisSubscriber(Subscriber):
             raise error from e
 
 
-def create_subscriber() -> Subscriber:
-    return RedisSubscriber()
+async def process_message(
+    subscription: str, data: str, process: AsyncCallbackType
+) -> None:
+    """Processes a message within a consumer span continuing the publisher trace, a
+    failure is logged so it does not stop the subscription"""
+    logger.debug(
+        "About to process a message: subs=%s, data=%s",
+        subscription,
+        data,
+    )
+
+    try:
+        with tracer.start_span(
+            f"{subscription} process",
+            kind=SpanKind.CONSUMER,
+            attributes={"messaging.destination.name": subscription},
+            parent=_trace_context(data),
+        ):
+            await process(data)
+    except Exception as e:
+        error = TechnicalError(
+            code="RedisSubscriberProcessError",
+            message=f"Error occured while processing a message of {subscription}",
+            attributes={"subscription": subscription},
+            cause=e,
+        )
+
+        logger.error(error)
+
+
+def _trace_context(data: str) -> SpanContext | None:
+    if not tracer.enabled:
+        return None
+
+    try:
+        return tracer.extract(loads(data))
+    except (ValueError, AttributeError):
+        return None
+
+
+def create_subscriber(concurrency: int = 1) -> Subscriber:
+    return RedisSubscriber(concurrency=concurrency)
@@ -1,17 +1,38 @@
 import os
 import redis.asyncio as redis
 
-REDIS_HOST = os.getenv("REDIS_HOST")
-REDIS_PORT = os.getenv("REDIS_PORT")
-REDIS_PASSWORD = os.getenv("REDIS_PASSWORD")
+_pool: redis.ConnectionPool | None = None
+
+
+def get_pool() -> redis.ConnectionPool:
+    """Creates the process connection pool on first use, shared by every client"""
+    global _pool
+
+    if _pool is None:
+        REDIS_HOST = os.getenv("REDIS_HOST")
+        REDIS_PORT = os.getenv("REDIS_PORT")
+        REDIS_PASSWORD = os.getenv("REDIS_PASSWORD")
+
+        _pool = redis.ConnectionPool(
+            host=REDIS_HOST,
+            port=REDIS_PORT,
+            password=REDIS_PASSWORD,
+            decode_responses=True,
+        )
+
+    return _pool
+
+
+async def close_pool() -> None:
+    global _pool
+
+    if _pool is not None:
+        pool, _pool = _pool, None
+
+        await pool.aclose()
 
 
 def get_connection():
-    redis_client = redis.Redis(
-        host=REDIS_HOST,
-        port=REDIS_PORT,
-        password=REDIS_PASSWORD,
-        decode_responses=True,
-    )
+    redis_client = redis.Redis(connection_pool=get_pool())
 
     return redis_client
@@ -0,0 +1,111 @@
+import atexit
+import json
+import os
+import queue
+import sys
+import threading
+from datetime import datetime, timezone
+from typing import TextIO
+
+from src.shared.tracing.tracer import Span, tracer
+
+SERVICE_NAME = "mattilda"
+
+
+def as_json(span: Span) -> str:
+    """Same shape as the OpenTelemetry console exporter output"""
+    return json.dumps(
+        {
+            "name": span.name,
+            "context": {
+                "trace_id": f"0x{span.context.trace_id}",
+                "span_id": f"0x{span.context.span_id}",
+                "trace_state": "[]",
+            },
+            "kind": f"SpanKind.{span.kind.name}",
+            "parent_id": f"0x{span.parent.span_id}" if span.parent else None,
+            "start_time": _timestamp(span.start_time_ns),
+            "end_time": _timestamp(span.end_time_ns),
+            "status": {
+                "status_code": span.status.name,
+                **(
+                    {"description": span.status_description}
+                    if span.status_description
+                    else {}
+                ),
+            },
+            "attributes": span.attributes,
+            "events": [],
+            "links": [],
+            "resource": {
+                "attributes": {"service.name": SERVICE_NAME},
+                "schema_url": "",
+            },
+        },
+        default=str,
+    )
+
+
+def _timestamp(time_ns: int | None) -> str | None:
+    if time_ns is None:
+        return None
+
+    return datetime.fromtimestamp(time_ns / 1e9, tz=timezone.utc).isoformat()
+
+
+class JsonLinesSpanExporter:
+    """Writes the finished spans, one JSON per line, from a background thread so the
+    event loop never waits on the stream"""
+
+    def __init__(self, stream: TextIO, close_stream: bool = False):
+        self.stream = stream
+        self.close_stream = close_stream
+        self.spans: queue.SimpleQueue[Span | None] = queue.SimpleQueue()
+        self.thread = threading.Thread(
+            target=self.__write, name="span-exporter", daemon=True
+        )
+        self.thread.start()
+
+    def export(self, span: Span) -> None:
+        self.spans.put(span)
+
+    def shutdown(self) -> None:
+        self.spans.put(None)
+        self.thread.join()
+
+        if self.close_stream:
+            self.stream.close()
+
+    def __write(self) -> None:
+        while (span := self.spans.get()) is not None:
+            self.stream.write(as_json(span) + "\n")
+
+            if self.spans.empty():
+                self.stream.flush()
+
+        self.stream.flush()
+
+
+def configure_tracing() -> None:
+    """Enables the tracer from the environment:
+
+    TRACING_EXPORTER console, to stderr, or file. Disabled when not set
+    TRACING_FILE     file the spans are appended to, traces.jsonl by default
+    """
+    if tracer.exporter is not None:
+        return
+
+    match os.getenv("TRACING_EXPORTER", "").lower():
+        case "console":
+            exporter = JsonLinesSpanExporter(sys.stderr)
+        case "file":
+            exporter = JsonLinesSpanExporter(
+                open(os.getenv("TRACING_FILE", "traces.jsonl"), "a"),
+                close_stream=True,
+            )
+        case _:
+            return
+
+    tracer.exporter = exporter
+
+    atexit.register(exporter.shutdown)
@@ -0,0 +1,177 @@
+import functools
+import inspect
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Iterator, Protocol, TypeVar
+
+TRACEPARENT = "traceparent"
+
+
+class SpanKind(Enum):
+    INTERNAL = "INTERNAL"
+    SERVER = "SERVER"
+    CLIENT = "CLIENT"
+    PRODUCER = "PRODUCER"
+    CONSUMER = "CONSUMER"
+
+
+class StatusCode(Enum):
+    UNSET = "UNSET"
+    OK = "OK"
+    ERROR = "ERROR"
+
+
+@dataclass(frozen=True)
+class SpanContext:
+    trace_id: str
+    span_id: str
+
+    def as_traceparent(self) -> str:
+        """W3C trace context header value"""
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    @staticmethod
+    def from_traceparent(value: str | None) -> "SpanContext | None":
+        parts = (value or "").split("-")
+
+        if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+            return None
+
+        return SpanContext(trace_id=parts[1], span_id=parts[2])
+
+
+@dataclass
+class Span:
+    name: str
+    context: SpanContext
+    kind: SpanKind
+    parent: SpanContext | None
+    start_time_ns: int
+    end_time_ns: int | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    status: StatusCode = StatusCode.UNSET
+    status_description: str | None = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def record_exception(self, error: BaseException) -> None:
+        self.status = StatusCode.ERROR
+        self.status_description = str(error)
+        self.attributes["exception.type"] = type(error).__name__
+        self.attributes["exception.message"] = str(error)
+
+        code = getattr(error, "code", None)
+
+        if code is not None:
+            self.attributes["exception.code"] = code
+
+
+class SpanExporter(Protocol):
+    def export(self, span: Span) -> None:
+        pass
+
+    def shutdown(self) -> None:
+        pass
+
+
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+class Tracer:
+    """Creates spans following the OpenTelemetry data model and W3C trace context.
+    Without an exporter it is disabled and spans cost a context manager call"""
+
+    def __init__(self):
+        self.exporter: SpanExporter | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+
+    @contextmanager
+    def start_span(
+        self,
+        name: str,
+        kind: SpanKind = SpanKind.INTERNAL,
+        attributes: dict[str, Any] | None = None,
+        parent: SpanContext | None = None,
+    ) -> Iterator[Span | None]:
+        """Starts a span, child of `parent` or else of the current span, and makes it
+        the current one until the block exits"""
+        if self.exporter is None:
+            yield None
+            return
+
+        current = _current_span.get()
+        parent = parent or (current.context if current else None)
+        span = Span(
+            name=name,
+            context=SpanContext(
+                trace_id=parent.trace_id if parent else os.urandom(16).hex(),
+                span_id=os.urandom(8).hex(),
+            ),
+            kind=kind,
+            parent=parent,
+            start_time_ns=time.time_ns(),
+            attributes=dict(attributes or {}),
+        )
+        token = _current_span.set(span)
+
+        try:
+            yield span
+        except BaseException as error:
+            span.record_exception(error)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end_time_ns = time.time_ns()
+            self.exporter.export(span)
+
+    def inject(self, carrier: dict) -> dict:
+        """Adds the current trace context to a message"""
+        current = _current_span.get()
+
+        if current is not None:
+            carrier[TRACEPARENT] = current.context.as_traceparent()
+
+        return carrier
+
+    def extract(self, carrier: dict) -> SpanContext | None:
+        return SpanContext.from_traceparent(carrier.get(TRACEPARENT))
+
+
+tracer = Tracer()
+
+Traced = TypeVar("Traced", bound=Callable | type)
+
+
+def traced(target: Traced) -> Traced:
+    """Runs a coroutine function in its own span. On a class, traces each of its
+    public coroutine methods, named after the class and the method"""
+    if inspect.isclass(target):
+        for name, member in list(vars(target).items()):
+            if not name.startswith("_") and inspect.iscoroutinefunction(member):
+                setattr(
+                    target, name, _traced_function(member, f"{target.__name__}.{name}")
+                )
+
+        return target
+
+    return _traced_function(target, target.__qualname__)
+
+
+def _traced_function(function: Callable, name: str) -> Callable:
+    @functools.wraps(function)
+    async def wrapper(*args, **kwargs):
+        if not tracer.enabled:
+            return await function(*args, **kwargs)
+
+        with tracer.start_span(name):
+            return await function(*args, **kwargs)
+
+    return wrapper
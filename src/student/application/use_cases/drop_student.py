@@ -3,19 +3,21 @@ from src.shared.errors.business import BusinessError
 from src.shared.logging.log import Logger
 from src.student.domain.repository import ById, StudentRepository
 from src.student.domain.model import Student
+from src.shared.tracing.tracer import traced
 
 logger = Logger(__name__)
 
 DROP_STUDENT_TOPIC = "student.dropped"
 
 
+@traced
 class DropStudent:
     def __init__(self, students: StudentRepository, publisher: Publisher):
         self.students = students
         self.publisher = publisher
 
     async def execute(self, student_id: str) -> Student:
-        logger.info(f"About to drop a student: id={student_id}")
+        logger.info("About to drop a student: id=%s", student_id)
 
         query = ById(id=student_id)
         student = await self.students.get(query=query)
@@ -0,0 +1,93 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import AsyncIterator
+
+from src.shared.contact.model import Contact
+from src.shared.errors.technical import TechnicalError
+from src.shared.id.generator import IdGenerator
+from src.shared.logging.log import Logger
+from src.student.application.use_cases.register_student import (
+    Request as RegisterStudentRequest,
+)
+from src.student.domain.model import Student
+from src.student.domain.repository import RejectedRow, StudentRepository
+from src.shared.tracing.tracer import traced
+
+logger = Logger(__name__)
+
+
+@dataclass
+class Batch:
+    rows: list[tuple[int, RegisterStudentRequest]]
+    rejected: list[RejectedRow]
+
+
+@dataclass
+class ImportReport:
+    imported: int = 0
+    rejected: list[RejectedRow] = field(default_factory=list)
+
+
+@traced
+class ImportStudents:
+    def __init__(self, students: StudentRepository, id_generator: IdGenerator):
+        self.students = students
+        self.id_generator = id_generator
+
+    async def execute(self, batches: AsyncIterator[Batch]) -> ImportReport:
+        logger.info("About to import students")
+
+        report = ImportReport()
+
+        async for batch in batches:
+            report.rejected.extend(batch.rejected)
+
+            if not batch.rows:
+                continue
+
+            at = datetime.now()
+            students = [
+                (row, await self.__build_student(request, at))
+                for row, request in batch.rows
+            ]
+
+            try:
+                rejected = await self.students.import_many(students)
+            except TechnicalError as error:
+                rejected = [
+                    RejectedRow(row=row, code=error.code, message=error.message)
+                    for row, _ in batch.rows
+                ]
+
+            report.imported += len(batch.rows) - len(rejected)
+            report.rejected.extend(rejected)
+
+        report.rejected.sort(key=lambda rejected_row: rejected_row.row)
+
+        logger.info(
+            "Students import finished: imported=%s, rejected=%s",
+            report.imported,
+            len(report.rejected),
+        )
+
+        return report
+
+    async def __build_student(
+        self, request: RegisterStudentRequest, at: datetime
+    ) -> Student:
+        contact = Contact(
+            id=await self.id_generator.generate(),
+            email=request.email,
+            phone=request.phone,
+            address=request.address,
+        )
+
+        return Student.of(
+            id=await self.id_generator.generate(),
+            age=request.age,
+            contact=contact,
+            identity=request.identity,
+            last_name=request.last_name,
+            first_name=request.first_name,
+            at=at,
+        )
@@ -1,3 +1,4 @@
+import asyncio
 from dataclasses import asdict, dataclass
 
 from src.shared.contact.model import Contact
@@ -6,6 +7,7 @@ from src.shared.errors.application import AlreadyExistsError
 from src.shared.logging.log import Logger
 from src.student.domain.repository import ByIdentity, StudentRepository
 from src.student.domain.model import Identity, Student
+from src.shared.tracing.tracer import traced
 
 logger = Logger(__name__)
 
@@ -21,16 +23,21 @@ class Request:
     address: str
 
 
+@traced
 class RegisterStudent:
     def __init__(self, students: StudentRepository, id_generator: IdGenerator):
         self.id_generator = id_generator
         self.students = students
 
     async def execute(self, request: Request) -> Student:
-        logger.info(f"About to register student: identity={asdict(request.identity)}")
+        logger.info("About to register student: identity=%s", request.identity)
 
         query = ByIdentity(identity=request.identity)
-        exists_student = await self.students.exists(query=query)
+        exists_student, contact_id, student_id = await asyncio.gather(
+            self.students.exists(query=query),
+            self.id_generator.generate(),
+            self.id_generator.generate(),
+        )
 
         if exists_student:
             error = AlreadyExistsError(resource="Student", attributes=asdict(request))
@@ -39,14 +46,12 @@ class RegisterStudent:
 
             raise error
 
-        contact_id = await self.id_generator.generate()
         contact = Contact(
             id=contact_id,
             email=request.email,
             phone=request.phone,
             address=request.address,
         )
-        student_id = await self.id_generator.generate()
         new_student = Student.of(
             id=student_id,
             age=request.age,
@@ -1,7 +1,12 @@
+from datetime import datetime
+
+from src.shared.pagination.model import PageRequest
 from src.student.domain.repository import Query, StudentRepository
 from src.student.domain.model import Student
+from src.shared.tracing.tracer import traced
 
 
+@traced
 class StudentQueryHandler:
     def __init__(self, students: StudentRepository):
         self.students = students
@@ -12,5 +17,8 @@ class StudentQueryHandler:
     async def find(self, query: Query) -> Student | None:
         return await self.students.find(query=query)
 
-    async def list(self, next_cursor: str | None) -> tuple[str | None, list[Student]]:
-        return await self.students.list(next_cursor=next_cursor)
+    async def version(self, id: str) -> datetime | None:
+        return await self.students.version(id=id)
+
+    async def list(self, page: PageRequest) -> tuple[str | None, list[Student]]:
+        return await self.students.list(page=page)
@@ -1,10 +1,11 @@
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 
 from src.shared.contact.model import Contact
 from src.shared.id.generator import IdGenerator
 from src.shared.logging.log import Logger
 from src.student.domain.repository import ById, StudentRepository
 from src.student.domain.model import Student
+from src.shared.tracing.tracer import traced
 
 logger = Logger(__name__)
 
@@ -20,13 +21,14 @@ class Request:
     address: str | None
 
 
+@traced
 class UpdateStudent:
     def __init__(self, students: StudentRepository, id_generator: IdGenerator):
         self.id_generator = id_generator
         self.students = students
 
     async def execute(self, request: Request) -> Student:
-        logger.info(f"About to update a student: request={asdict(request)}")
+        logger.info("About to update a student: request=%s", request)
 
         query = ById(id=request.id)
         student = await self.students.get(query=query)
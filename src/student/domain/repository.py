@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
 from dataclasses import asdict, dataclass
+from datetime import datetime
 
 from src.shared.errors.application import NotFoundError
-from src.student.domain.model import Identity, Student
+from src.shared.pagination.model import PageRequest
+from src.student.domain.model import Identity, Student, StudentStatus
 
 
 class Query(ABC):
@@ -19,6 +21,13 @@ class ByIdentity(Query):
     identity: Identity
 
 
+@dataclass
+class RejectedRow:
+    row: int
+    code: str
+    message: str
+
+
 class StudentRepository(ABC):
     async def get(self, query: Query) -> Student:
         found_student = await self.find(query)
@@ -37,7 +46,25 @@ class StudentRepository(ABC):
         pass
 
     @abstractmethod
-    async def list(self, next_cursor: str | None) -> tuple[str | None, list[Student]]:
+    async def version(self, id: str) -> datetime | None:
+        """Last update of the student, for conditional reads"""
+        pass
+
+    @abstractmethod
+    async def find_statuses(self, ids: list[str]) -> dict[str, StudentStatus]:
+        """Gets the status of every existing student among the given ids"""
+        pass
+
+    @abstractmethod
+    async def import_many(
+        self, students: list[tuple[int, Student]]
+    ) -> list[RejectedRow]:
+        """Stores new students, keyed by their source row number, in one transaction.
+        Rows conflicting with stored data or with each other are rejected instead"""
+        pass
+
+    @abstractmethod
+    async def list(self, page: PageRequest) -> tuple[str | None, list[Student]]:
         pass
 
     @abstractmethod
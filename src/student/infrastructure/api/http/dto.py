@@ -1,7 +1,7 @@
 from pydantic import BaseModel
 
 from src.shared.contact.model import ContactDto, PartialContactDto
-from src.student.domain.model import IdentityKind
+from src.student.domain.model import IdentityKind, Student
 
 
 class CreateStudentDto(BaseModel):
@@ -18,3 +18,8 @@ class UpdateStudentDto(BaseModel):
     last_name: str | None
     age: int | None
     contact: PartialContactDto | None
+
+
+class StudentsPageDto(BaseModel):
+    students: list[Student]
+    next_cursor: str | None
@@ -1,28 +1,56 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request as HttpRequest
 
+from src.shared.http_cache.conditional_get import conditional_get
+from src.shared.http_cache.impl.redis_response_cache import create_response_cache
+from src.shared.http_cache.response_cache import ResponseCache
+from src.school.application.use_cases.enrollment_query_handler import (
+    EnrollmentQueryHandler,
+)
+from src.school.domain.enrollment import ByStudentId, EnrollmentRepository
+from src.school.infrastructure.persistence.sqlalchemy.enrolment_repository import (
+    get_enrollment_replica_repository,
+    get_enrollment_repository,
+)
+from src.shared.pagination.model import PageLimits
 from src.shared.pubsub.impl.redis_publisher import create_publisher
 from src.shared.pubsub.publisher import Publisher
 from src.shared.id.generator import IdGenerator
 from src.shared.id.ulid_generator import get_id_generator
 from src.student.domain.repository import ById, StudentRepository
 from src.student.infrastructure.persistence.sqlalchemy.repository import (
+    get_student_replica_repository,
     get_student_repository,
 )
 from src.student.application.use_cases.register_student import (
     RegisterStudent,
     Request as RegisterStudentRequest,
 )
-from src.student.domain.model import Identity
+from src.student.domain.model import Identity, Student
 from src.student.application.use_cases.student_query_handler import StudentQueryHandler
 from src.student.application.use_cases.drop_student import DropStudent
+from src.student.application.use_cases.import_students import (
+    ImportReport,
+    ImportStudents,
+)
+from src.student.infrastructure.importing.rows import ImportFormat, read_batches
 from src.student.application.use_cases.update_student import (
     UpdateStudent,
     Request as UpdateStudentRequest,
 )
-from src.student.infrastructure.api.http.dto import CreateStudentDto, UpdateStudentDto
+from src.school.infrastructure.api.http.dto import EnrollmentsPageDto
+from src.student.infrastructure.api.http.dto import (
+    CreateStudentDto,
+    StudentsPageDto,
+    UpdateStudentDto,
+)
 
+from src.shared.http.json_response import JsonRoute
+from src.shared.http.json_stream import JsonStreamResponse
 
-router = APIRouter()
+router = APIRouter(route_class=JsonRoute)
+
+STUDENTS_PAGE_LIMITS = PageLimits(default=20, maximum=100)
+ENROLLMENTS_PAGE_LIMITS = PageLimits(default=50, maximum=1000)
 
 
 def get_register_student_use_case(
@@ -32,6 +60,13 @@ def get_register_student_use_case(
     return RegisterStudent(students=student_repository, id_generator=id_generator)
 
 
+def get_import_students_use_case(
+    id_generator: IdGenerator = Depends(get_id_generator),
+    student_repository: StudentRepository = Depends(get_student_repository),
+) -> ImportStudents:
+    return ImportStudents(students=student_repository, id_generator=id_generator)
+
+
 def get_drop_student_use_case(
     student_repository: StudentRepository = Depends(get_student_repository),
     publisher: Publisher = Depends(create_publisher),
@@ -46,13 +81,21 @@ def get_update_student_use_case(
     return UpdateStudent(students=student_repository, id_generator=id_generator)
 
 
+def get_enrollment_query_handler(
+    enrollment_repository: EnrollmentRepository = Depends(
+        get_enrollment_replica_repository
+    ),
+) -> EnrollmentQueryHandler:
+    return EnrollmentQueryHandler(enrollments=enrollment_repository)
+
+
 def get_student_query_handler(
-    student_repository: StudentRepository = Depends(get_student_repository),
+    student_repository: StudentRepository = Depends(get_student_replica_repository),
 ) -> StudentQueryHandler:
     return StudentQueryHandler(students=student_repository)
 
 
-@router.post("/students")
+@router.post("/students", response_model=Student)
 async def create_student(
     dto: CreateStudentDto,
     use_case: RegisterStudent = Depends(get_register_student_use_case),
@@ -71,7 +114,18 @@ async def create_student(
     return registered_student
 
 
-@router.delete("/students/{id}")
+@router.post("/students/import", response_model=ImportReport)
+async def import_students(
+    http_request: HttpRequest,
+    format: ImportFormat = ImportFormat.CSV,
+    use_case: ImportStudents = Depends(get_import_students_use_case),
+):
+    batches = read_batches(chunks=http_request.stream(), format=format)
+
+    return await use_case.execute(batches)
+
+
+@router.delete("/students/{id}", response_model=Student)
 async def delete_student(
     id: str,
     use_case: DropStudent = Depends(get_drop_student_use_case),
@@ -81,7 +135,7 @@ async def delete_student(
     return dropped_student
 
 
-@router.patch("/students/{id}")
+@router.patch("/students/{id}", response_model=Student)
 async def update_student(
     id: str,
     dto: UpdateStudentDto,
@@ -101,21 +155,48 @@ async def update_student(
     return updated_student
 
 
-@router.get("/students/{id}")
+@router.get("/students/{id}", response_model=Student | None)
 async def get_student(
     id: str,
+    http_request: HttpRequest,
     query_handler: StudentQueryHandler = Depends(get_student_query_handler),
+    cache: ResponseCache = Depends(create_response_cache),
 ):
-    student = await query_handler.find(query=ById(id=id))
-
-    return student
+    return await conditional_get(
+        http_request,
+        cache,
+        resource="students",
+        id=id,
+        version=lambda: query_handler.version(id=id),
+        find=lambda: query_handler.find(query=ById(id=id)),
+        version_of=lambda student: student.updated_at,
+    )
 
 
-@router.get("/students")
+@router.get("/students", response_model=StudentsPageDto)
 async def get_students(
     next_cursor: str | None = None,
+    limit: int | None = None,
     query_handler: StudentQueryHandler = Depends(get_student_query_handler),
 ):
-    updated_cursor, students = await query_handler.list(next_cursor=next_cursor)
+    page = STUDENTS_PAGE_LIMITS.request(cursor=next_cursor, limit=limit)
+    updated_cursor, students = await query_handler.list(page=page)
+
+    return JsonStreamResponse({"students": students, "next_cursor": updated_cursor})
+
 
-    return {"students": students, "next_cursor": updated_cursor}
+@router.get("/students/{id}/enrollments", response_model=EnrollmentsPageDto)
+async def get_student_enrollments(
+    id: str,
+    next_cursor: str | None = None,
+    limit: int | None = None,
+    query_handler: EnrollmentQueryHandler = Depends(get_enrollment_query_handler),
+):
+    page = ENROLLMENTS_PAGE_LIMITS.request(cursor=next_cursor, limit=limit)
+    updated_cursor, enrollments = await query_handler.list(
+        query=ByStudentId(student_id=id), page=page
+    )
+
+    return JsonStreamResponse(
+        {"enrollments": enrollments, "next_cursor": updated_cursor}
+    )
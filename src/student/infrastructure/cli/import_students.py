@@ -0,0 +1,73 @@
+"""Imports students from a CSV or NDJSON file.
+
+Usage: python -m src.student.infrastructure.cli.import_students students.csv [--format csv]
+"""
+
+import argparse
+import asyncio
+import json
+from dataclasses import asdict
+from typing import AsyncIterator
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from src.shared.db.pg_sqlalchemy.connection import dispose_engine, get_db
+from src.shared.id.ulid_generator import UlidIdGenerator
+from src.shared.logging.log import configure_logging
+from src.student.application.use_cases.import_students import ImportStudents
+from src.student.infrastructure.importing.rows import (
+    BATCH_SIZE,
+    ImportFormat,
+    read_batches,
+)
+from src.student.infrastructure.persistence.sqlalchemy.repository import (
+    SqlAlchemyStudentRepository,
+)
+
+CHUNK_SIZE = 64 * 1024
+
+
+async def read_file(path: str) -> AsyncIterator[bytes]:
+    with open(path, "rb") as file:
+        while chunk := await asyncio.to_thread(file.read, CHUNK_SIZE):
+            yield chunk
+
+
+async def main(path: str, format: ImportFormat, batch_size: int) -> None:
+    try:
+        async for db_session in get_db():
+            use_case = ImportStudents(
+                students=SqlAlchemyStudentRepository(db_session),
+                id_generator=UlidIdGenerator(),
+            )
+
+            report = await use_case.execute(
+                read_batches(
+                    chunks=read_file(path), format=format, batch_size=batch_size
+                )
+            )
+
+            print(json.dumps(asdict(report), indent=2))
+    finally:
+        # The repository runs without the response cache, only the engine is open
+        await dispose_engine()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import students from a file")
+    parser.add_argument("path")
+    parser.add_argument(
+        "--format",
+        choices=[format.value for format in ImportFormat],
+        default=ImportFormat.CSV.value,
+    )
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    arguments = parser.parse_args()
+
+    configure_logging()
+
+    asyncio.run(
+        main(arguments.path, ImportFormat(arguments.format), arguments.batch_size)
+    )
@@ -0,0 +1,200 @@
+import codecs
+import csv
+import json
+from dataclasses import dataclass
+from enum import Enum
+from typing import Annotated, AsyncIterator
+
+from pydantic import BaseModel, EmailStr, Field, TypeAdapter, ValidationError
+
+from src.student.application.use_cases.import_students import Batch
+from src.student.application.use_cases.register_student import (
+    Request as RegisterStudentRequest,
+)
+from src.student.domain.model import Identity, IdentityKind
+from src.student.domain.repository import RejectedRow
+
+BATCH_SIZE = 1000
+
+
+class ImportFormat(Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+class StudentRowDto(BaseModel):
+    first_name: Annotated[str, Field(min_length=1)]
+    last_name: Annotated[str, Field(min_length=1)]
+    age: Annotated[int, Field(gt=0)]
+    identity_kind: IdentityKind
+    identity_code: Annotated[str, Field(min_length=1)]
+    email: EmailStr
+    phone: str = Field(..., pattern=r"^\+?[1-9]\d{1,14}$")
+    address: Annotated[str, Field(min_length=5, max_length=255)]
+
+    def as_register_student_request(self) -> RegisterStudentRequest:
+        return RegisterStudentRequest(
+            first_name=self.first_name,
+            last_name=self.last_name,
+            age=self.age,
+            identity=Identity(kind=self.identity_kind, code=self.identity_code),
+            email=self.email,
+            phone=self.phone,
+            address=self.address,
+        )
+
+
+@dataclass
+class ParsedRow:
+    row: int
+    data: dict | None
+    error: str | None = None
+
+
+rows_adapter = TypeAdapter(list[StudentRowDto])
+
+
+async def read_batches(
+    chunks: AsyncIterator[bytes], format: ImportFormat, batch_size: int = BATCH_SIZE
+) -> AsyncIterator[Batch]:
+    """Parses the byte stream incrementally and validates the rows a batch at a time"""
+    rows = parse_csv(chunks) if format == ImportFormat.CSV else parse_ndjson(chunks)
+    pending_rows = []
+
+    async for row in rows:
+        pending_rows.append(row)
+
+        if len(pending_rows) == batch_size:
+            yield validate(pending_rows)
+            pending_rows = []
+
+    if pending_rows:
+        yield validate(pending_rows)
+
+
+async def parse_csv(chunks: AsyncIterator[bytes]) -> AsyncIterator[ParsedRow]:
+    header = None
+    row = 0
+
+    async for record in _read_csv_records(chunks):
+        values = next(csv.reader([record]))
+
+        if header is None:
+            header = [value.strip() for value in values]
+            continue
+
+        row += 1
+
+        if len(values) != len(header):
+            yield ParsedRow(
+                row=row,
+                data=None,
+                error=f"Expected {len(header)} columns but got {len(values)}",
+            )
+            continue
+
+        yield ParsedRow(row=row, data=dict(zip(header, values)))
+
+
+async def parse_ndjson(chunks: AsyncIterator[bytes]) -> AsyncIterator[ParsedRow]:
+    row = 0
+
+    async for line in _read_lines(chunks):
+        if not line.strip():
+            continue
+
+        row += 1
+
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError as error:
+            yield ParsedRow(row=row, data=None, error=f"Invalid JSON: {error.msg}")
+            continue
+
+        if not isinstance(data, dict):
+            yield ParsedRow(row=row, data=None, error="Expected a JSON object")
+            continue
+
+        yield ParsedRow(row=row, data=data)
+
+
+def validate(rows: list[ParsedRow]) -> Batch:
+    """Validates the whole batch in a single pydantic call. Only when it fails, the
+    valid rows are picked one by one"""
+    rejected = [
+        RejectedRow(row=row.row, code="MalformedRowError", message=row.error)
+        for row in rows
+        if row.error is not None
+    ]
+    parsed_rows = [row for row in rows if row.error is None]
+
+    try:
+        dtos = rows_adapter.validate_python([row.data for row in parsed_rows])
+
+        return Batch(
+            rows=[
+                (row.row, dto.as_register_student_request())
+                for row, dto in zip(parsed_rows, dtos)
+            ],
+            rejected=rejected,
+        )
+    except ValidationError as validation_error:
+        messages_by_index: dict[int, list[str]] = {}
+
+        for error in validation_error.errors():
+            index, *field = error["loc"]
+            messages_by_index.setdefault(index, []).append(
+                f"{'.'.join(map(str, field))}: {error['msg']}"
+            )
+
+        valid_rows = []
+
+        for index, row in enumerate(parsed_rows):
+            if index in messages_by_index:
+                rejected.append(
+                    RejectedRow(
+                        row=row.row,
+                        code="InvalidRowError",
+                        message="; ".join(messages_by_index[index]),
+                    )
+                )
+                continue
+
+            dto = StudentRowDto.model_validate(row.data)
+            valid_rows.append((row.row, dto.as_register_student_request()))
+
+        return Batch(rows=valid_rows, rejected=rejected)
+
+
+async def _read_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+
+        for line in lines:
+            yield line.rstrip("\r")
+
+    buffer += decoder.decode(b"", final=True)
+
+    if buffer:
+        yield buffer.rstrip("\r")
+
+
+async def _read_csv_records(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Joins lines until quotes are balanced, so quoted fields may contain newlines"""
+    record = None
+
+    async for line in _read_lines(chunks):
+        record = line if record is None else f"{record}\n{line}"
+
+        if record.count('"') % 2 == 0:
+            if record.strip():
+                yield record
+
+            record = None
+
+    if record is not None and record.strip():
+        yield record
@@ -1,27 +1,56 @@
 from dataclasses import asdict
+from datetime import datetime
+from typing import Any, Callable
 from fastapi import Depends
-from sqlalchemy import select, exists
+from sqlalchemy import Executable, String, any_, bindparam, select, exists
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.shared.contact.model import Contact, ContactDbo
-from src.shared.db.pg_sqlalchemy.connection import get_db
+from src.shared.contact.persistence.sqlalchemy.contact_store import (
+    SqlAlchemyContactStore,
+)
+from src.shared.db.pg_sqlalchemy.connection import get_db, get_read_db, get_replica_db
+from src.shared.db.pg_sqlalchemy.pagination import page_of, paginate
+from src.shared.pagination.model import PageRequest
 from src.shared.logging.log import Logger
 from src.shared.errors.technical import TechnicalError
-from src.student.domain.repository import ById, ByIdentity, Query, StudentRepository
+from src.shared.http_cache.impl.redis_response_cache import create_response_cache
+from src.shared.http_cache.response_cache import ResponseCache
+from src.student.domain.repository import (
+    ById,
+    ByIdentity,
+    Query,
+    RejectedRow,
+    StudentRepository,
+)
+from src.student.infrastructure.persistence.sqlalchemy import student_import
 from src.student.infrastructure.persistence.sqlalchemy.dbo import StudentDbo
-from src.student.domain.model import Student
-from sqlalchemy.dialects.postgresql import insert
+from src.student.domain.model import Student, StudentStatus
+from src.shared.tracing.tracer import traced
 
 logger = Logger(__name__)
 
+# Built once with bound parameters, so each call skips building the statement and
+# its cache key, and SQLAlchemy reuses the compiled SQL
+BY_ID = StudentDbo.id == bindparam("id")
+STUDENT_EXISTS_BY_ID = select(exists().where(BY_ID))
+FIND_STUDENT_BY_ID = select(StudentDbo).where(BY_ID)
+STUDENT_VERSION = select(StudentDbo.updated_at).where(BY_ID)
 
+
+@traced
 class SqlAlchemyStudentRepository(StudentRepository):
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, cache: ResponseCache | None = None):
         self.session = session
+        self.cache = cache
 
     async def exists(self, query: Query) -> bool:
         try:
-            stmt = select(exists().where(self.__parse_query(query)))
-            result = await self.session.execute(stmt)
+            statement, parameters = self.__query_statement(
+                query,
+                STUDENT_EXISTS_BY_ID,
+                lambda condition: select(exists().where(condition)),
+            )
+            result = await self.session.execute(statement, parameters)
             return result.scalar() or False
         except Exception as e:
             error = TechnicalError(
@@ -37,8 +66,12 @@ class SqlAlchemyStudentRepository(StudentRepository):
 
     async def find(self, query: Query) -> Student | None:
         try:
-            db_query = select(StudentDbo).where(self.__parse_query(query))
-            result = await self.session.execute(db_query)
+            statement, parameters = self.__query_statement(
+                query,
+                FIND_STUDENT_BY_ID,
+                lambda condition: select(StudentDbo).where(condition),
+            )
+            result = await self.session.execute(statement, parameters)
             result = result.scalar()
 
             if result is None:
@@ -57,31 +90,99 @@ class SqlAlchemyStudentRepository(StudentRepository):
 
             raise error from e
 
-    async def list(self, next_cursor: str | None) -> tuple[str | None, list[Student]]:
+    async def version(self, id: str) -> datetime | None:
         try:
-            page_size = 20
-
-            def with_cursor():
-                return (
-                    select(StudentDbo)
-                    .filter(StudentDbo.id > next_cursor)
-                    .order_by(StudentDbo.id)
-                    .limit(page_size)
-                )
+            result = await self.session.execute(STUDENT_VERSION, {"id": id})
+            return result.scalar()
+        except Exception as e:
+            error = TechnicalError(
+                code="StudentRepositoryError",
+                message=f"Fail finding the student version id={id}",
+                attributes={"id": id},
+                cause=e,
+            )
 
-            def without_cursor():
-                return select(StudentDbo).order_by(StudentDbo.id).limit(page_size)
+            logger.error(error)
 
-            db_query = without_cursor() if not next_cursor else with_cursor()
+            raise error from e
 
+    async def find_statuses(self, ids: list[str]) -> dict[str, StudentStatus]:
+        try:
+            db_query = select(StudentDbo.id, StudentDbo.status).where(
+                StudentDbo.id == any_(bindparam("ids", ids, type_=ARRAY(String)))
+            )
             result = await self.session.execute(db_query)
-            result = result.scalars().all()
 
-            next_cursor = result[-1].id if result and len(result) == page_size else None
+            return {id: StudentStatus(status) for id, status in result.tuples()}
+        except Exception as e:
+            error = TechnicalError(
+                code="StudentRepositoryError",
+                message=f"Fail finding students statuses",
+                attributes={"ids": ids},
+                cause=e,
+            )
+
+            logger.error(error)
+
+            raise error from e
+
+    async def import_many(
+        self, students: list[tuple[int, Student]]
+    ) -> list[RejectedRow]:
+        try:
+            await self.session.execute(student_import.CREATE_STAGING_TABLE)
+
+            connection = await self.session.connection()
+            raw_connection = await connection.get_raw_connection()
+            await raw_connection.driver_connection.copy_records_to_table(
+                student_import.STAGING_TABLE,
+                records=[
+                    self.__as_staging_record(row, student) for row, student in students
+                ],
+                columns=student_import.STAGING_COLUMNS,
+            )
+
+            for statement in student_import.REJECT_ROWS:
+                await self.session.execute(statement)
+
+            await self.session.execute(student_import.MERGE_CONTACTS)
+            await self.session.execute(student_import.MERGE_STUDENTS)
+
+            result = await self.session.execute(student_import.SELECT_REJECTED_ROWS)
+            rejected_rows = [
+                RejectedRow(
+                    row=row,
+                    code=code,
+                    message=student_import.REJECTION_MESSAGES[code],
+                )
+                for row, code in result.tuples()
+            ]
+
+            await self.session.commit()
+
+            return rejected_rows
+        except Exception as e:
+            await self.session.rollback()
 
-            return next_cursor, list(
-                map(lambda student_dbo: student_dbo.as_domain(), result)
+            error = TechnicalError(
+                code="StudentRepositoryError",
+                message=f"Fail importing a batch of students",
+                attributes={"rows": [row for row, _ in students]},
+                cause=e,
             )
+
+            logger.error(error)
+
+            raise error from e
+
+    async def list(self, page: PageRequest) -> tuple[str | None, list[Student]]:
+        db_query = paginate(select(StudentDbo), [StudentDbo.id], page)
+
+        try:
+            result = await self.session.execute(db_query)
+            students = [student_dbo.as_domain() for student_dbo in result.scalars()]
+
+            return page_of(students, page, lambda student: (student.id,))
         except Exception as e:
             error = TechnicalError(
                 code="StudentRepositoryError",
@@ -96,23 +197,23 @@ class SqlAlchemyStudentRepository(StudentRepository):
 
     async def save(self, student: Student) -> Student:
         try:
-            existing_contact_id = await self.__get_or_create_contact(student.contact)
-
             student_dbo = StudentDbo.from_domain(student)
-            student_dbo.contact_id = existing_contact_id
-
-            upsert_student_statement = (
-                insert(StudentDbo)
-                .values(**student_dbo.as_dict())
-                .on_conflict_do_update(
-                    index_elements=["id"],
-                    set_={**student_dbo.as_for_update_dict()},
-                )
+
+            upsert_student_statement = SqlAlchemyContactStore.upsert_with_owner(
+                owner=StudentDbo,
+                values=student_dbo.as_dict(),
+                update_values=student_dbo.as_for_update_dict(),
+                contact=student.contact,
             )
 
-            await self.session.execute(upsert_student_statement)
+            result = await self.session.execute(upsert_student_statement)
+            student.contact.id = result.scalar_one()
+
             await self.session.commit()
 
+            if self.cache is not None:
+                await self.cache.invalidate("students", [student.id])
+
             return student
         except Exception as e:
             error = TechnicalError(
@@ -126,33 +227,55 @@ class SqlAlchemyStudentRepository(StudentRepository):
 
             raise error from e
 
-    def __parse_query(self, query):
+    def __as_staging_record(self, row: int, student: Student) -> tuple:
+        return (
+            row,
+            student.id,
+            student.first_name,
+            student.last_name,
+            student.identity.kind.name,
+            student.identity.code,
+            student.age,
+            student.status.name,
+            student.contact.id,
+            student.contact.email,
+            student.contact.phone,
+            student.contact.address,
+            student.created_at,
+        )
+
+    def __query_statement(
+        self, query: Query, by_id: Executable, build: Callable[[Any], Executable]
+    ) -> tuple[Executable, dict]:
         match query:
             case ById(id):
-                return StudentDbo.id == id
+                return by_id, {"id": id}
+            case _:
+                return build(self.__parse_query(query)), {}
+
+    def __parse_query(self, query):
+        match query:
             case ByIdentity(identity):
                 return (StudentDbo.identity_kind == identity.kind.name) & (
                     StudentDbo.identity_code == identity.code
                 )
 
-    async def __get_or_create_contact(self, contact: Contact) -> str:
-        contact_dbo = ContactDbo.from_domain(contact)
-        contact_statement = (
-            insert(ContactDbo).values(**contact_dbo.as_dict()).on_conflict_do_nothing()
-        )
 
-        await self.session.execute(contact_statement)
-        await self.session.commit()
+def get_student_repository(
+    session: AsyncSession = Depends(get_db),
+    cache: ResponseCache = Depends(create_response_cache),
+) -> StudentRepository:
+    return SqlAlchemyStudentRepository(session=session, cache=cache)
 
-        existing_contact_id = await self.session.execute(
-            select(ContactDbo.id).filter_by(email=contact.email)
-        )
-        existing_contact_id = existing_contact_id.scalar_one_or_none()
 
-        return existing_contact_id
+def get_student_replica_repository(
+    session: AsyncSession = Depends(get_replica_db),
+) -> StudentRepository:
+    return SqlAlchemyStudentRepository(session=session)
 
 
-def get_student_repository(
-    session: AsyncSession = Depends(get_db),
+def get_student_reader(
+    session: AsyncSession = Depends(get_read_db, use_cache=False),
 ) -> StudentRepository:
+    """Repository on a session of its own, for lookups run alongside other reads"""
     return SqlAlchemyStudentRepository(session=session)
@@ -0,0 +1,111 @@
+from sqlalchemy import text
+
+STAGING_TABLE = "student_import_staging"
+
+STAGING_COLUMNS = [
+    "row_number",
+    "id",
+    "first_name",
+    "last_name",
+    "identity_kind",
+    "identity_code",
+    "age",
+    "status",
+    "contact_id",
+    "email",
+    "phone",
+    "address",
+    "created_at",
+]
+
+CREATE_STAGING_TABLE = text(f"""
+    CREATE TEMPORARY TABLE {STAGING_TABLE} (
+        row_number integer PRIMARY KEY,
+        id varchar NOT NULL,
+        first_name varchar NOT NULL,
+        last_name varchar NOT NULL,
+        identity_kind varchar NOT NULL,
+        identity_code varchar NOT NULL,
+        age integer NOT NULL,
+        status varchar NOT NULL,
+        contact_id varchar NOT NULL,
+        email varchar NOT NULL,
+        phone varchar NOT NULL,
+        address varchar NOT NULL,
+        created_at timestamp NOT NULL,
+        error varchar
+    ) ON COMMIT DROP
+    """)
+
+# Rejections are applied in order, each one only over the rows not rejected yet
+REJECT_ROWS = [
+    text(f"""
+        UPDATE {STAGING_TABLE} staged SET error = 'DuplicatedStudentInImportError'
+        FROM {STAGING_TABLE} previous
+        WHERE staged.error IS NULL
+          AND previous.row_number < staged.row_number
+          AND previous.identity_kind = staged.identity_kind
+          AND previous.identity_code = staged.identity_code
+        """),
+    text(f"""
+        UPDATE {STAGING_TABLE} staged SET error = 'DuplicatedContactInImportError'
+        FROM {STAGING_TABLE} previous
+        WHERE staged.error IS NULL
+          AND previous.row_number < staged.row_number
+          AND (previous.email = staged.email OR previous.phone = staged.phone)
+        """),
+    text(f"""
+        UPDATE {STAGING_TABLE} staged SET error = 'StudentAlreadyExistsError'
+        FROM students
+        WHERE staged.error IS NULL
+          AND students.identity_kind = staged.identity_kind
+          AND students.identity_code = staged.identity_code
+        """),
+    text(f"""
+        UPDATE {STAGING_TABLE} staged SET error = 'ContactAlreadyInUseError'
+        FROM contacts
+        WHERE staged.error IS NULL
+          AND (contacts.email = staged.email OR contacts.phone = staged.phone)
+          AND (
+            contacts.email <> staged.email
+            OR contacts.phone <> staged.phone
+            OR EXISTS (SELECT 1 FROM students WHERE students.contact_id = contacts.id)
+            OR EXISTS (SELECT 1 FROM schools WHERE schools.contact_id = contacts.id)
+          )
+        """),
+]
+
+MERGE_CONTACTS = text(f"""
+    INSERT INTO contacts (id, email, phone, address, created_at, updated_at)
+    SELECT contact_id, email, phone, address, created_at, created_at
+    FROM {STAGING_TABLE}
+    WHERE error IS NULL
+    ON CONFLICT (email) DO UPDATE
+    SET address = excluded.address, updated_at = excluded.updated_at
+    """)
+
+MERGE_STUDENTS = text(f"""
+    INSERT INTO students (
+        id, first_name, last_name, identity_kind, identity_code, age, status,
+        contact_id, created_at, updated_at
+    )
+    SELECT staged.id, staged.first_name, staged.last_name, staged.identity_kind,
+        staged.identity_code, staged.age, staged.status, contacts.id,
+        staged.created_at, staged.created_at
+    FROM {STAGING_TABLE} staged
+    JOIN contacts ON contacts.email = staged.email
+    WHERE staged.error IS NULL
+    """)
+
+SELECT_REJECTED_ROWS = text(f"""
+    SELECT row_number, error FROM {STAGING_TABLE}
+    WHERE error IS NOT NULL
+    ORDER BY row_number
+    """)
+
+REJECTION_MESSAGES = {
+    "DuplicatedStudentInImportError": "The student identity is repeated in a previous row",
+    "DuplicatedContactInImportError": "The contact email or phone is repeated in a previous row",
+    "StudentAlreadyExistsError": "A student with the same identity already exists",
+    "ContactAlreadyInUseError": "The contact email or phone already belongs to another party",
+}
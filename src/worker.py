@@ -0,0 +1,131 @@
+"""Background worker: hosts the pub/sub subscribers and the jobs they run, away from
+the API event loop.
+
+    python -m src.worker
+
+WORKER_SUBSCRIBERS   subscribers to host, comma separated. All of them by default
+WORKER_CONCURRENCY   messages processed at a time per subscriber, 1 by default,
+                     e.g. generate-invoices=4,drop-student-enrollments=2
+SHUTDOWN_TIMEOUT     seconds to finish the messages in hand on SIGINT or SIGTERM, 8 by default
+
+Run the API with SUBSCRIBERS_ENABLED=false so the messages are not processed twice,
+and with GENERATE_INVOICES_IN_WORKER=true to hand the invoices generation over.
+The generation requests wait in a Redis stream until a worker acknowledges them.
+"""
+
+import asyncio
+import importlib
+import os
+import signal
+from typing import Awaitable, Callable, Protocol
+
+from dotenv import load_dotenv
+
+from src.shared.db.pg_sqlalchemy.connection import dispose_engine, get_engine
+from src.shared.lifecycle import stop_tasks
+from src.shared.redis.connection_factory import close_pool, get_pool
+from src.shared.logging.log import Logger, configure_logging, parse_settings
+from src.shared.tracing.exporters import configure_tracing
+
+logger = Logger(__name__)
+
+
+class EventSubscriber(Protocol):
+    async def run(self) -> None:
+        pass
+
+
+# Factory of each subscriber, only the hosted ones are imported
+SUBSCRIBERS = {
+    "drop-student-enrollments": (
+        "src.school.infrastructure.api.events.drop_student_enrollments_subscriber",
+        "dropStudentEnrollmentsSubscriber",
+    ),
+    "generate-invoices": (
+        "src.school.infrastructure.api.events.generate_invoices_subscriber",
+        "generateInvoicesSubscriber",
+    ),
+}
+
+
+def selected_subscribers() -> list[str]:
+    names = [
+        name.strip()
+        for name in os.getenv("WORKER_SUBSCRIBERS", ",".join(SUBSCRIBERS)).split(",")
+        if name.strip()
+    ]
+    unknown = [name for name in names if name not in SUBSCRIBERS]
+
+    if unknown:
+        raise ValueError(f"Unknown subscribers {unknown}, expected {list(SUBSCRIBERS)}")
+
+    return names
+
+
+def subscriber_factory(name: str) -> Callable[[int], Awaitable[EventSubscriber]]:
+    module, factory = SUBSCRIBERS[name]
+
+    return getattr(importlib.import_module(module), factory)
+
+
+async def run() -> None:
+    concurrency = {
+        name: int(value)
+        for name, value in parse_settings(os.getenv("WORKER_CONCURRENCY")).items()
+    }
+    names = selected_subscribers()
+    tasks = []
+
+    get_engine()
+    get_pool()
+
+    for name in names:
+        subscriber = await subscriber_factory(name)(concurrency.get(name, 1))
+        tasks.append(asyncio.create_task(subscriber.run(), name=name))
+
+        logger.info(
+            "Subscriber started: name=%s, concurrency=%s",
+            name,
+            concurrency.get(name, 1),
+        )
+
+    stopping = asyncio.Event()
+    loop = asyncio.get_running_loop()
+
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stopping.set)
+
+    stop = asyncio.create_task(stopping.wait())
+
+    # A subscriber only returns when its connection fails, the worker exits then
+    await asyncio.wait([stop, *tasks], return_when=asyncio.FIRST_COMPLETED)
+
+    logger.info("Stopping worker: subscribers=%s", len(tasks))
+
+    stop.cancel()
+    await stop_tasks(tasks)
+
+    await close_pool()
+    await dispose_engine()
+
+    for task in tasks:
+        if not task.cancelled() and task.exception() is not None:
+            raise task.exception()
+
+
+def loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    try:
+        import uvloop
+    except ImportError:
+        return None
+
+    return uvloop.new_event_loop
+
+
+if __name__ == "__main__":
+    load_dotenv()
+    configure_logging()
+    configure_tracing()
+
+    with asyncio.Runner(loop_factory=loop_factory()) as runner:
+        runner.run(run())
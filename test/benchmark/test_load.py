@@ -0,0 +1,67 @@
+import asyncio
+
+from fastapi import FastAPI, HTTPException
+
+from benchmark.api.load import Scenario, percentile, run_scenario
+from src.shared.http.asgi_client import AsgiClient
+
+app = FastAPI()
+
+
+@app.get("/items/{id}")
+async def get_item(id: int):
+    if id % 10 == 0:
+        raise HTTPException(status_code=404)
+
+    return {"id": id}
+
+
+class TestPercentile:
+    def test_nearest_rank(self):
+        values = [float(value) for value in range(1, 101)]
+
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 95) == 95.0
+        assert percentile(values, 99) == 99.0
+        assert percentile([], 99) == 0.0
+
+
+class TestRunScenario:
+    def test_measure_every_request_and_count_errors(self):
+        client = AsgiClient(app)
+        sent = []
+
+        async def send(client: AsgiClient, index: int):
+            sent.append(index)
+            return await client.request("GET", f"/items/{index}")
+
+        result = asyncio.run(
+            run_scenario(
+                client=client,
+                scenario=Scenario(name="GET /items", send=send),
+                requests=50,
+                concurrency=4,
+                warmup=5,
+            )
+        )
+
+        assert sorted(sent) == list(range(55))
+        assert result.requests == 50
+        assert result.errors == 5
+        assert 0 < result.p50_ms <= result.p95_ms <= result.p99_ms <= result.max_ms
+
+    def test_send_query_params_and_json_body(self):
+        echo = FastAPI()
+
+        @echo.post("/echo")
+        async def post_echo(body: dict, name: str):
+            return {"name": name, "body": body}
+
+        response = asyncio.run(
+            AsgiClient(echo).request(
+                "POST", "/echo", params={"name": "x", "skip": None}, body={"a": 1}
+            )
+        )
+
+        assert response.status == 200
+        assert response.json() == {"name": "x", "body": {"a": 1}}
@@ -0,0 +1,20 @@
+from benchmark.startup.run import ImportTime, parse_importtime
+
+
+class TestParseImporttime:
+    def test_parse_the_module_lines(self):
+        output = "\n".join(
+            [
+                "import time: self [us] | cumulative | imported package",
+                "import time:       120 |        120 |   _io",
+                "import time:      1500 |       2000 |     src.shared.lifecycle",
+                "some other stderr line",
+                "import time:      3000 |      10500 | src.main",
+            ]
+        )
+
+        assert parse_importtime(output) == [
+            ImportTime(module="_io", self_ms=0.12, cumulative_ms=0.12),
+            ImportTime(module="src.shared.lifecycle", self_ms=1.5, cumulative_ms=2.0),
+            ImportTime(module="src.main", self_ms=3.0, cumulative_ms=10.5),
+        ]
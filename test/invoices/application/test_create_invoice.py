@@ -0,0 +1,86 @@
+import asyncio
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from src.invoice.application.use_cases.create_invoice import CreateInvoice, Request
+from src.invoice.domain.events import InvoiceCreated
+from src.invoice.domain.repository import InvoiceCreationCheck
+from src.school.domain.model import SchoolStatus
+from src.shared.errors.application import ApplicationError
+from src.shared.errors.business import BusinessError
+from src.student.domain.model import StudentStatus
+
+
+class FakeInvoices:
+    def __init__(self, check: InvoiceCreationCheck):
+        self.check = check
+        self.checked = []
+        self.updated = []
+
+    async def check_creation(self, invoice_id, school_id, student_id):
+        self.checked.append((invoice_id, school_id, student_id))
+
+        return self.check
+
+    async def update(self, event):
+        self.updated.append(event)
+
+
+def _check(
+    invoice_exists: bool = False,
+    school_status: SchoolStatus | None = SchoolStatus.ACTIVE,
+    student_status: StudentStatus | None = StudentStatus.ACTIVE,
+) -> InvoiceCreationCheck:
+    return InvoiceCreationCheck(
+        invoice_exists=invoice_exists,
+        school_status=school_status,
+        student_status=student_status,
+    )
+
+
+REQUEST = Request(
+    school_id="school-1",
+    student_id="student-1",
+    amount=Decimal("100.00"),
+    due_date=date(2025, 3, 1),
+)
+
+
+class TestCreateInvoice:
+    def test_create_with_a_single_check(self):
+        invoices = FakeInvoices(_check())
+
+        invoice = asyncio.run(CreateInvoice(invoices=invoices).execute(REQUEST))
+
+        assert invoices.checked == [(invoice.id, "school-1", "student-1")]
+        assert [type(event) for event in invoices.updated] == [InvoiceCreated]
+        assert (invoice.school_id, invoice.student_id) == ("school-1", "student-1")
+
+    @pytest.mark.parametrize(
+        "check, code",
+        [
+            (_check(invoice_exists=True), "ResourceAlreadyExistsError"),
+            (_check(school_status=None), "ResourceNotFoundError"),
+            (_check(school_status=SchoolStatus.INACTIVE), "ResourceNotFoundError"),
+            (_check(student_status=None), "ResourceNotFoundError"),
+        ],
+    )
+    def test_reject_with_application_errors(self, check, code):
+        invoices = FakeInvoices(check)
+
+        with pytest.raises(ApplicationError) as error:
+            asyncio.run(CreateInvoice(invoices=invoices).execute(REQUEST))
+
+        assert error.value.code == code
+        assert invoices.updated == []
+
+    def test_reject_an_inactive_student(self):
+        invoices = FakeInvoices(_check(student_status=StudentStatus.INACTIVE))
+
+        with pytest.raises(BusinessError) as error:
+            asyncio.run(CreateInvoice(invoices=invoices).execute(REQUEST))
+
+        assert error.value.code == "InvalidInvoicePartiesError"
+        assert invoices.updated == []
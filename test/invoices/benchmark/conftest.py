@@ -0,0 +1,137 @@
+import gc
+import statistics
+import time
+import tracemalloc
+from typing import Any, Callable
+
+import pytest
+
+try:
+    import pytest_benchmark  # noqa: F401
+
+    HAS_PYTEST_BENCHMARK = True
+except ImportError:
+    HAS_PYTEST_BENCHMARK = False
+
+# Calibration of the rounds when the benchmark is called directly
+MIN_ROUNDS = 5
+MAX_ROUNDS = 10_000
+MAX_TIME_S = 1.0
+
+_results: list["Benchmark"] = []
+
+
+class Benchmark:
+    """Stand in for the pytest-benchmark fixture when the plugin is not installed.
+    Supports the `benchmark(fn, *args)` and `benchmark.pedantic(...)` calls and
+    `extra_info`, the stats are printed at the end of the session"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.extra_info: dict[str, Any] = {}
+        self.timings: list[float] = []
+
+    def __call__(self, function: Callable, *args, **kwargs) -> Any:
+        started = time.perf_counter()
+        result = function(*args, **kwargs)
+        duration = time.perf_counter() - started
+
+        rounds = int(MAX_TIME_S / duration) if duration else MAX_ROUNDS
+        rounds = min(max(rounds, MIN_ROUNDS), MAX_ROUNDS)
+
+        self.pedantic(function, args=args, kwargs=kwargs, rounds=rounds)
+
+        return result
+
+    def pedantic(
+        self,
+        target: Callable,
+        args: tuple = (),
+        kwargs: dict | None = None,
+        setup: Callable | None = None,
+        rounds: int = 1,
+        iterations: int = 1,
+        warmup_rounds: int = 0,
+    ) -> Any:
+        kwargs = kwargs or {}
+        result = None
+
+        for _ in range(warmup_rounds):
+            target(*args, **kwargs)
+
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+
+        try:
+            for _ in range(rounds):
+                if setup is not None:
+                    args, kwargs = setup() or (args, kwargs)
+
+                started = time.perf_counter()
+
+                for _ in range(iterations):
+                    result = target(*args, **kwargs)
+
+                self.timings.append((time.perf_counter() - started) / iterations)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+        return result
+
+    def summary(self) -> str:
+        median_us = statistics.median(self.timings) * 1e6
+        min_us = min(self.timings) * 1e6
+        extra = " ".join(f"{key}={value}" for key, value in self.extra_info.items())
+
+        return (
+            f"{self.name:<70} median={median_us:>12.2f}us min={min_us:>12.2f}us "
+            f"ops={1e6 / median_us:>12.1f}/s rounds={len(self.timings):<6} {extra}"
+        )
+
+
+if not HAS_PYTEST_BENCHMARK:
+
+    @pytest.fixture
+    def benchmark(request) -> Benchmark:
+        fixture = Benchmark(name=request.node.name)
+
+        yield fixture
+
+        if fixture.timings:
+            _results.append(fixture)
+
+    def pytest_terminal_summary(terminalreporter):
+        if not _results:
+            return
+
+        terminalreporter.section("benchmarks")
+
+        for result in _results:
+            terminalreporter.write_line(result.summary())
+
+
+@pytest.fixture
+def allocations() -> Callable[..., dict[str, float]]:
+    """Runs a function once under tracemalloc and returns the memory it allocated
+    and still holds, and the peak, in KiB"""
+
+    def track(function: Callable, *args, **kwargs) -> dict[str, float]:
+        gc.collect()
+        tracemalloc.start()
+
+        try:
+            before, _ = tracemalloc.get_traced_memory()
+            result = function(*args, **kwargs)
+            after, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        del result
+
+        return {
+            "allocated_kib": round((after - before) / 1024, 1),
+            "peak_kib": round((peak - before) / 1024, 1),
+        }
+
+    return track
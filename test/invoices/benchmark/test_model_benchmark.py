@@ -0,0 +1,182 @@
+"""Micro-benchmarks of the invoice domain model and its persistence mapping.
+
+They are skipped unless BENCHMARK=1, e.g. BENCHMARK=1 pytest test/invoices/benchmark
+"""
+
+import os
+from collections import namedtuple
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from src.invoice.domain.model import Invoice, InvoiceStatus, Payment
+from src.invoice.domain.repository import AccountStatement, PendingInvoiceReadProjection
+from src.invoice.infrastructure.persistence.sqlalchemy.dbo import (
+    InvoiceDbo,
+    PaymentDbo,
+)
+
+pytestmark = pytest.mark.skipif(
+    not os.getenv("BENCHMARK"), reason="Benchmarks only run with BENCHMARK=1"
+)
+
+PAYMENTS = [1, 10, 100]
+INVOICES = [1_000, 10_000, 100_000]
+
+PAYMENT_AMOUNT = Decimal("10.00")
+AT = datetime(2024, 1, 1)
+
+ProjectionRow = namedtuple(
+    "ProjectionRow",
+    [
+        "id",
+        "student_id",
+        "school_id",
+        "initial_amount",
+        "due_amount",
+        "created_at",
+        "updated_at",
+    ],
+)
+
+
+def invoice_with_payments(payments: int) -> Invoice:
+    """A pending invoice with `payments` pending payments and room for one more"""
+    invoice_id = "school:1|student:1|period:2024-1"
+
+    return Invoice(
+        id=invoice_id,
+        student_id="1",
+        school_id="1",
+        initial_amount=PAYMENT_AMOUNT * (payments + 1),
+        due_amount=PAYMENT_AMOUNT * (payments + 1),
+        due_date=date(2024, 1, 1),
+        status=InvoiceStatus.PENDING,
+        payments=[
+            Payment.of(
+                id=f"payment-{index}",
+                invoice_id=invoice_id,
+                amount=PAYMENT_AMOUNT,
+                at=AT,
+            )
+            for index in range(payments)
+        ],
+        created_at=AT,
+        updated_at=AT,
+    )
+
+
+def invoice_dbo_with_payments(payments: int) -> InvoiceDbo:
+    invoice = invoice_with_payments(payments)
+
+    return InvoiceDbo(
+        id=invoice.id,
+        student_id=invoice.student_id,
+        school_id=invoice.school_id,
+        initial_amount=invoice.initial_amount,
+        due_amount=invoice.due_amount,
+        due_date=invoice.due_date,
+        status=invoice.status.name,
+        created_at=invoice.created_at,
+        updated_at=invoice.updated_at,
+        payments=[
+            PaymentDbo(
+                id=payment.id,
+                invoice_id=payment.invoice_id,
+                amount=payment.amount,
+                status=payment.status.name,
+                created_at=payment.created_at,
+                updated_at=payment.updated_at,
+            )
+            for payment in invoice.payments
+        ],
+    )
+
+
+def projection_rows(invoices: int) -> list[ProjectionRow]:
+    return [
+        ProjectionRow(
+            id=f"invoice-{index}",
+            student_id=f"student-{index % 500}",
+            school_id="school-1",
+            initial_amount=Decimal("1500.00"),
+            due_amount=Decimal("1500.00") - index % 100,
+            created_at=AT + timedelta(minutes=index),
+            updated_at=AT,
+        )
+        for index in range(invoices)
+    ]
+
+
+def projections(invoices: int) -> list[PendingInvoiceReadProjection]:
+    return [InvoiceDbo.as_read_projection(row) for row in projection_rows(invoices)]
+
+
+class TestInvoicePaymentsBenchmark:
+    @pytest.mark.parametrize("payments", PAYMENTS)
+    def test_add_payment(self, benchmark, allocations, payments):
+        invoice = invoice_with_payments(payments)
+
+        benchmark.extra_info.update(
+            allocations(invoice.add_payment, "new-payment", PAYMENT_AMOUNT, AT)
+        )
+        _, updated = benchmark(invoice.add_payment, "new-payment", PAYMENT_AMOUNT, AT)
+
+        assert len(updated.payments) == payments + 1
+
+    @pytest.mark.parametrize("payments", PAYMENTS)
+    def test_succeed_payment(self, benchmark, allocations, payments):
+        invoice = invoice_with_payments(payments)
+        last_payment = f"payment-{payments - 1}"
+
+        benchmark.extra_info.update(
+            allocations(invoice.succeed_payment, last_payment, AT)
+        )
+        _, updated = benchmark(invoice.succeed_payment, last_payment, AT)
+
+        assert updated.due_amount == invoice.due_amount - PAYMENT_AMOUNT
+
+    @pytest.mark.parametrize("payments", PAYMENTS)
+    def test_fail_payment(self, benchmark, allocations, payments):
+        invoice = invoice_with_payments(payments)
+        last_payment = f"payment-{payments - 1}"
+
+        benchmark.extra_info.update(allocations(invoice.fail_payment, last_payment, AT))
+        _, updated = benchmark(invoice.fail_payment, last_payment, AT)
+
+        assert updated.pending_payments() == invoice.payments[:-1]
+
+
+class TestAccountStatementBenchmark:
+    @pytest.mark.parametrize("invoices", INVOICES)
+    def test_account_statement_of(self, benchmark, allocations, invoices):
+        pending_invoices = projections(invoices)
+
+        benchmark.extra_info.update(allocations(AccountStatement.of, pending_invoices))
+        statement = benchmark(AccountStatement.of, pending_invoices)
+
+        assert len(statement.invoices) == invoices
+
+
+class TestDboMappingBenchmark:
+    @pytest.mark.parametrize("payments", PAYMENTS)
+    def test_invoice_as_domain(self, benchmark, allocations, payments):
+        invoice_dbo = invoice_dbo_with_payments(payments)
+
+        benchmark.extra_info.update(allocations(invoice_dbo.as_domain))
+        invoice = benchmark(invoice_dbo.as_domain)
+
+        assert len(invoice.payments) == payments
+
+    @pytest.mark.parametrize("invoices", INVOICES)
+    def test_as_read_projection(self, benchmark, allocations, invoices):
+        rows = projection_rows(invoices)
+
+        def as_read_projections():
+            return [InvoiceDbo.as_read_projection(row) for row in rows]
+
+        benchmark.extra_info.update(allocations(as_read_projections))
+        pending_invoices = benchmark(as_read_projections)
+
+        assert len(pending_invoices) == invoices
@@ -0,0 +1,86 @@
+"""Cost of rendering large account statements and invoices as JSON, the way FastAPI
+did through jsonable_encoder and json.dumps against the orjson codec the routes use.
+
+They are skipped unless BENCHMARK=1, e.g. BENCHMARK=1 pytest test/invoices/benchmark
+"""
+
+import json
+import os
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+
+from src.invoice.domain.model import Invoice
+from src.invoice.domain.repository import AccountStatement, PendingInvoiceReadProjection
+from src.shared.serialization.json_codec import dumps
+
+pytestmark = pytest.mark.skipif(
+    not os.getenv("BENCHMARK"), reason="Benchmarks only run with BENCHMARK=1"
+)
+
+INVOICES = [1_000, 10_000]
+PAYMENTS = [10, 100]
+
+AT = datetime(2024, 1, 1)
+
+
+def account_statement(size: int) -> AccountStatement:
+    return AccountStatement.of(
+        [
+            PendingInvoiceReadProjection(
+                id=f"invoice-{index}",
+                student_id=f"student-{index}",
+                school_id="school-1",
+                base_amount=Decimal("100.00"),
+                due_amount=Decimal("75.50"),
+                created_at=AT + timedelta(seconds=index),
+                updated_at=AT + timedelta(seconds=index),
+            )
+            for index in range(size)
+        ]
+    )
+
+
+def invoice_with_payments(payments: int) -> Invoice:
+    _, invoice = Invoice.of(
+        student_id="student-1",
+        school_id="school-1",
+        amount=Decimal(payments * 10),
+        due_date=date(2024, 1, 31),
+        at=AT,
+    )
+
+    for index in range(payments):
+        _, invoice = invoice.add_payment(
+            payment_id=f"payment-{index}", amount_to_pay=Decimal("10.00"), at=AT
+        )
+
+    return invoice
+
+
+def jsonable_encoder_dumps(value) -> bytes:
+    return json.dumps(jsonable_encoder(value)).encode()
+
+
+@pytest.mark.parametrize("size", INVOICES)
+def test_account_statement_jsonable_encoder(benchmark, size):
+    statement = account_statement(size)
+    benchmark.extra_info["bytes"] = len(benchmark(jsonable_encoder_dumps, statement))
+
+
+@pytest.mark.parametrize("size", INVOICES)
+def test_account_statement_codec(benchmark, size):
+    statement = account_statement(size)
+    benchmark.extra_info["bytes"] = len(benchmark(dumps, statement))
+
+
+@pytest.mark.parametrize("payments", PAYMENTS)
+def test_invoice_jsonable_encoder(benchmark, payments):
+    benchmark(jsonable_encoder_dumps, invoice_with_payments(payments))
+
+
+@pytest.mark.parametrize("payments", PAYMENTS)
+def test_invoice_codec(benchmark, payments):
+    benchmark(dumps, invoice_with_payments(payments))
@@ -0,0 +1,117 @@
+"""Per call cost of building the repository statements against reusing the cached
+ones, run on SQLite in memory so the database adds little on top.
+
+They are skipped unless BENCHMARK=1, e.g. BENCHMARK=1 pytest test/invoices/benchmark
+"""
+
+import os
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import create_engine, exists, select, update
+from sqlalchemy.orm import Session, subqueryload
+
+from src.invoice.infrastructure.persistence.sqlalchemy.dbo import (
+    InvoiceDbo,
+    PaymentDbo,
+)
+from src.invoice.infrastructure.persistence.sqlalchemy.repository import (
+    FIND_INVOICE_BY_ID,
+    INVOICE_EXISTS_BY_ID,
+)
+from src.shared.db.pg_sqlalchemy.statements import update_by_id
+
+# The invoices foreign keys need these tables in the metadata
+import src.school.infrastructure.persistence.sqlalchemy.dbo  # noqa: F401
+import src.student.infrastructure.persistence.sqlalchemy.dbo  # noqa: F401
+
+pytestmark = pytest.mark.skipif(
+    not os.getenv("BENCHMARK"), reason="Benchmarks only run with BENCHMARK=1"
+)
+
+INVOICE_ID = "invoice-1"
+AT = datetime(2024, 1, 1)
+
+
+@pytest.fixture(scope="module")
+def session():
+    engine = create_engine("sqlite://")
+    InvoiceDbo.metadata.create_all(
+        engine, tables=[InvoiceDbo.__table__, PaymentDbo.__table__]
+    )
+
+    with Session(engine) as session:
+        session.add(
+            InvoiceDbo(
+                id=INVOICE_ID,
+                student_id="student-1",
+                school_id="school-1",
+                initial_amount=10,
+                due_amount=10,
+                due_date=date(2024, 1, 1),
+                status="PENDING",
+                created_at=AT,
+                updated_at=AT,
+            )
+        )
+        session.commit()
+
+        yield session
+
+
+def built_exists(session: Session):
+    statement = select(exists().where(InvoiceDbo.id == INVOICE_ID))
+
+    return session.execute(statement).scalar()
+
+
+def cached_exists(session: Session):
+    return session.execute(INVOICE_EXISTS_BY_ID, {"id": INVOICE_ID}).scalar()
+
+
+def built_find(session: Session):
+    statement = select(InvoiceDbo).where(InvoiceDbo.id == INVOICE_ID)
+    invoice = session.execute(
+        statement.options(subqueryload(InvoiceDbo.payments))
+    ).scalar()
+    session.expunge_all()
+
+    return invoice
+
+
+def cached_find(session: Session):
+    invoice = session.execute(FIND_INVOICE_BY_ID, {"id": INVOICE_ID}).scalar()
+    session.expunge_all()
+
+    return invoice
+
+
+def built_update(session: Session):
+    statement = (
+        update(InvoiceDbo)
+        .where(InvoiceDbo.id == INVOICE_ID)
+        .values(due_amount=5, updated_at=AT)
+    )
+
+    session.execute(statement)
+
+
+def cached_update(session: Session):
+    changes = {INVOICE_ID: {"due_amount": 5, "updated_at": AT}}
+
+    for statement, parameters in update_by_id(InvoiceDbo, changes):
+        session.execute(statement, parameters)
+
+
+class TestInvoiceStatementsBenchmark:
+    @pytest.mark.parametrize("run", [built_exists, cached_exists])
+    def test_exists(self, benchmark, session, run):
+        assert benchmark(run, session)
+
+    @pytest.mark.parametrize("run", [built_find, cached_find])
+    def test_find(self, benchmark, session, run):
+        assert benchmark(run, session).id == INVOICE_ID
+
+    @pytest.mark.parametrize("run", [built_update, cached_update])
+    def test_update(self, benchmark, session, run):
+        benchmark(run, session)
@@ -0,0 +1,82 @@
+import asyncio
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from src.invoice.domain.model import Invoice
+from src.invoice.infrastructure.persistence.sqlalchemy.repository import (
+    SqlAlchemyInvoiceRepository,
+)
+from src.shared.errors.application import ApplicationError
+
+
+class FakeResult:
+    def __init__(self, ids: list[str]):
+        self.ids = ids
+
+    def scalars(self):
+        return iter(self.ids)
+
+
+class FakeSession:
+    """Inserts every invoice but the ones of `existing_ids`, as ON CONFLICT DO
+    NOTHING RETURNING id does"""
+
+    def __init__(self, existing_ids: set[str]):
+        self.existing_ids = existing_ids
+        self.inserted = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    async def execute(self, statement, parameters):
+        inserted_ids = [
+            row["id"] for row in parameters if row["id"] not in self.existing_ids
+        ]
+        self.inserted.extend(inserted_ids)
+
+        return FakeResult(inserted_ids)
+
+    async def flush(self):
+        pass
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+
+def created(student_id: str):
+    event, _ = Invoice.of(
+        student_id=student_id,
+        school_id="school-1",
+        amount=Decimal("100"),
+        due_date=date(2025, 3, 1),
+    )
+
+    return event
+
+
+class TestUpdateMany:
+    def test_insert_the_new_invoices_and_return_the_existing_ones(self):
+        events = [created("student-1"), created("student-2"), created("student-3")]
+        session = FakeSession(existing_ids={events[1].id})
+
+        existing_ids = asyncio.run(
+            SqlAlchemyInvoiceRepository(session).update_many(events)
+        )
+
+        assert existing_ids == {events[1].id}
+        assert session.inserted == [events[0].id, events[2].id]
+        assert session.commits == 1
+        assert session.rollbacks == 0
+
+    def test_reject_a_single_invoice_that_already_exists(self):
+        event = created("student-1")
+        session = FakeSession(existing_ids={event.id})
+
+        with pytest.raises(ApplicationError) as error:
+            asyncio.run(SqlAlchemyInvoiceRepository(session).update(event))
+
+        assert error.value.code == "ResourceAlreadyExistsError"
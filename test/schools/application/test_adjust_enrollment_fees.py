@@ -0,0 +1,99 @@
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from src.school.application.services import adjust_enrollment_fees
+from src.school.application.services.adjust_enrollment_fees import (
+    AdjustEnrollmentFees,
+    Request,
+)
+from src.school.domain.enrollment import FeeAdjustment, FeeAdjustmentKind
+from src.school.domain.model import School
+from src.shared.contact.model import Contact
+from src.shared.errors.business import BusinessError
+from src.shared.job.executor import JobExecutor
+from src.shared.job.model import SuccessJobItem
+
+
+class FakeSchools:
+    def __init__(self, school: School):
+        self.school = school
+
+    async def get(self, query) -> School:
+        return self.school
+
+
+class FakeEnrollments:
+    def __init__(self, fees: dict[str, Decimal]):
+        self.fees = fees
+
+    async def adjust_fees(self, school_id, adjustment, after_id, limit) -> list[str]:
+        ids = sorted(id for id in self.fees if after_id is None or id > after_id)
+        chunk = ids[:limit]
+
+        for id in chunk:
+            self.fees[id] = adjustment.apply(self.fees[id])
+
+        return chunk
+
+
+class FakeJobs:
+    def __init__(self):
+        self.saved = []
+
+    async def save(self, result):
+        self.saved.append(result)
+
+
+def _school() -> School:
+    return School.of(
+        id="school-1",
+        name="School",
+        contact=Contact(id="c", email="e", phone="p", address="a"),
+        at=datetime.now(),
+    )
+
+
+class TestFeeAdjustment:
+    def test_apply_percentage_rounding_half_up(self):
+        adjustment = FeeAdjustment.of(FeeAdjustmentKind.PERCENTAGE, Decimal("10"))
+
+        assert adjustment.apply(Decimal("100.05")) == Decimal("110.06")
+
+    def test_apply_absolute_never_below_zero(self):
+        adjustment = FeeAdjustment.of(FeeAdjustmentKind.ABSOLUTE, Decimal("-50"))
+
+        assert adjustment.apply(Decimal("20")) == Decimal("0.00")
+
+    def test_reject_percentage_wiping_the_fee(self):
+        with pytest.raises(BusinessError):
+            FeeAdjustment.of(FeeAdjustmentKind.PERCENTAGE, Decimal("-100"))
+
+
+class TestAdjustEnrollmentFees:
+    def test_adjust_every_enrollment_one_chunk_at_a_time(self, monkeypatch):
+        monkeypatch.setattr(adjust_enrollment_fees, "ENROLLMENTS_CHUNK_SIZE", 2)
+        enrollments = FakeEnrollments({f"e{i}": Decimal("100") for i in range(5)})
+        jobs = FakeJobs()
+        service = AdjustEnrollmentFees(
+            schools=FakeSchools(_school()),
+            enrollments=enrollments,
+            job_executor=JobExecutor(jobs=jobs),
+        )
+
+        result = asyncio.run(
+            service.execute(
+                Request(
+                    school_id="school-1",
+                    kind=FeeAdjustmentKind.ABSOLUTE,
+                    value=Decimal("5"),
+                )
+            )
+        )
+
+        assert set(enrollments.fees.values()) == {Decimal("105.00")}
+        assert result.succeed_items == 3
+        assert all(isinstance(item, SuccessJobItem) for item in result.items)
+        assert jobs.saved == [result]
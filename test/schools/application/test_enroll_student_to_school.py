@@ -0,0 +1,134 @@
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from src.school.application.use_cases.enroll_student_to_school import (
+    EnrollStudentToSchool,
+    Request,
+)
+from src.school.domain.model import School
+from src.shared.contact.model import Contact
+from src.shared.errors.application import ApplicationError, NotFoundError
+from src.student.domain.model import Identity, IdentityKind, Student
+
+LOOKUP_DELAY = 0.01
+
+CONTACT = Contact(id="c", email="e", phone="p", address="a")
+
+
+class Lookups:
+    """Counts the lookups running at the same time"""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.peak = 0
+
+    async def wait(self) -> None:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+
+        try:
+            await asyncio.sleep(LOOKUP_DELAY)
+        finally:
+            self.in_flight -= 1
+
+
+class FakeSchools:
+    def __init__(self, school: School | None, lookups: Lookups | None = None):
+        self.school = school
+        self.lookups = lookups or Lookups()
+
+    async def get(self, query) -> School:
+        await self.lookups.wait()
+
+        if self.school is None:
+            raise NotFoundError(resource="School", attributes={"id": query.id})
+
+        return self.school
+
+
+class FakeStudents:
+    def __init__(self, student: Student, lookups: Lookups | None = None):
+        self.student = student
+        self.lookups = lookups or Lookups()
+
+    async def get(self, query) -> Student:
+        await self.lookups.wait()
+        return self.student
+
+
+class FakeEnrollments:
+    def __init__(self, exists: bool, lookups: Lookups | None = None):
+        self.existing = exists
+        self.lookups = lookups or Lookups()
+        self.saved = []
+
+    async def exists(self, school_id: str, student_id: str) -> bool:
+        await self.lookups.wait()
+        return self.existing
+
+    async def save(self, enrollment):
+        self.saved.append(enrollment)
+        return enrollment
+
+
+def a_school() -> School:
+    return School.of(id="school-1", name="School", contact=CONTACT, at=datetime.now())
+
+
+def a_student() -> Student:
+    return Student.of(
+        id="student-1",
+        first_name="Ana",
+        last_name="Diaz",
+        age=10,
+        contact=CONTACT,
+        identity=Identity(kind=IdentityKind.CURP, code="CURP1"),
+    )
+
+
+REQUEST = Request(
+    school_id="school-1", student_id="student-1", monthly_fee=Decimal("100")
+)
+
+
+class TestEnrollStudentToSchool:
+    def test_look_up_the_school_student_and_enrollment_concurrently(self):
+        lookups = Lookups()
+        enrollments = FakeEnrollments(exists=False, lookups=lookups)
+        use_case = EnrollStudentToSchool(
+            schools=FakeSchools(a_school(), lookups),
+            enrollments=enrollments,
+            students=FakeStudents(a_student(), lookups),
+        )
+
+        enrollment = asyncio.run(use_case.execute(REQUEST))
+
+        assert enrollments.saved == [enrollment]
+        assert lookups.peak == 3
+
+    def test_report_an_existing_enrollment_before_a_missing_school(self):
+        use_case = EnrollStudentToSchool(
+            schools=FakeSchools(None),
+            enrollments=FakeEnrollments(exists=True),
+            students=FakeStudents(a_student()),
+        )
+
+        with pytest.raises(ApplicationError) as error:
+            asyncio.run(use_case.execute(REQUEST))
+
+        assert error.value.code == "ResourceAlreadyExistsError"
+
+    def test_raise_the_lookup_error(self):
+        use_case = EnrollStudentToSchool(
+            schools=FakeSchools(None),
+            enrollments=FakeEnrollments(exists=False),
+            students=FakeStudents(a_student()),
+        )
+
+        with pytest.raises(ApplicationError) as error:
+            asyncio.run(use_case.execute(REQUEST))
+
+        assert error.value.code == "ResourceNotFoundError"
@@ -0,0 +1,90 @@
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+
+from src.school.application.use_cases.enroll_students_to_school import (
+    EnrollStudentsToSchool,
+    Request,
+    StudentEnrollment,
+)
+from src.school.domain.model import School
+from src.shared.contact.model import Contact
+from src.student.domain.model import StudentStatus
+
+
+class FakeSchools:
+    def __init__(self, school: School):
+        self.school = school
+
+    async def get(self, query) -> School:
+        return self.school
+
+
+class FakeStudents:
+    def __init__(self, statuses: dict[str, StudentStatus]):
+        self.statuses = statuses
+        self.calls = 0
+
+    async def find_statuses(self, ids: list[str]) -> dict[str, StudentStatus]:
+        self.calls += 1
+        return {id: status for id, status in self.statuses.items() if id in ids}
+
+
+class FakeEnrollments:
+    def __init__(self, existing_ids: set[str]):
+        self.existing_ids = existing_ids
+        self.inserted = []
+
+    async def insert_many(self, enrollments) -> set[str]:
+        self.inserted.extend(enrollments)
+        return {e.id for e in enrollments if e.id not in self.existing_ids}
+
+
+class TestEnrollStudentsToSchool:
+    def test_report_a_result_per_student(self):
+        school = School.of(
+            id="school-1",
+            name="School",
+            contact=Contact(id="c", email="e", phone="p", address="a"),
+            at=datetime.now(),
+        )
+        students = FakeStudents(
+            {
+                "active": StudentStatus.ACTIVE,
+                "already-enrolled": StudentStatus.ACTIVE,
+                "inactive": StudentStatus.INACTIVE,
+            }
+        )
+        enrollments = FakeEnrollments(
+            existing_ids={"school:school-1/student:already-enrolled"}
+        )
+        use_case = EnrollStudentsToSchool(
+            schools=FakeSchools(school), enrollments=enrollments, students=students
+        )
+
+        request = Request(
+            school_id="school-1",
+            enrollments=[
+                StudentEnrollment(student_id=student_id, monthly_fee=Decimal("100"))
+                for student_id in [
+                    "active",
+                    "already-enrolled",
+                    "inactive",
+                    "missing",
+                    "active",
+                ]
+            ],
+        )
+
+        results = asyncio.run(use_case.execute(request))
+
+        assert [(result.student_id, result.code) for result in results] == [
+            ("active", None),
+            ("already-enrolled", "ResourceAlreadyExistsError"),
+            ("inactive", "InvalidEnrollmentError"),
+            ("missing", "ResourceNotFoundError"),
+            ("active", "ResourceAlreadyExistsError"),
+        ]
+        assert results[0].enrollment.id == "school:school-1/student:active"
+        assert students.calls == 1
+        assert len(enrollments.inserted) == 2
@@ -0,0 +1,107 @@
+import asyncio
+from datetime import date, datetime
+from decimal import Decimal
+
+from src.invoice.application.use_cases.create_invoice import CreateInvoice
+from src.invoice.domain.model import Invoice
+from src.invoice.domain.repository import InvoiceCreationCheck
+from src.school.application.services.generate_invoices import (
+    GenerateInvoices,
+    Request,
+)
+from src.school.domain.enrollment import ActiveEnrollmentProjection
+from src.school.domain.model import School, SchoolStatus
+from src.shared.contact.model import Contact
+from src.shared.job.executor import JobExecutor
+from src.shared.job.model import FailureJobItem, SuccessJobItem
+from src.student.domain.model import StudentStatus
+
+PERIOD = date(2025, 3, 1)
+
+
+class FakeSchools:
+    async def get(self, query) -> School:
+        return School.of(
+            id="school-1",
+            name="School",
+            contact=Contact(id="c", email="e", phone="p", address="a"),
+            at=datetime.now(),
+        )
+
+
+class FakeEnrollments:
+    def __init__(self, student_ids: list[str]):
+        self.student_ids = student_ids
+
+    async def list_active(self, query, page):
+        return None, [
+            ActiveEnrollmentProjection(
+                id=f"enrollment-{student_id}",
+                student_id=student_id,
+                school_id="school-1",
+                monthly_fee=Decimal("100"),
+            )
+            for student_id in self.student_ids
+        ]
+
+
+class FakeInvoices:
+    """Invoices created concurrently with the run show up only on insert"""
+
+    def __init__(self, created_meanwhile: set[str]):
+        self.existing_ids = created_meanwhile
+        self.persisted = []
+
+    async def check_creation(self, invoice_id, school_id, student_id):
+        return InvoiceCreationCheck(
+            invoice_exists=False,
+            school_status=SchoolStatus.ACTIVE,
+            student_status=StudentStatus.ACTIVE,
+        )
+
+    async def update_many(self, events) -> set[str]:
+        existing_ids = {event.id for event in events} & self.existing_ids
+        self.persisted.extend(
+            event.id for event in events if event.id not in existing_ids
+        )
+
+        return existing_ids
+
+
+class FakeJobs:
+    def __init__(self):
+        self.saved = []
+
+    async def save(self, result):
+        self.saved.append(result)
+
+
+def invoice_id(student_id: str) -> str:
+    return Invoice.build_id(
+        school_id="school-1", student_id=student_id, due_date=PERIOD
+    )
+
+
+class TestGenerateInvoices:
+    def test_keep_the_page_when_some_invoices_already_exist(self):
+        invoices = FakeInvoices(created_meanwhile={invoice_id("student-2")})
+        jobs = FakeJobs()
+        service = GenerateInvoices(
+            schools=FakeSchools(),
+            enrollments=FakeEnrollments(["student-1", "student-2", "student-3"]),
+            invoices=invoices,
+            create_invoice=CreateInvoice(invoices=invoices),
+            job_executor=JobExecutor(jobs=jobs),
+        )
+
+        asyncio.run(service.execute(Request(school_id="school-1", period=PERIOD)))
+
+        items = jobs.saved[0].items
+
+        assert invoices.persisted == [invoice_id("student-1"), invoice_id("student-3")]
+        assert [type(item) for item in items] == [
+            SuccessJobItem,
+            FailureJobItem,
+            SuccessJobItem,
+        ]
+        assert "ResourceAlreadyExistsError" in items[1].error
@@ -0,0 +1,68 @@
+import asyncio
+from datetime import date, datetime
+
+import pytest
+
+from src.school.application.services.generate_invoices import Request
+from src.school.application.services.schedule_invoices_generation import (
+    GENERATE_INVOICES_TOPIC,
+    ScheduleInvoicesGeneration,
+)
+from src.school.domain.model import School
+from src.shared.contact.model import Contact
+from src.shared.errors.business import BusinessError
+
+
+class FakeSchools:
+    def __init__(self, school: School):
+        self.school = school
+
+    async def get(self, query) -> School:
+        return self.school
+
+
+class FakePublisher:
+    def __init__(self):
+        self.published = []
+
+    async def publish(self, subscription: str, data: dict) -> None:
+        self.published.append((subscription, data))
+
+
+def _school() -> School:
+    return School.of(
+        id="school-1",
+        name="School",
+        contact=Contact(id="c", email="e", phone="p", address="a"),
+        at=datetime.now(),
+    )
+
+
+class TestScheduleInvoicesGeneration:
+    def test_publishes_the_request_for_the_worker(self):
+        publisher = FakePublisher()
+        service = ScheduleInvoicesGeneration(
+            schools=FakeSchools(_school()), publisher=publisher
+        )
+
+        asyncio.run(
+            service.execute(Request(school_id="school-1", period=date(2025, 3, 1)))
+        )
+
+        assert publisher.published == [
+            (GENERATE_INVOICES_TOPIC, {"school": "school-1", "period": "2025-03-01"})
+        ]
+
+    def test_inactive_school_is_rejected_before_publishing(self):
+        publisher = FakePublisher()
+        school = _school().deactivate()
+        service = ScheduleInvoicesGeneration(
+            schools=FakeSchools(school), publisher=publisher
+        )
+
+        with pytest.raises(BusinessError):
+            asyncio.run(
+                service.execute(Request(school_id="school-1", period=date(2025, 3, 1)))
+            )
+
+        assert publisher.published == []
@@ -0,0 +1,117 @@
+import asyncio
+from decimal import Decimal
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.school.domain.enrollment import Enrollment, FeeAdjustment, FeeAdjustmentKind
+from src.school.infrastructure.persistence.sqlalchemy.enrolment_repository import (
+    SqlAlchemyEnrollmentRepository,
+)
+from src.shared.errors.technical import TechnicalError
+
+# Most bind parameters asyncpg sends in one statement
+MAX_BIND_PARAMETERS = 32767
+
+
+class FakeResult:
+    def __init__(self, ids: list[str]):
+        self.ids = ids
+
+    def scalars(self):
+        return iter(self.ids)
+
+
+class FakeSession:
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.parameters = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    async def execute(self, statement):
+        if self.fail:
+            raise RuntimeError("connection lost")
+
+        compiled = statement.compile(dialect=postgresql.dialect())
+        self.parameters.append(len(compiled.params))
+
+        return FakeResult(
+            [
+                value
+                for name, value in compiled.params.items()
+                if name.startswith("id_m")
+            ]
+        )
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+
+class FakeAdjustSession:
+    def __init__(self, ordered_ids: list[str]):
+        self.ordered_ids = ordered_ids
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(str(statement.compile(dialect=postgresql.dialect())))
+
+        return FakeResult(self.ordered_ids)
+
+    async def commit(self):
+        pass
+
+
+def enrollments(size: int) -> list[Enrollment]:
+    return [
+        Enrollment.of(
+            student_id=f"student-{index}",
+            school_id="school-1",
+            monthly_fee=Decimal("100"),
+        )
+        for index in range(size)
+    ]
+
+
+class TestInsertMany:
+    def test_insert_a_large_batch_in_statements_asyncpg_accepts(self):
+        session = FakeSession()
+        repository = SqlAlchemyEnrollmentRepository(session)
+
+        inserted_ids = asyncio.run(repository.insert_many(enrollments(5000)))
+
+        assert len(inserted_ids) == 5000
+        assert len(session.parameters) == 2
+        assert max(session.parameters) <= MAX_BIND_PARAMETERS
+        assert session.commits == 1
+
+    def test_roll_back_a_failed_batch(self):
+        session = FakeSession(fail=True)
+        repository = SqlAlchemyEnrollmentRepository(session)
+
+        with pytest.raises(TechnicalError):
+            asyncio.run(repository.insert_many(enrollments(1)))
+
+        assert session.rollbacks == 1
+
+
+class TestAdjustFees:
+    def test_return_the_ids_in_the_order_postgres_sorted_them(self):
+        # The database collation puts "a" before "B", unlike Python
+        session = FakeAdjustSession(["a", "B"])
+        repository = SqlAlchemyEnrollmentRepository(session)
+
+        adjusted_ids = asyncio.run(
+            repository.adjust_fees(
+                school_id="school-1",
+                adjustment=FeeAdjustment.of(FeeAdjustmentKind.ABSOLUTE, Decimal("1")),
+                after_id=None,
+                limit=2,
+            )
+        )
+
+        assert adjusted_ids == ["a", "B"]
+        assert session.statements[0].endswith("ORDER BY adjusted.id")
@@ -0,0 +1,34 @@
+from sqlalchemy.dialects import postgresql
+
+from src.school.infrastructure.persistence.sqlalchemy.dbo import SchoolDbo
+from src.school.domain.model import School
+from src.shared.contact.model import Contact
+from src.shared.contact.persistence.sqlalchemy.contact_store import (
+    SqlAlchemyContactStore,
+)
+
+
+def upsert_sql() -> str:
+    school = School.of(
+        id="school-1",
+        name="School",
+        contact=Contact(id="c", email="e", phone="p", address="a"),
+    )
+    school_dbo = SchoolDbo.from_domain(school)
+    statement = SqlAlchemyContactStore.upsert_with_owner(
+        owner=SchoolDbo,
+        values=school_dbo.as_dict(),
+        update_values=school_dbo.as_for_update_dict(),
+        contact=school.contact,
+    )
+
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+class TestUpsertWithOwner:
+    def test_keep_the_stored_phone_on_an_email_conflict(self):
+        contact_conflict = upsert_sql().split("ON CONFLICT (email) DO UPDATE SET")[1]
+        contact_update = contact_conflict.split("RETURNING")[0]
+
+        assert "address = excluded.address" in contact_update
+        assert "phone" not in contact_update
@@ -0,0 +1,39 @@
+import asyncio
+
+from fastapi import FastAPI
+
+from src.shared.db import middleware
+from src.shared.db.middleware import QueryStatsMiddleware
+from src.shared.db.query_stats import SlowQuery, current_query_stats
+from src.shared.http.asgi_client import AsgiClient
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(QueryStatsMiddleware)
+
+    @app.get("/items")
+    async def get_items():
+        stats = current_query_stats()
+        stats.record(0.002)
+        stats.record(0.5)
+        stats.record_slow(SlowQuery(statement="SELECT 1", parameters=(), duration=0.5))
+        return []
+
+    return app
+
+
+class TestQueryStatsMiddleware:
+    def test_send_the_stats_header_in_debug_mode(self, monkeypatch):
+        monkeypatch.setattr(middleware, "DEBUG", True)
+
+        response = asyncio.run(AsgiClient(_app()).request("GET", "/items"))
+
+        assert response.headers["x-db-queries"] == "count=2; time_ms=502.00; slow=1"
+
+    def test_omit_the_stats_header_otherwise(self, monkeypatch):
+        monkeypatch.setattr(middleware, "DEBUG", False)
+
+        response = asyncio.run(AsgiClient(_app()).request("GET", "/items"))
+
+        assert "x-db-queries" not in response.headers
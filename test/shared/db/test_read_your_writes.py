@@ -0,0 +1,86 @@
+import asyncio
+import time
+
+from fastapi import Depends, FastAPI, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.shared.db import read_your_writes
+from src.shared.db.pg_sqlalchemy import connection
+from src.shared.db.read_your_writes import LAST_WRITE_COOKIE, ReadYourWritesMiddleware
+from src.shared.http.asgi_client import AsgiClient
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(ReadYourWritesMiddleware)
+
+    @app.post("/items")
+    async def create_item():
+        return {}
+
+    @app.post("/invalid-items")
+    async def create_invalid_item():
+        raise HTTPException(status_code=400)
+
+    @app.get("/items")
+    async def list_items(session: AsyncSession = Depends(connection.get_replica_db)):
+        return {"replica": session.bind is connection.get_replica_engine()}
+
+    return app
+
+
+class TestReadYourWrites:
+    def test_mark_the_client_after_a_write(self):
+        response = asyncio.run(AsgiClient(_app()).request("POST", "/items"))
+
+        assert response.headers["set-cookie"].startswith(f"{LAST_WRITE_COOKIE}=")
+        assert "Max-Age=5" in response.headers["set-cookie"]
+
+    def test_not_mark_the_client_after_a_failed_write(self):
+        response = asyncio.run(AsgiClient(_app()).request("POST", "/invalid-items"))
+
+        assert "set-cookie" not in response.headers
+
+    def test_not_mark_the_client_when_disabled(self, monkeypatch):
+        monkeypatch.setattr(read_your_writes, "READ_YOUR_WRITES_SECONDS", 0)
+
+        response = asyncio.run(AsgiClient(_app()).request("POST", "/items"))
+
+        assert "set-cookie" not in response.headers
+
+    def test_read_from_the_primary_within_the_window(self, monkeypatch):
+        monkeypatch.setenv("DB_PORT", "5432")
+        monkeypatch.setenv("DB_REPLICA_HOST", "replica")
+        app = _app()
+
+        try:
+            recent = asyncio.run(
+                AsgiClient(app).request(
+                    "GET",
+                    "/items",
+                    headers={"cookie": f"{LAST_WRITE_COOKIE}={time.time()}"},
+                )
+            )
+            expired = asyncio.run(
+                AsgiClient(app).request(
+                    "GET",
+                    "/items",
+                    headers={"cookie": f"{LAST_WRITE_COOKIE}={time.time() - 60}"},
+                )
+            )
+        finally:
+            asyncio.run(connection.dispose_engine())
+
+        assert recent.json() == {"replica": False}
+        assert expired.json() == {"replica": True}
+
+    def test_read_from_the_primary_without_a_replica(self, monkeypatch):
+        monkeypatch.setenv("DB_PORT", "5432")
+        monkeypatch.delenv("DB_REPLICA_HOST", raising=False)
+
+        try:
+            primary = connection.get_engine()
+
+            assert connection.get_replica_engine() is primary
+        finally:
+            asyncio.run(connection.dispose_engine())
@@ -0,0 +1,159 @@
+from datetime import date, datetime
+
+from sqlalchemy import create_engine, event, select, text
+from sqlalchemy.engine.default import CacheStats
+from sqlalchemy.orm import Session
+
+from src.invoice.infrastructure.persistence.sqlalchemy.dbo import (
+    InvoiceDbo,
+    PaymentDbo,
+)
+from src.invoice.infrastructure.persistence.sqlalchemy.repository import (
+    CHECK_INVOICE_CREATION,
+    FIND_INVOICE_BY_ID,
+    INVOICE_EXISTS_BY_ID,
+)
+from src.shared.db.pg_sqlalchemy.statements import update_by_id, update_statement
+
+# The invoices foreign keys need these tables in the metadata
+import src.school.infrastructure.persistence.sqlalchemy.dbo  # noqa: F401
+import src.student.infrastructure.persistence.sqlalchemy.dbo  # noqa: F401
+
+AT = datetime(2024, 1, 1)
+
+
+def _session_with_invoices(*ids: str) -> tuple[Session, list]:
+    """SQLite in memory, enough to run the statements and watch the compiled cache"""
+    engine = create_engine("sqlite://")
+    InvoiceDbo.metadata.create_all(
+        engine, tables=[InvoiceDbo.__table__, PaymentDbo.__table__]
+    )
+    executions = []
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(
+        connection, cursor, statement, parameters, context, executemany
+    ):
+        executions.append((statement, context.cache_hit))
+
+    session = Session(engine)
+
+    for id in ids:
+        session.add(
+            InvoiceDbo(
+                id=id,
+                student_id="student-1",
+                school_id="school-1",
+                initial_amount=10,
+                due_amount=10,
+                due_date=date(2024, 1, 1),
+                status="PENDING",
+                created_at=AT,
+                updated_at=AT,
+            )
+        )
+        session.add(
+            PaymentDbo(
+                id=f"payment-{id}",
+                invoice_id=id,
+                amount=10,
+                status="PENDING",
+                created_at=AT,
+                updated_at=AT,
+            )
+        )
+
+    session.commit()
+    executions.clear()
+
+    return session, executions
+
+
+class TestUpdateById:
+    def test_group_the_changes_by_the_columns_they_set(self):
+        changes = {
+            "invoice-1": {"status": "PAID", "updated_at": AT},
+            "invoice-2": {"updated_at": AT, "status": "CANCELED"},
+            "invoice-3": {"due_amount": 5, "updated_at": AT},
+        }
+
+        updates = list(update_by_id(InvoiceDbo, changes))
+
+        assert [(statement, len(parameters)) for statement, parameters in updates] == [
+            (update_statement(InvoiceDbo.__table__, ("status", "updated_at")), 2),
+            (update_statement(InvoiceDbo.__table__, ("due_amount", "updated_at")), 1),
+        ]
+        assert updates[0][1][1] == {
+            "b_id": "invoice-2",
+            "b_status": "CANCELED",
+            "b_updated_at": AT,
+        }
+
+    def test_run_as_executemany(self):
+        session, _ = _session_with_invoices("invoice-1", "invoice-2")
+
+        for statement, parameters in update_by_id(
+            InvoiceDbo,
+            {
+                "invoice-1": {"status": "PAID", "paid_at": AT},
+                "invoice-2": {"status": "PAID", "paid_at": AT},
+            },
+        ):
+            session.execute(statement, parameters)
+
+        assert session.execute(select(InvoiceDbo.status)).scalars().all() == [
+            "PAID",
+            "PAID",
+        ]
+
+
+class TestCachedStatements:
+    def test_reuse_the_compiled_statement_with_other_parameters(self):
+        session, executions = _session_with_invoices("invoice-1", "invoice-2")
+
+        first = session.execute(FIND_INVOICE_BY_ID, {"id": "invoice-1"}).scalar()
+        second = session.execute(FIND_INVOICE_BY_ID, {"id": "invoice-2"}).scalar()
+        exists = session.execute(INVOICE_EXISTS_BY_ID, {"id": "invoice-3"}).scalar()
+
+        assert (first.id, [payment.id for payment in first.payments]) == (
+            "invoice-1",
+            ["payment-invoice-1"],
+        )
+        assert (second.id, [payment.id for payment in second.payments]) == (
+            "invoice-2",
+            ["payment-invoice-2"],
+        )
+        assert not exists
+        # The invoice and its payments subquery load, twice, then the exists
+        assert [cache_hit for _, cache_hit in executions] == [
+            CacheStats.CACHE_MISS,
+            CacheStats.CACHE_MISS,
+            CacheStats.CACHE_HIT,
+            CacheStats.CACHE_HIT,
+            CacheStats.CACHE_MISS,
+        ]
+
+
+class TestCheckInvoiceCreation:
+    def test_one_row_with_the_invoice_existence_and_the_parties_statuses(self):
+        session, executions = _session_with_invoices("invoice-1")
+        session.execute(
+            text("CREATE TABLE schools (id VARCHAR PRIMARY KEY, status VARCHAR)")
+        )
+        session.execute(text("INSERT INTO schools VALUES ('school-1', 'ACTIVE')"))
+        session.execute(
+            text("CREATE TABLE students (id VARCHAR PRIMARY KEY, status VARCHAR)")
+        )
+        executions.clear()
+
+        row = session.execute(
+            CHECK_INVOICE_CREATION,
+            {
+                "invoice_id": "invoice-1",
+                "school_id": "school-1",
+                "student_id": "student-1",
+            },
+        ).one()
+
+        assert tuple(row) == (True, "ACTIVE", None)
+        assert len(executions) == 1
@@ -0,0 +1,118 @@
+import asyncio
+import gzip
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response
+
+from src.shared.http import compression
+from src.shared.http.asgi_client import AsgiClient
+from src.shared.http.compression import CompressionMiddleware, negotiate_encoding
+from src.shared.http.json_stream import JsonStreamResponse
+from src.shared.serialization.json_codec import dumps, loads
+
+ITEMS = [{"id": f"item-{index}", "name": "Item"} for index in range(1_000)]
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware)
+
+    @app.get("/items")
+    async def list_items(size: int = len(ITEMS)):
+        return {"items": ITEMS[:size]}
+
+    @app.get("/streamed-items")
+    async def stream_items(size: int = len(ITEMS)):
+        return JsonStreamResponse({"items": ITEMS[:size]})
+
+    @app.get("/encoded")
+    async def get_encoded():
+        return Response(
+            b"x" * 2048,
+            media_type="application/json",
+            headers={"content-encoding": "identity"},
+        )
+
+    @app.get("/image")
+    async def get_image():
+        return Response(b"x" * 2048, media_type="image/png")
+
+    @app.get("/text")
+    async def get_text():
+        return PlainTextResponse("x" * 2048)
+
+    return app
+
+
+def _get(path: str, accept_encoding: str = "gzip", params: dict | None = None):
+    return asyncio.run(
+        AsgiClient(_app()).request(
+            "GET", path, params=params, headers={"accept-encoding": accept_encoding}
+        )
+    )
+
+
+class TestNegotiateEncoding:
+    def test_prefer_the_encoding_with_the_highest_quality(self, monkeypatch):
+        monkeypatch.setattr(compression, "brotli", object())
+
+        assert negotiate_encoding("gzip, deflate, br") == "br"
+        assert negotiate_encoding("br;q=0.5, gzip") == "gzip"
+        assert negotiate_encoding("*") == "br"
+        assert negotiate_encoding("gzip;q=0, identity") is None
+        assert negotiate_encoding("") is None
+
+    def test_skip_brotli_when_it_is_not_installed(self, monkeypatch):
+        monkeypatch.setattr(compression, "brotli", None)
+
+        assert negotiate_encoding("br, gzip;q=0.1") == "gzip"
+        assert negotiate_encoding("br") is None
+
+    def test_offer_only_the_configured_encodings(self, monkeypatch):
+        monkeypatch.setattr(compression, "COMPRESSION_ENCODINGS", [])
+
+        assert negotiate_encoding("gzip") is None
+
+
+class TestCompressionMiddleware:
+    def test_compress_a_response_over_the_threshold(self):
+        response = _get("/items")
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert int(response.headers["content-length"]) == len(response.body)
+        assert loads(gzip.decompress(response.body)) == {"items": ITEMS}
+
+    def test_leave_a_response_under_the_threshold(self):
+        response = _get("/items", params={"size": 1})
+
+        assert "content-encoding" not in response.headers
+        assert response.json() == {"items": ITEMS[:1]}
+
+    def test_leave_a_client_that_does_not_accept_it(self):
+        response = _get("/items", accept_encoding="identity")
+
+        assert "content-encoding" not in response.headers
+        assert response.json() == {"items": ITEMS}
+
+    def test_compress_a_stream_chunk_by_chunk(self):
+        response = _get("/streamed-items")
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert gzip.decompress(response.body) == dumps({"items": ITEMS})
+
+    def test_leave_a_short_stream(self):
+        response = _get("/streamed-items", params={"size": 1})
+
+        assert "content-encoding" not in response.headers
+        assert response.body == dumps({"items": ITEMS[:1]})
+
+    def test_compress_text(self):
+        response = _get("/text")
+
+        assert gzip.decompress(response.body) == b"x" * 2048
+
+    def test_leave_encoded_and_binary_responses(self):
+        assert _get("/encoded").headers["content-encoding"] == "identity"
+        assert "content-encoding" not in _get("/image").headers
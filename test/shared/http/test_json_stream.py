@@ -0,0 +1,70 @@
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+
+from fastapi import FastAPI
+
+from src.invoice.domain.repository import PendingInvoiceReadProjection
+from src.shared.http import json_stream
+from src.shared.http.asgi_client import AsgiClient
+from src.shared.http.json_stream import JsonStreamResponse
+from src.shared.serialization.json_codec import dumps
+
+AT = datetime(2024, 5, 1, 10, 30, 15, 123456)
+
+
+def invoices(size: int) -> list[PendingInvoiceReadProjection]:
+    return [
+        PendingInvoiceReadProjection(
+            id=f"invoice-{index}",
+            student_id="student-1",
+            school_id="school-1",
+            base_amount=Decimal("100"),
+            due_amount=Decimal("90.50"),
+            created_at=AT,
+            updated_at=AT,
+        )
+        for index in range(size)
+    ]
+
+
+def _chunks(content: dict) -> tuple[list[bytes], dict]:
+    app = FastAPI()
+    sent = []
+
+    @app.get("/statement")
+    async def get_statement():
+        return JsonStreamResponse(content)
+
+    async def record(scope, receive, send):
+        async def record_send(message):
+            if message["type"] == "http.response.body" and message.get("body"):
+                sent.append(message["body"])
+
+            await send(message)
+
+        await app(scope, receive, record_send)
+
+    response = asyncio.run(AsgiClient(record).request("GET", "/statement"))
+
+    return sent, response.headers
+
+
+class TestJsonStreamResponse:
+    def test_send_the_lists_in_chunks_as_the_codec_renders_them(self, monkeypatch):
+        monkeypatch.setattr(json_stream, "STREAM_CHUNK_ITEMS", 2)
+        content = {"due_amount": Decimal("452.50"), "invoices": invoices(5)}
+
+        chunks, headers = _chunks(content)
+
+        assert len(chunks) == 3
+        assert b"".join(chunks) == dumps(content)
+        assert headers["content-type"] == "application/json"
+        assert "content-length" not in headers
+
+    def test_send_empty_lists_and_trailing_fields(self):
+        content = {"invoices": [], "next_cursor": None}
+
+        chunks, _ = _chunks(content)
+
+        assert chunks == [b'{"invoices":[],"next_cursor":null}']
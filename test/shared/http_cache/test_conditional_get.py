@@ -0,0 +1,124 @@
+import asyncio
+from datetime import datetime
+
+from fastapi import FastAPI, Request
+
+from src.shared.http.asgi_client import AsgiClient
+from src.shared.http_cache.conditional_get import conditional_get, etag_of, http_date
+from src.shared.http_cache.response_cache import CachedResponse, ResponseCache
+
+UPDATED_AT = datetime(2024, 5, 1, 10, 30, 15, 123456)
+
+
+class FakeResponseCache(ResponseCache):
+    def __init__(self):
+        self.responses: dict[tuple[str, str], CachedResponse] = {}
+
+    async def get(self, resource: str, id: str) -> CachedResponse | None:
+        return self.responses.get((resource, id))
+
+    async def set(self, resource: str, id: str, response: CachedResponse) -> None:
+        self.responses[(resource, id)] = response
+
+    async def invalidate(self, resource: str, ids: list[str]) -> None:
+        for id in ids:
+            self.responses.pop((resource, id), None)
+
+
+class FakeItems:
+    def __init__(self):
+        self.items = {"1": {"id": "1", "updated_at": UPDATED_AT}}
+        self.finds = 0
+        self.versions = 0
+
+    async def find(self, id: str) -> dict | None:
+        self.finds += 1
+        return self.items.get(id)
+
+    async def version(self, id: str) -> datetime | None:
+        self.versions += 1
+        return self.items[id]["updated_at"] if id in self.items else None
+
+
+def _app(items: FakeItems, cache: ResponseCache) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items/{id}")
+    async def get_item(id: str, request: Request):
+        return await conditional_get(
+            request,
+            cache,
+            resource="items",
+            id=id,
+            version=lambda: items.version(id),
+            find=lambda: items.find(id),
+            version_of=lambda item: item["updated_at"],
+        )
+
+    return app
+
+
+def _get(app: FastAPI, path: str, headers: dict | None = None):
+    return asyncio.run(AsgiClient(app).request("GET", path, headers=headers))
+
+
+class TestConditionalGet:
+    def test_send_the_validators_and_cache_the_response(self):
+        items, cache = FakeItems(), FakeResponseCache()
+        app = _app(items, cache)
+
+        first = _get(app, "/items/1")
+        second = _get(app, "/items/1")
+
+        assert first.status == 200
+        assert first.headers["etag"] == etag_of(UPDATED_AT)
+        assert first.headers["last-modified"] == "Wed, 01 May 2024 10:30:15 GMT"
+        assert first.headers["cache-control"] == "no-cache"
+        assert second.body == first.body
+        assert items.finds == 1
+
+    def test_answer_a_matching_etag_from_the_cache(self):
+        items, cache = FakeItems(), FakeResponseCache()
+        app = _app(items, cache)
+        etag = _get(app, "/items/1").headers["etag"]
+
+        response = _get(app, "/items/1", headers={"if-none-match": etag})
+
+        assert response.status == 304
+        assert response.body == b""
+        assert items.finds == 1
+        assert items.versions == 0
+
+    def test_answer_a_revalidation_from_the_version_on_a_cache_miss(self):
+        items = FakeItems()
+        app = _app(items, FakeResponseCache())
+
+        response = _get(
+            app, "/items/1", headers={"if-modified-since": http_date(UPDATED_AT)}
+        )
+
+        assert response.status == 304
+        assert response.headers["etag"] == etag_of(UPDATED_AT)
+        assert items.versions == 1
+        assert items.finds == 0
+
+    def test_send_the_resource_when_it_changed(self):
+        items, cache = FakeItems(), FakeResponseCache()
+        app = _app(items, cache)
+        etag = _get(app, "/items/1").headers["etag"]
+
+        items.items["1"]["updated_at"] = datetime(2024, 5, 2)
+        asyncio.run(cache.invalidate("items", ["1"]))
+        response = _get(app, "/items/1", headers={"if-none-match": etag})
+
+        assert response.status == 200
+        assert response.headers["etag"] == etag_of(datetime(2024, 5, 2))
+
+    def test_answer_null_for_a_missing_resource(self):
+        items, cache = FakeItems(), FakeResponseCache()
+
+        response = _get(_app(items, cache), "/items/2")
+
+        assert response.status == 200
+        assert response.json() is None
+        assert cache.responses == {}
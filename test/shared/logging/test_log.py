@@ -0,0 +1,77 @@
+import json
+import logging
+
+from src.shared.errors.technical import TechnicalError
+from src.shared.logging.log import (
+    JsonFormatter,
+    LogQueueHandler,
+    SamplingFilter,
+    parse_settings,
+)
+
+
+def _record(message, *args, name="src.module", level=logging.INFO, **extra):
+    record = logging.makeLogRecord(
+        {"name": name, "levelno": level, "levelname": logging.getLevelName(level)}
+    )
+    record.msg = message
+    record.args = args[0] if len(args) == 1 and isinstance(args[0], dict) else args
+    record.__dict__.update(extra)
+    return record
+
+
+def _as_json(record) -> dict:
+    prepared = LogQueueHandler(None).prepare(record)
+    return json.loads(JsonFormatter().format(prepared))
+
+
+class TestJsonFormatter:
+    def test_format_the_message_and_the_extra_fields(self):
+        entry = _as_json(_record("Created: id=%s", "1", duration_ms=2.5))
+
+        assert entry["message"] == "Created: id=1"
+        assert entry["logger"] == "src.module"
+        assert entry["level"] == "INFO"
+        assert entry["duration_ms"] == 2.5
+
+    def test_keep_the_attributes_and_errors_structured(self):
+        assert _as_json(_record("Invalid status", {"school_id": "1"}))[
+            "attributes"
+        ] == {"school_id": "1"}
+
+        error = TechnicalError(
+            code="RepositoryError",
+            message="Fail",
+            attributes={"id": "1"},
+            cause=ValueError("boom"),
+        )
+        entry = _as_json(_record(error, level=logging.ERROR))
+
+        assert entry["error"]["code"] == "RepositoryError"
+        assert entry["error"]["attributes"] == {"id": "1"}
+        assert entry["error"]["cause"] == "ValueError('boom')"
+
+
+class TestSamplingFilter:
+    def test_keep_one_of_every_n_info_records_of_the_configured_loggers(self):
+        sampling = SamplingFilter({"src.invoice": 3})
+
+        kept = [
+            sampling.filter(_record("Created %s", i, name="src.invoice.use_cases"))
+            for i in range(6)
+        ]
+
+        assert kept == [True, False, False, True, False, False]
+        assert sampling.filter(_record("Other", name="src.school"))
+        assert sampling.filter(
+            _record("Failed", name="src.invoice.use_cases", level=logging.ERROR)
+        )
+
+
+class TestParseSettings:
+    def test_parse_name_value_pairs(self):
+        assert parse_settings(" src.shared=WARNING, sqlalchemy.engine=INFO,bad") == {
+            "src.shared": "WARNING",
+            "sqlalchemy.engine": "INFO",
+        }
+        assert parse_settings(None) == {}
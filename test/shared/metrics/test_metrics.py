@@ -0,0 +1,111 @@
+import asyncio
+
+from fastapi import FastAPI
+
+from src.shared.db.middleware import QueryStatsMiddleware
+from src.shared.db.query_stats import current_query_stats
+from src.shared.http.asgi_client import AsgiClient
+from src.shared.metrics.middleware import MetricsMiddleware
+from src.shared.metrics.model import MetricsRegistry, metrics
+from src.shared.metrics.multiprocess import aggregated, write_snapshot
+from src.shared.metrics.prometheus import render
+
+
+class TestPrometheusRender:
+    def test_render_counters_and_cumulative_histograms(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("requests_total", "Requests", ("route",))
+        histogram = registry.histogram(
+            "latency_seconds", "Latency", ("route",), buckets=(0.1, 1.0)
+        )
+
+        counter.inc(route="/a")
+        counter.inc(2, route='/b"')
+        histogram.observe(0.05, route="/a")
+        histogram.observe(0.5, route="/a")
+        histogram.observe(5, route="/a")
+
+        assert render(registry).splitlines() == [
+            "# HELP requests_total Requests",
+            "# TYPE requests_total counter",
+            'requests_total{route="/a"} 1',
+            'requests_total{route="/b\\""} 2',
+            "# HELP latency_seconds Latency",
+            "# TYPE latency_seconds histogram",
+            'latency_seconds_bucket{route="/a",le="0.1"} 1',
+            'latency_seconds_bucket{route="/a",le="1"} 2',
+            'latency_seconds_bucket{route="/a",le="+Inf"} 3',
+            'latency_seconds_sum{route="/a"} 5.55',
+            'latency_seconds_count{route="/a"} 3',
+        ]
+
+    def test_return_the_registered_metric_for_a_known_name(self):
+        registry = MetricsRegistry()
+
+        assert registry.counter("a", "A") is registry.counter("a", "A")
+
+
+def _worker_registry(requests: int, latency: float) -> MetricsRegistry:
+    registry = MetricsRegistry()
+    registry.counter("requests_total", "Requests", ("route",)).inc(requests, route="/a")
+    registry.histogram(
+        "latency_seconds", "Latency", ("route",), buckets=(0.1, 1.0)
+    ).observe(latency, route="/a")
+
+    return registry
+
+
+class TestMultiprocessMetrics:
+    def test_sum_the_snapshots_of_the_other_workers(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("METRICS_DIR", str(tmp_path))
+        monkeypatch.setenv("WORKER_INDEX", "1")
+        write_snapshot(_worker_registry(requests=3, latency=0.5), tmp_path)
+        monkeypatch.setenv("WORKER_INDEX", "0")
+        write_snapshot(_worker_registry(requests=100, latency=5), tmp_path)
+
+        registry = asyncio.run(aggregated(_worker_registry(requests=2, latency=0.05)))
+
+        # The live registry of the worker stands for its own stale snapshot
+        assert render(registry).splitlines()[2:] == [
+            'requests_total{route="/a"} 5',
+            "# HELP latency_seconds Latency",
+            "# TYPE latency_seconds histogram",
+            'latency_seconds_bucket{route="/a",le="0.1"} 1',
+            'latency_seconds_bucket{route="/a",le="1"} 2',
+            'latency_seconds_bucket{route="/a",le="+Inf"} 2',
+            'latency_seconds_sum{route="/a"} 0.55',
+            'latency_seconds_count{route="/a"} 2',
+        ]
+
+    def test_expose_the_process_registry_without_a_directory(self, monkeypatch):
+        monkeypatch.delenv("METRICS_DIR", raising=False)
+        registry = MetricsRegistry()
+
+        assert asyncio.run(aggregated(registry)) is registry
+
+
+class TestMetricsMiddleware:
+    def test_label_requests_with_the_route_template(self):
+        app = FastAPI()
+        app.add_middleware(MetricsMiddleware)
+        app.add_middleware(QueryStatsMiddleware)
+
+        @app.get("/items/{id}")
+        async def get_item(id: str):
+            current_query_stats().record(0.01)
+            return {"id": id}
+
+        asyncio.run(AsgiClient(app).request("GET", "/items/1"))
+        asyncio.run(AsgiClient(app).request("GET", "/items/2"))
+
+        exposition = render(metrics)
+
+        assert (
+            'http_requests_total{method="GET",route="/items/{id}",status="200"} 2'
+            in exposition
+        )
+        assert (
+            'http_request_db_queries_bucket{method="GET",route="/items/{id}",le="1"} 2'
+            in exposition
+        )
+        assert "http_requests_in_flight 0" in exposition
@@ -0,0 +1,47 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+from src.shared.errors.application import ApplicationError
+from src.shared.pagination.cursor import decode_cursor, encode_cursor
+from src.shared.pagination.model import PageLimits, PageRequest
+
+
+class TestCursor:
+    def test_round_trip_multi_column_keys(self):
+        keys = (
+            datetime(2025, 1, 31, 10, 30, 15, 123),
+            date(2025, 1, 31),
+            Decimal("100.50"),
+            "01JJJ5J9DPBCESPYASGSY6FT3X",
+            42,
+        )
+
+        assert decode_cursor(encode_cursor(keys)) == keys
+
+    def test_is_url_safe(self):
+        cursor = encode_cursor(("school:1|student:2/period?",))
+
+        assert all(c.isalnum() or c in "-_" for c in cursor)
+
+    def test_fail_when_cursor_is_malformed(self):
+        with pytest.raises(ApplicationError) as exc:
+            decode_cursor("not a cursor")
+
+        assert str(exc.value.code) == "InvalidCursorError"
+
+
+class TestPageLimits:
+    def test_use_default_when_limit_is_missing(self):
+        limits = PageLimits(default=20, maximum=100)
+
+        assert limits.request(cursor="abc", limit=None) == PageRequest(
+            limit=20, cursor="abc"
+        )
+
+    def test_clamp_limit(self):
+        limits = PageLimits(default=20, maximum=100)
+
+        assert limits.request(cursor=None, limit=5000).limit == 100
+        assert limits.request(cursor=None, limit=0).limit == 1
+        assert limits.request(cursor=None, limit=50).limit == 50
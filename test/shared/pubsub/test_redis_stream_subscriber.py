@@ -0,0 +1,114 @@
+import asyncio
+
+from src.shared.lifecycle import stop_tasks
+from src.shared.pubsub.impl.redis_publisher import RedisPublisher
+from src.shared.pubsub.impl.redis_stream_subscriber import RedisStreamSubscriber
+from src.shared.serialization.json_codec import loads
+
+
+class FakeStreams:
+    def __init__(self, entries: list[str], pending: list[str] = ()):
+        self.entries = [
+            (f"{index}-0", {"data": data}) for index, data in enumerate(entries)
+        ]
+        self.pending = [
+            (f"{index}-1", {"data": data}) for index, data in enumerate(pending)
+        ]
+        self.groups = []
+        self.acked = []
+
+    async def xadd(self, name, fields, maxlen, approximate):
+        self.entries.append((f"{len(self.entries)}-0", fields))
+
+    async def xgroup_create(self, name, groupname, id, mkstream):
+        self.groups.append((name, groupname, id))
+
+    async def xautoclaim(self, name, groupname, consumername, min_idle_time, count):
+        claimed, self.pending = self.pending[:count], self.pending[count:]
+
+        return ["0-0", claimed, []]
+
+    async def xreadgroup(self, groupname, consumername, streams, count, block):
+        if not self.entries:
+            await asyncio.sleep(block / 1000)
+            return []
+
+        read, self.entries = self.entries[:count], self.entries[count:]
+
+        return [[next(iter(streams)), read]]
+
+    async def xack(self, name, groupname, *ids):
+        self.acked.extend(ids)
+
+
+def subscriber(streams: FakeStreams, concurrency: int = 1) -> RedisStreamSubscriber:
+    subscriber = RedisStreamSubscriber(concurrency=concurrency)
+    subscriber.connection = streams
+
+    return subscriber
+
+
+def consume(streams: FakeStreams, process, timeout: float = 1) -> None:
+    async def run():
+        task = asyncio.create_task(subscriber(streams).subscribe("stream", process))
+        await asyncio.sleep(0.05)
+
+        await stop_tasks([task], timeout=timeout)
+
+    asyncio.run(run())
+
+
+class TestRedisStreamSubscriber:
+    def test_process_the_messages_published_before_subscribing(self):
+        streams = FakeStreams([])
+        processed = []
+
+        async def process(data: str) -> None:
+            processed.append(loads(data)["school"])
+
+        publisher = RedisPublisher(durable=True)
+        publisher.connection = streams
+        asyncio.run(publisher.publish("stream", {"school": "school-1"}))
+
+        consume(streams, process)
+
+        assert processed == ["school-1"]
+        assert streams.groups == [("stream", "workers", "0")]
+        assert streams.acked == ["0-0"]
+
+    def test_take_over_the_messages_a_stopped_consumer_left(self):
+        streams = FakeStreams(["new"], pending=["left"])
+        processed = []
+
+        async def process(data: str) -> None:
+            processed.append(data)
+
+        consume(streams, process)
+
+        assert processed == ["left", "new"]
+        assert streams.acked == ["0-1", "0-0"]
+
+    def test_acknowledge_a_failing_message(self):
+        streams = FakeStreams(["bad", "good"])
+        processed = []
+
+        async def process(data: str) -> None:
+            if data == "bad":
+                raise ValueError("bad message")
+
+            processed.append(data)
+
+        consume(streams, process)
+
+        assert processed == ["good"]
+        assert streams.acked == ["0-0", "1-0"]
+
+    def test_leave_a_message_cut_off_by_the_shutdown_unacknowledged(self):
+        streams = FakeStreams(["slow"])
+
+        async def process(data: str) -> None:
+            await asyncio.sleep(10)
+
+        consume(streams, process, timeout=0.05)
+
+        assert streams.acked == []
@@ -0,0 +1,141 @@
+import asyncio
+
+from src.shared.lifecycle import stop_tasks
+from src.shared.pubsub.impl.redis_subscriber import RedisSubscriber
+
+
+class FakePubSub:
+    def __init__(self, messages: list[str]):
+        self.messages = messages
+
+    async def subscribe(self, channel: str) -> None:
+        self.channel = channel
+
+    async def listen(self):
+        for data in self.messages:
+            yield {"type": "message", "channel": self.channel, "data": data}
+
+        await asyncio.Event().wait()
+
+
+class FakeConnection:
+    def __init__(self, messages: list[str]):
+        self.messages = messages
+
+    def pubsub(self) -> FakePubSub:
+        return FakePubSub(self.messages)
+
+
+def subscriber(messages: list[str], concurrency: int = 1) -> RedisSubscriber:
+    subscriber = RedisSubscriber(concurrency=concurrency)
+    subscriber.connection = FakeConnection(messages)
+
+    return subscriber
+
+
+class TestRedisSubscriberConcurrency:
+    def test_processes_up_to_concurrency_messages_at_a_time(self):
+        running = []
+        peak = []
+
+        async def process(data: str) -> None:
+            running.append(data)
+            peak.append(len(running))
+            await asyncio.sleep(0.02)
+            running.remove(data)
+
+        async def run():
+            task = asyncio.create_task(
+                subscriber(["1", "2", "3", "4", "5"], concurrency=2).subscribe(
+                    "channel", process
+                )
+            )
+            await asyncio.sleep(0.2)
+
+            await stop_tasks([task], timeout=1)
+
+        asyncio.run(run())
+
+        assert len(peak) == 5
+        assert max(peak) == 2
+
+    def test_a_failing_message_does_not_stop_the_subscription(self):
+        processed = []
+
+        async def process(data: str) -> None:
+            if data == "bad":
+                raise ValueError("bad message")
+
+            processed.append(data)
+
+        async def run():
+            task = asyncio.create_task(
+                subscriber(["bad", "good"]).subscribe("channel", process)
+            )
+            await asyncio.sleep(0.05)
+
+            await stop_tasks([task], timeout=1)
+
+        asyncio.run(run())
+
+        assert processed == ["good"]
+
+
+class TestRedisSubscriberShutdown:
+    def test_stopping_finishes_the_message_in_hand(self):
+        processed = []
+
+        async def process(data: str) -> None:
+            await asyncio.sleep(0.05)
+            processed.append(data)
+
+        async def run():
+            task = asyncio.create_task(
+                subscriber(["first", "second"]).subscribe("channel", process)
+            )
+            await asyncio.sleep(0.01)
+
+            await stop_tasks([task], timeout=1)
+
+            return task
+
+        task = asyncio.run(run())
+
+        assert processed == ["first"]
+        assert task.cancelled()
+
+    def test_stopping_cuts_off_the_message_in_hand_after_the_timeout(self):
+        processed = []
+
+        async def process(data: str) -> None:
+            await asyncio.sleep(10)
+            processed.append(data)
+
+        async def run():
+            task = asyncio.create_task(
+                subscriber(["first"]).subscribe("channel", process)
+            )
+            await asyncio.sleep(0.01)
+
+            await stop_tasks([task], timeout=0.05)
+
+            return task
+
+        task = asyncio.run(run())
+
+        assert processed == []
+        assert task.done()
+
+    def test_stopping_an_idle_subscriber(self):
+        async def process(data: str) -> None:
+            pass
+
+        async def run():
+            task = asyncio.create_task(subscriber([]).subscribe("channel", process))
+            await asyncio.sleep(0.01)
+
+            await stop_tasks([task], timeout=1)
+
+            return task
+
+        assert asyncio.run(run()).cancelled()
@@ -0,0 +1,94 @@
+import asyncio
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+from fastapi import APIRouter, FastAPI
+from fastapi.encoders import jsonable_encoder
+
+from src.invoice.domain.model import Invoice
+from src.invoice.domain.repository import AccountStatement, PendingInvoiceReadProjection
+from src.shared.contact.model import Contact
+from src.shared.http.asgi_client import AsgiClient
+from src.shared.http.json_response import JsonRoute
+from src.shared.serialization.json_codec import dumps, loads
+from src.student.domain.model import Identity, IdentityKind, Student
+
+AT = datetime(2024, 5, 1, 10, 30, 15, 123456)
+
+
+def an_invoice() -> Invoice:
+    _, invoice = Invoice.of(
+        student_id="student-1",
+        school_id="school-1",
+        amount=Decimal("100.50"),
+        due_date=date(2024, 5, 31),
+        at=AT,
+    )
+    _, invoice = invoice.add_payment(
+        payment_id="payment-1", amount_to_pay=Decimal("10.00"), at=AT
+    )
+
+    return invoice
+
+
+def a_student() -> Student:
+    return Student.of(
+        id="student-1",
+        first_name="Ana",
+        last_name="Diaz",
+        age=10,
+        contact=Contact(id="c", email="e", phone="p", address="a"),
+        identity=Identity(kind=IdentityKind.CURP, code="CURP1"),
+        at=AT,
+    )
+
+
+def as_fastapi_did(value) -> bytes:
+    return json.dumps(jsonable_encoder(value), separators=(",", ":")).encode()
+
+
+class TestJsonCodec:
+    def test_encode_as_jsonable_encoder_does(self):
+        statement = AccountStatement.of(
+            [
+                PendingInvoiceReadProjection(
+                    id="invoice-1",
+                    student_id="student-1",
+                    school_id="school-1",
+                    base_amount=Decimal("100"),
+                    due_amount=Decimal("90.50"),
+                    created_at=AT,
+                    updated_at=AT,
+                )
+            ]
+        )
+
+        for value in [an_invoice(), a_student(), statement, {"page": [a_student()]}]:
+            assert dumps(value) == as_fastapi_did(value)
+
+    def test_decode_bytes_and_strings(self):
+        assert loads(b'{"id": "1"}') == loads('{"id": "1"}') == {"id": "1"}
+
+
+class TestJsonRoute:
+    def test_render_the_endpoint_result_with_the_route_status(self):
+        router = APIRouter(route_class=JsonRoute)
+
+        @router.post("/students", response_model=Student, status_code=201)
+        async def create_student(age: int):
+            student = a_student()
+            student.age = age
+            return student
+
+        app = FastAPI()
+        app.include_router(router)
+
+        response = asyncio.run(
+            AsgiClient(app).request("POST", "/students", params={"age": 12})
+        )
+
+        assert response.status == 201
+        assert response.headers["content-type"] == "application/json"
+        assert response.json()["age"] == 12
+        assert response.body == dumps({**jsonable_encoder(a_student()), "age": 12})
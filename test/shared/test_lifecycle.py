@@ -0,0 +1,42 @@
+import asyncio
+import time
+
+from src.shared import lifecycle
+from src.shared.lifecycle import begin_shutdown, shutdown_time_left, stop_tasks
+
+
+class TestShutdownBudget:
+    def test_share_one_budget_between_the_shutdown_phases(self, monkeypatch):
+        monkeypatch.setattr(lifecycle, "SHUTDOWN_TIMEOUT", 0.2)
+        monkeypatch.setattr(lifecycle, "_shutdown_deadline", None)
+
+        assert shutdown_time_left() == 0.2
+
+        begin_shutdown()
+        time.sleep(0.1)
+        begin_shutdown()
+
+        assert shutdown_time_left() <= 0.1
+
+    def test_cut_off_the_tasks_once_the_budget_is_spent(self, monkeypatch):
+        monkeypatch.setattr(lifecycle, "_shutdown_deadline", time.monotonic())
+
+        async def run():
+            async def work():
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    await asyncio.sleep(10)
+
+            task = asyncio.create_task(work())
+            await asyncio.sleep(0)
+
+            started = time.perf_counter()
+            await stop_tasks([task])
+
+            return time.perf_counter() - started, task
+
+        elapsed, task = asyncio.run(run())
+
+        assert task.cancelled()
+        assert elapsed < 1
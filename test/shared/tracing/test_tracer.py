@@ -0,0 +1,90 @@
+import asyncio
+import json
+
+import pytest
+
+from src.shared.tracing.exporters import as_json
+from src.shared.tracing.tracer import (
+    SpanContext,
+    SpanKind,
+    StatusCode,
+    tracer,
+    traced,
+)
+
+
+class ListExporter:
+    def __init__(self):
+        self.spans = []
+
+    def export(self, span):
+        self.spans.append(span)
+
+    def shutdown(self):
+        pass
+
+
+@pytest.fixture
+def exporter():
+    exporter = ListExporter()
+    tracer.exporter = exporter
+    yield exporter
+    tracer.exporter = None
+
+
+@traced
+class Registry:
+    async def save(self, fail: bool = False):
+        if fail:
+            raise ValueError("boom")
+
+    async def _private(self):
+        pass
+
+
+class TestTracer:
+    def test_nest_the_spans_of_traced_classes_in_the_current_span(self, exporter):
+        async def run():
+            with tracer.start_span("POST /items", kind=SpanKind.SERVER):
+                await Registry().save()
+
+        asyncio.run(run())
+
+        child, parent = exporter.spans
+
+        assert child.name == "Registry.save"
+        assert child.parent == parent.context
+        assert child.context.trace_id == parent.context.trace_id
+        assert parent.parent is None
+
+    def test_record_the_exception_of_a_failed_span(self, exporter):
+        with pytest.raises(ValueError):
+            asyncio.run(Registry().save(fail=True))
+
+        (span,) = exporter.spans
+
+        assert span.status == StatusCode.ERROR
+        assert span.attributes["exception.type"] == "ValueError"
+
+    def test_continue_a_trace_carried_in_a_message(self, exporter):
+        with tracer.start_span("publish", kind=SpanKind.PRODUCER):
+            message = json.loads(json.dumps(tracer.inject({"student": "1"})))
+
+        with tracer.start_span(
+            "process", kind=SpanKind.CONSUMER, parent=tracer.extract(message)
+        ):
+            pass
+
+        producer, consumer = exporter.spans
+
+        assert consumer.parent == producer.context
+        assert json.loads(as_json(consumer))["parent_id"] == (
+            f"0x{producer.context.span_id}"
+        )
+
+    def test_do_nothing_without_exporter(self):
+        with tracer.start_span("ignored") as span:
+            assert span is None
+
+        assert tracer.inject({}) == {}
+        assert SpanContext.from_traceparent("invalid") is None
@@ -0,0 +1,76 @@
+import asyncio
+
+from src.student.domain.model import IdentityKind
+from src.student.infrastructure.importing.rows import ImportFormat, read_batches
+
+HEADER = b"first_name,last_name,age,identity_kind,identity_code,email,phone,address\n"
+
+
+async def chunked(data: bytes, size: int = 7):
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+def collect(data: bytes, format: ImportFormat, batch_size: int = 1000) -> list:
+    async def run():
+        return [
+            batch async for batch in read_batches(chunked(data), format, batch_size)
+        ]
+
+    return asyncio.run(run())
+
+
+class TestReadCsvBatches:
+    def test_parse_quoted_fields_across_lines_and_chunks(self):
+        data = (
+            HEADER + b'Ana,Diaz,10,CURP,X1,ana@mail.com,+5215551234,"Street 1\nApt 2"\n'
+        )
+
+        [batch] = collect(data, ImportFormat.CSV)
+
+        assert batch.rejected == []
+        [(row, request)] = batch.rows
+        assert row == 1
+        assert request.identity.kind == IdentityKind.CURP
+        assert request.address == "Street 1\nApt 2"
+
+    def test_reject_invalid_rows_and_keep_valid_ones(self):
+        data = (
+            HEADER
+            + b"Ana,Diaz,10,CURP,X1,ana@mail.com,+5215551234,Street 1\n"
+            + b"Bob,,10,CURP,X2,not-an-email,+5215551235,Street 2\n"
+            + b"short,row\n"
+        )
+
+        [batch] = collect(data, ImportFormat.CSV)
+
+        assert [row for row, _ in batch.rows] == [1]
+        assert [(rejected.row, rejected.code) for rejected in batch.rejected] == [
+            (3, "MalformedRowError"),
+            (2, "InvalidRowError"),
+        ]
+
+    def test_split_rows_in_batches(self):
+        row = b"Ana,Diaz,10,CURP,X1,ana@mail.com,+5215551234,Street 1\n"
+
+        batches = collect(HEADER + row * 5, ImportFormat.CSV, batch_size=2)
+
+        assert [len(batch.rows) for batch in batches] == [2, 2, 1]
+
+
+class TestReadNdjsonBatches:
+    def test_reject_malformed_lines(self):
+        data = (
+            b'{"first_name": "Ana", "last_name": "Diaz", "age": 10, '
+            b'"identity_kind": "PASSPORT", "identity_code": "P1", '
+            b'"email": "ana@mail.com", "phone": "+5215551234", "address": "Street 1"}\n'
+            b"\n"
+            b"not json\n"
+        )
+
+        [batch] = collect(data, ImportFormat.NDJSON)
+
+        assert [row for row, _ in batch.rows] == [1]
+        assert [(rejected.row, rejected.code) for rejected in batch.rejected] == [
+            (2, "MalformedRowError")
+        ]